@@ -0,0 +1,232 @@
+# 시계 틱, 탈락 처리(좌석 밸런싱), 화면 갱신, 참가자 등록, 설정 화면 구성 비용과
+# 보통/저전력 모드에서 이벤트 루프가 분당 깨어나는 횟수를 재는 벤치마크입니다.
+# 창이 없는 리눅스에서도 돌 수 있도록 기본값으로 SDL offscreen 창과 mock GL을 씁니다.
+#
+#   python benchmarks/bench.py --levels 200 --entrants 1000 --output bench.json
+import argparse
+import contextlib
+import json
+import os
+import platform
+import random
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+
+BENCH_STARTED_AT = time.perf_counter()
+
+os.environ.setdefault('KIVY_NO_ARGS', '1')
+os.environ.setdefault('KIVY_NO_CONSOLELOG', '1')
+os.environ.setdefault('KIVY_WINDOW', 'sdl2')
+os.environ.setdefault('SDL_VIDEODRIVER', 'offscreen')
+os.environ.setdefault('KIVY_GL_BACKEND', 'mock')
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)
+
+
+def summarize(samples):
+    samples = sorted(samples)
+    n = len(samples)
+    return {
+        'count': n,
+        'mean_ms': statistics.fmean(samples) * 1000,
+        'p50_ms': samples[n // 2] * 1000,
+        'p99_ms': samples[min(n - 1, int(n * 0.99))] * 1000,
+        'max_ms': samples[-1] * 1000,
+    }
+
+
+def make_levels(count):
+    levels = []
+    big = 200
+    for i in range(count):
+        levels.append({'level': i + 1, 'small': big // 2, 'big': big, 'ante': big, 'duration': 900})
+        big = int(big * 1.2 / 100 + 1) * 100
+    return levels
+
+
+def make_structure_text(count):
+    return '\n'.join(f"{l['small']}/{l['big']}/{l['ante']}/15" for l in make_levels(count))
+
+
+def bench_engine(levels, ticks, field):
+    from tournament import Tournament, VirtualClock, build_schedule
+
+    results = {}
+
+    samples = []
+    for _ in range(20):
+        started = time.perf_counter()
+        schedule = build_schedule(make_levels(levels), set(range(5, levels, 5)), 420)
+        tournament = Tournament(VirtualClock())
+        tournament.setup(schedule)
+        samples.append(time.perf_counter() - started)
+    results['engine_setup'] = summarize(samples)
+
+    clock = VirtualClock()
+    tournament = Tournament(clock)
+    tournament.setup(build_schedule(make_levels(levels), set(range(5, levels, 5)), 420))
+    tournament.start()
+    samples = []
+    for _ in range(ticks):
+        clock.advance(1)
+        started = time.perf_counter()
+        tournament.tick()
+        tournament.time_to_next_break()
+        tournament.next_blinds()
+        samples.append(time.perf_counter() - started)
+    results['engine_tick'] = summarize(samples)
+
+    # 등록 순서와 상관없는 순서로 한 명이 남을 때까지 탈락시킵니다.
+    tournament = Tournament(VirtualClock())
+    tournament.register_batch([[f"Player {i}", 1, 40000] for i in range(field)])
+    order = list(range(field))
+    random.Random(field).shuffle(order)
+    samples = []
+    for index in order[:-1]:
+        started = time.perf_counter()
+        tournament.bust_player(index)
+        samples.append(time.perf_counter() - started)
+    results['engine_bust'] = summarize(samples)
+    return results
+
+
+def bench_app(levels, entrants, ticks):
+    # main이 Kivy Clock 종류를 정하므로 kivy.clock보다 먼저 불러옵니다.
+    import main
+    from kivy.clock import Clock
+
+    main.DEFAULT_BLIND_STRUCTURE = make_structure_text(levels)
+    data_dir = tempfile.mkdtemp(prefix='holdemtimer-bench-')
+
+    # 실제 user_data_dir을 쓰면 지난 저널과 구조 라이브러리를 불러오고 'Last played'를 덮어쓰므로
+    # 빈 임시 폴더에서 돌립니다.
+    class BenchApp(main.HoldemTimerApp):
+        @property
+        def user_data_dir(self):
+            return data_dir
+
+    app = BenchApp()
+    results = {}
+    frame_times = []
+
+    def measure(name, func, repeat=1):
+        samples = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            func()
+            samples.append(time.perf_counter() - started)
+        results[name] = summarize(samples)
+
+    def on_first_frame(dt):
+        results['startup_to_first_frame'] = {'ms': (time.perf_counter() - BENCH_STARTED_AT) * 1000}
+        results['startup_phases_ms'] = {name: seconds * 1000 for name, seconds in app.startup.phases.items()}
+
+        app.build_blind_settings_ui()
+        measure('setup_blinds', lambda: app.setup_blinds('5, 10, 15, 20, 25', '7'), 5)
+        measure('timer_screen_build', app.show_timer)
+
+        samples = []
+        for i in range(entrants):
+            started = time.perf_counter()
+            app.adjust_players(1)
+            samples.append(time.perf_counter() - started)
+        results['registration'] = summarize(samples)
+        results['registration_last_100'] = summarize(samples[-100:])
+
+        def tick_and_flush():
+            app.tournament.adjust_time(-1)
+            app.update(0)
+            app.flush_ui()
+        measure('tick_and_flush', tick_and_flush, ticks)
+
+        def full_flush():
+            app.update_ui()
+            app.flush_ui()
+        measure('full_flush', full_flush, ticks)
+
+        app.toggle_pause()
+        frame_event = Clock.schedule_interval(lambda dt: frame_times.append(dt), 0)
+        Clock.schedule_once(lambda dt: measure_power(frame_event), 3)
+
+    def measure_wakeups(name, seconds, then):
+        started = (time.perf_counter(), Clock.frames, app.power.draws)
+
+        def done(dt):
+            minutes = (time.perf_counter() - started[0]) / 60
+            results[name] = {
+                'wakeups_per_minute': (Clock.frames - started[1]) / minutes,
+                'redraws_per_minute': (app.power.draws - started[2]) / minutes,
+            }
+            then()
+        Clock.schedule_once(done, seconds)
+
+    def measure_power(frame_event):
+        # 시계가 흐르고 Entry 목록이 자동 스크롤되는 Timer 화면에서 잽니다.
+        frame_event.cancel()
+        app.power.wake()
+
+        def idle():
+            app.power.relax()
+            measure_wakeups('power_idle', 5, finish)
+        measure_wakeups('power_full', 3, idle)
+
+    def finish(dt=None):
+        # 설정 화면 재구성은 위젯을 대량으로 만들므로 프레임 측정이 끝난 뒤에 잽니다.
+        def build_settings():
+            app.blind_levels = []
+            app.build_blind_settings_ui()
+        measure('settings_grid_build', build_settings, 3)
+        app.stop()
+
+    Clock.schedule_once(on_first_frame, 0)
+    app.run()
+    shutil.rmtree(data_dir, ignore_errors=True)
+    results['frame_time'] = summarize(frame_times[1:] or [0])
+    return results
+
+
+def main_():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--levels', type=int, default=26)
+    parser.add_argument('--entrants', type=int, default=300)
+    parser.add_argument('--ticks', type=int, default=2000)
+    parser.add_argument('--field', type=int, default=5000, help='탈락 처리 측정에 쓸 참가자 수')
+    parser.add_argument('--output', default=None, help='JSON 결과를 저장할 경로 (기본: 표준 출력)')
+    parser.add_argument('--engine-only', action='store_true', help='Kivy 없이 엔진만 측정')
+    args = parser.parse_args()
+
+    # 앱이 print로 남기는 진단 메시지(시작 단계, 효과음 오류 등)는 표준 오류로 보내
+    # 표준 출력에는 JSON 결과만 나가게 합니다.
+    with contextlib.redirect_stdout(sys.stderr):
+        results = bench_engine(args.levels, args.ticks, args.field)
+        if not args.engine_only:
+            results.update(bench_app(args.levels, args.entrants, args.ticks))
+
+    report = {
+        'meta': {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'levels': args.levels,
+            'entrants': args.entrants,
+            'ticks': args.ticks,
+            'field': args.field,
+            'gl_backend': os.environ.get('KIVY_GL_BACKEND'),
+            'timestamp': time.time(),
+        },
+        'results': results,
+    }
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(text)
+    else:
+        print(text)
+
+
+if __name__ == '__main__':
+    main_()
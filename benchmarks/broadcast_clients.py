@@ -0,0 +1,121 @@
+# 방송 서버 하나에 표시 기기 여러 대를 localhost로 붙여 상태가 모두 같아지는지와 걸리는 시간,
+# 시계가 흐르는 동안 메시지가 오가지 않는지를 확인합니다. Kivy 없이 엔진만 씁니다.
+#
+#   python benchmarks/broadcast_clients.py --clients 200 --output broadcast.json
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from broadcast import BroadcastServer, DisplayClient
+from tournament import Tournament, build_schedule
+
+
+def make_schedule(count):
+    levels = [{'level': i + 1, 'small': 100 * (i + 1), 'big': 200 * (i + 1), 'ante': 200 * (i + 1), 'duration': 900}
+              for i in range(count)]
+    return build_schedule(levels, set(range(5, count, 5)), 420)
+
+
+def state_of(t):
+    return (t.current_index, t.is_paused, t.players, t.total_players, t.total_chips, t.buy_in,
+            list(t.entrants), t.schedule.to_list())
+
+
+def wait_until(condition, timeout):
+    started = time.perf_counter()
+    while not condition():
+        if time.perf_counter() - started > timeout:
+            return None
+        time.sleep(0.001)
+    return time.perf_counter() - started
+
+
+def main_():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--clients', type=int, default=100)
+    parser.add_argument('--players', type=int, default=200)
+    parser.add_argument('--idle', type=float, default=3, help='시계만 흐르게 두고 메시지 수를 셀 시간 (초)')
+    parser.add_argument('--output', default=None, help='JSON 결과를 저장할 경로 (기본: 표준 출력)')
+    args = parser.parse_args()
+    results = {}
+
+    server_tournament = Tournament()
+    server_tournament.setup(make_schedule(26))
+    server = BroadcastServer('127.0.0.1', 0)
+    server.follow(server_tournament)
+
+    mirrors = [Tournament() for _ in range(args.clients)]
+    clients = [DisplayClient(mirror, '127.0.0.1', server.port) for mirror in mirrors]
+    started = time.perf_counter()
+    for client in clients:
+        client.start()
+
+    def converged():
+        expected = state_of(server_tournament)
+        return all(state_of(mirror) == expected for mirror in mirrors)
+
+    wait_until(lambda: all(c.messages_received for c in clients), 30)
+    results['connect_all_ms'] = (time.perf_counter() - started) * 1000
+
+    # 서버에서 일어나는 일련의 조작이 모든 기기에 반영될 때까지의 시간
+    steps = [
+        ('start', lambda t: t.start()),
+        ('register', lambda t: [t.add_player() for _ in range(args.players)]),
+        ('add_chips', lambda t: t.add_chips(50000)),
+        ('next_level', lambda t: t.next_level()),
+        ('adjust_time', lambda t: t.adjust_time(-30)),
+        ('rename_entrant', lambda t: t.rename_entrant(0, 'Winner')),
+        ('remove_entrant', lambda t: t.remove_entrant(1)),
+        ('pause', lambda t: t.pause()),
+        ('resume', lambda t: t.start()),
+        ('heads_up', lambda t: t.set_heads_up()),
+    ]
+    for name, step in steps:
+        step(server_tournament)
+        elapsed = wait_until(converged, 30)
+        results[f"converge_{name}_ms"] = elapsed * 1000 if elapsed is not None else None
+
+    # 시계가 흐르는 동안에는 기준값이 바뀌지 않으므로 메시지를 보내지 않아야 합니다.
+    before = server.messages_sent
+    deadline = time.perf_counter() + args.idle
+    while time.perf_counter() < deadline:
+        server_tournament.tick()
+        time.sleep(0.05)
+    results['idle_messages'] = server.messages_sent - before
+
+    now_remaining = server_tournament.level_remaining()
+    results['max_clock_error_ms'] = max(abs(m.level_remaining() - now_remaining) for m in mirrors) * 1000
+    results['messages_per_client'] = server.messages_sent / args.clients
+    results['bytes_per_client'] = server.bytes_sent / args.clients
+    results['all_converged'] = converged()
+
+    for client in clients:
+        client.stop()
+    server.close()
+
+    report = {
+        'meta': {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'clients': args.clients,
+            'players': args.players,
+            'timestamp': time.time(),
+        },
+        'results': results,
+    }
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(text)
+    else:
+        print(text)
+
+
+if __name__ == '__main__':
+    main_()
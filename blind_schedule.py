@@ -0,0 +1,143 @@
+# 블라인드 스케줄(레벨/브레이크 목록)을 항목마다 dict로 두지 않고 같은 길이의 정수 배열들과
+# 브레이크 플래그(bytearray)로 보관합니다. 틱 경로의 조회는 배열 인덱싱만으로 끝나고,
+# 누적 시간과 다음 브레이크/다음 레벨 위치는 미리 계산해 두어 매 틱마다 훑지 않습니다.
+# 저널/스냅샷과 화면에는 기존과 같은 dict 형식(item, to_list)으로 내보냅니다.
+from array import array
+
+BREAK_LEVEL = 'Break'
+
+
+class Schedule:
+
+    def __init__(self, items=()):
+        self.levels = array('q')
+        self.smalls = array('q')
+        self.bigs = array('q')
+        self.antes = array('q')
+        self.durations = array('q')
+        self.breaks = bytearray()
+        for item in items:
+            is_break = bool(item.get('is_break'))
+            self.breaks.append(is_break)
+            self.levels.append(0 if is_break else item.get('level', 1))
+            self.smalls.append(item.get('small', 0))
+            self.bigs.append(item.get('big', 0))
+            self.antes.append(item.get('ante', 0))
+            self.durations.append(item.get('duration', 0))
+        self.size = len(self.breaks)
+        self._build_pointers()
+        self._build_tree()
+
+    def __len__(self):
+        return self.size
+
+    def __getitem__(self, index):
+        return self.item(index)
+
+    def item(self, index):
+        if self.breaks[index]:
+            return {'is_break': True, 'level': BREAK_LEVEL, 'duration': self.durations[index]}
+        return {'level': self.levels[index], 'small': self.smalls[index], 'big': self.bigs[index],
+                'ante': self.antes[index], 'duration': self.durations[index]}
+
+    def to_list(self):
+        return [self.item(i) for i in range(self.size)]
+
+    def _build_pointers(self):
+        n = self.size
+        # _next_break[i] / _next_playable[i]: i 이후 첫 브레이크 / 첫 일반 레벨의 위치 (없으면 n)
+        self._next_break = array('q', [n]) * n
+        self._next_playable = array('q', [n]) * n
+        next_break = n
+        next_playable = n
+        for i in range(n - 1, -1, -1):
+            self._next_break[i] = next_break
+            self._next_playable[i] = next_playable
+            if self.breaks[i]:
+                next_break = i
+            else:
+                next_playable = i
+
+        # _playable_before[i]: [0, i) 구간의 일반 레벨 수
+        self._playable_before = array('q', [0]) * (n + 1)
+        for i in range(n):
+            self._playable_before[i + 1] = self._playable_before[i] + (not self.breaks[i])
+
+    def _build_tree(self):
+        # 레벨 시간 변경이 O(log n)이 되도록 누적 시간은 Fenwick 트리로 관리합니다.
+        n = self.size
+        tree = array('q', [0]) + self.durations
+        for i in range(1, n + 1):
+            parent = i + (i & -i)
+            if parent <= n:
+                tree[parent] += tree[i]
+        self._tree = tree
+
+    def start_offset(self, index):
+        # index번째 항목이 시작되기 전까지의 누적 시간
+        total = 0
+        i = min(index, self.size)
+        while i > 0:
+            total += self._tree[i]
+            i -= i & -i
+        return total
+
+    def total_duration(self):
+        return self.start_offset(self.size)
+
+    def is_break(self, index):
+        return 0 <= index < self.size and self.breaks[index] == 1
+
+    def duration(self, index):
+        return self.durations[index]
+
+    def big_blind(self, index):
+        return self.bigs[index]
+
+    def next_playable(self, index):
+        if not 0 <= index < self.size or self._next_playable[index] == self.size:
+            return None
+        return self._next_playable[index]
+
+    def has_break_after(self, index):
+        return 0 <= index < self.size and self._next_break[index] < self.size
+
+    def levels_until_break(self, index):
+        # 현재 레벨을 포함해 다음 브레이크 전까지 남은 레벨 수
+        if not 0 <= index < self.size:
+            return 0
+        return self._playable_before[self._next_break[index]] - self._playable_before[index]
+
+    def time_to_next_break(self, index, level_time):
+        if not 0 <= index < self.size or self.breaks[index] or not self.has_break_after(index):
+            return 0
+        return level_time + self.start_offset(self._next_break[index]) - self.start_offset(index + 1)
+
+    def time_remaining(self, index, level_time):
+        # 현재 레벨의 남은 시간과 이후 모든 항목의 시간을 더한 토너먼트 종료까지의 시간
+        if not 0 <= index < self.size:
+            return 0
+        return level_time + self.total_duration() - self.start_offset(index + 1)
+
+    # 일괄 변경. 배열을 슬라이스 단위로 한 번에 바꾸고 트리는 한 번만 다시 만듭니다.
+
+    def set_duration(self, index, duration):
+        delta = duration - self.durations[index]
+        if not delta:
+            return
+        self.durations[index] = duration
+        i = index + 1
+        while i <= self.size:
+            self._tree[i] += delta
+            i += i & -i
+
+    def set_durations_from(self, index, duration):
+        # index 이후의 모든 일반 레벨 시간을 바꿉니다. 브레이크 시간은 그대로 둡니다.
+        self.durations[index:] = array('q', [
+            d if is_break else duration for d, is_break in zip(self.durations[index:], self.breaks[index:])])
+        self._build_tree()
+
+    def scale_durations(self, factor, index=0):
+        # index 이후 항목(브레이크 포함)의 시간을 factor배로 바꿉니다. 초 단위로 반올림합니다.
+        self.durations[index:] = array('q', [round(d * factor) for d in self.durations[index:]])
+        self._build_tree()
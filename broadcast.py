@@ -0,0 +1,315 @@
+# 한 기기(방송 서버)의 토너먼트 상태를 같은 네트워크의 표시 전용 기기들에 보냅니다.
+#
+# 메시지는 줄 단위 JSON이고 TCP로 보냅니다. 접속하면 전체 상태('snapshot')를 한 번 받고, 이후에는
+# 바뀐 것만('clock', 'stats', 'entrant(s)_*', 'players') 받습니다. 시계는 매초 보내지 않고 남은 시간/경과 시간의
+# 기준값만 보내며, 표시 기기는 받은 순간을 기준으로 자기 시계로 시간을 흘려 보냅니다.
+# 기준값은 일시정지/재개, 레벨 이동, 시간 조정처럼 레벨 종료 시각이 바뀔 때만 다시 보냅니다.
+#
+# 서버는 보낸 메시지들로 자기 쪽 사본(_state)을 갱신해 두었다가 새로 접속한 기기에 그대로 보내므로,
+# 스냅샷과 이후 메시지 사이에 빠지거나 두 번 적용되는 변경이 없습니다.
+import json
+import selectors
+import socket
+import threading
+import time
+
+BROADCAST_PORT = 8765
+MAX_CLIENT_BUFFER = 1 << 20
+RECONNECT_DELAY = 2
+STATS_FIELDS = ('players', 'total_players', 'total_chips', 'buy_in')
+
+
+def encode(message):
+    return (json.dumps(message, separators=(',', ':')) + '\n').encode('utf-8')
+
+
+class BroadcastServer:
+
+    def __init__(self, host='0.0.0.0', port=BROADCAST_PORT):
+        self.tournament = None
+        self.messages_sent = 0
+        self.bytes_sent = 0
+        self._state = None
+        self._anchor = None
+        self._anchor_key = None
+        self._clients = {}
+        self._lock = threading.Lock()
+        self._selector = selectors.DefaultSelector()
+        self._server = socket.create_server((host, port))
+        self._server.setblocking(False)
+        self.port = self._server.getsockname()[1]
+        self._wake_recv, self._wake_send = socket.socketpair()
+        self._wake_recv.setblocking(False)
+        self._wake_send.setblocking(False)
+        self._selector.register(self._server, selectors.EVENT_READ)
+        self._selector.register(self._wake_recv, selectors.EVENT_READ)
+        self._running = True
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    @property
+    def client_count(self):
+        return len(self._clients)
+
+    def follow(self, tournament):
+        # 방송할 토너먼트를 바꿉니다. 접속해 있는 기기들은 새 스냅샷을 받습니다.
+        if self.tournament is not None:
+            self.tournament.unbind(self.on_tournament_event)
+        self.tournament = tournament
+        tournament.bind(self.on_tournament_event)
+        self._publish_snapshot()
+
+    # 서버 쪽 사본 갱신 (UI 스레드)
+
+    def on_tournament_event(self, event, *args):
+        t = self.tournament
+        if event == 'schedule':
+            self._publish_snapshot()
+        elif event == 'clock':
+            key = (t.current_index, t.is_paused, t.next_deadline(), t.level_time if t.is_paused else None)
+            if key == self._anchor_key:
+                return
+            self._anchor_key = key
+            message = {'type': 'clock', 'index': t.current_index, 'is_paused': t.is_paused,
+                       'level_time': t.level_remaining(), 'total_time': t.total_elapsed()}
+            with self._lock:
+                self._state.update(current_index=t.current_index, is_paused=t.is_paused,
+                                   level_time=message['level_time'], total_time=message['total_time'])
+                self._anchor = self._clock_anchor()
+                self._send_all(encode(message))
+        elif event == 'stats':
+            message = {'type': 'stats'}
+            for key in STATS_FIELDS:
+                message[key] = getattr(t, key)
+            with self._lock:
+                self._state.update((key, message[key]) for key in STATS_FIELDS)
+                self._send_all(encode(message))
+        elif event == 'entrant_added':
+            record = t.registry.record(args[0])
+            with self._lock:
+                self._state['entrants'].insert(args[0], args[1])
+                self._registry_state(t)['records'].insert(args[0], record)
+                self._send_all(encode({'type': event, 'index': args[0], 'name': args[1], 'record': record}))
+        elif event == 'entrants_added':
+            records = [t.registry.record(i) for i in range(args[0], args[0] + len(args[1]))]
+            with self._lock:
+                self._state['entrants'][args[0]:args[0]] = args[1]
+                self._registry_state(t)['records'][args[0]:args[0]] = records
+                self._send_all(encode({'type': event, 'index': args[0], 'names': args[1], 'records': records}))
+        elif event == 'entrant_removed':
+            with self._lock:
+                del self._state['entrants'][args[0]]
+                del self._registry_state(t)['records'][args[0]]
+                self._send_all(encode({'type': event, 'index': args[0]}))
+        elif event == 'players_changed':
+            records = [[i, t.registry.record(i)] for i in args[0]]
+            with self._lock:
+                mirror = self._registry_state(t)['records']
+                for i, record in records:
+                    mirror[i] = record
+                self._send_all(encode({'type': 'players', 'records': records}))
+        elif event == 'entrant_renamed':
+            with self._lock:
+                self._state['entrants'][args[0]] = args[1]
+                self._send_all(encode({'type': event, 'index': args[0], 'name': args[1]}))
+
+    def _registry_state(self, t):
+        # self._lock 안에서 부릅니다. 표시 기기는 좌석을 추첨하지 않지만 스냅샷은 원본과 같게 둡니다.
+        state = self._state['registry']
+        state['draws'] = t.registry.draws
+        return state
+
+    def _clock_anchor(self):
+        # 진행 중이면 (레벨 종료 시각, 시작 시각)을 clock 기준으로 기억해 두고, 접속 시점에 다시 계산합니다.
+        t = self.tournament
+        if t.is_paused:
+            return None
+        now = t.clock()
+        return (t.next_deadline(), now - t.total_elapsed(), t.clock)
+
+    def _publish_snapshot(self):
+        t = self.tournament
+        state = t.snapshot()
+        self._anchor_key = (t.current_index, t.is_paused, t.next_deadline(), t.level_time if t.is_paused else None)
+        with self._lock:
+            self._state = state
+            self._anchor = self._clock_anchor()
+            self._send_all(self._snapshot_line())
+
+    def _snapshot_line(self):
+        state = self._state
+        if self._anchor is not None:
+            ends_at, started_at, clock = self._anchor
+            now = clock()
+            state = dict(state, level_time=ends_at - now, total_time=now - started_at)
+        return encode({'type': 'snapshot', 'state': state})
+
+    def _send_all(self, data):
+        # self._lock 안에서 부릅니다.
+        for buffer in self._clients.values():
+            buffer += data
+        if self._clients:
+            self.messages_sent += len(self._clients)
+            self._wake()
+
+    def _wake(self):
+        try:
+            self._wake_send.send(b'\0')
+        except BlockingIOError:
+            # 이미 깨울 신호가 쌓여 있음
+            pass
+
+    # 네트워크 스레드
+
+    def _run(self):
+        while self._running:
+            for key, mask in self._selector.select():
+                sock = key.fileobj
+                if sock is self._server:
+                    self._accept()
+                elif sock is self._wake_recv:
+                    try:
+                        sock.recv(4096)
+                    except BlockingIOError:
+                        pass
+                elif mask & selectors.EVENT_READ:
+                    # 표시 기기는 아무것도 보내지 않으므로 읽을 것이 있다는 것은 연결이 끊겼다는 뜻입니다.
+                    try:
+                        data = sock.recv(4096)
+                    except OSError:
+                        data = b''
+                    if not data:
+                        self._drop(sock)
+            self._flush()
+
+    def _accept(self):
+        try:
+            sock, _ = self._server.accept()
+        except BlockingIOError:
+            return
+        sock.setblocking(False)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self._selector.register(sock, selectors.EVENT_READ)
+        with self._lock:
+            self._clients[sock] = bytearray(self._snapshot_line() if self._state is not None else b'')
+            self.messages_sent += 1
+
+    def _flush(self):
+        dropped = []
+        with self._lock:
+            for sock, buffer in self._clients.items():
+                if buffer:
+                    try:
+                        sent = sock.send(buffer)
+                    except BlockingIOError:
+                        sent = 0
+                    except OSError:
+                        dropped.append(sock)
+                        continue
+                    del buffer[:sent]
+                    self.bytes_sent += sent
+                    if len(buffer) > MAX_CLIENT_BUFFER:
+                        dropped.append(sock)
+                        continue
+                # 다 보내지 못한 기기가 있으면 보낼 수 있게 됐을 때 다시 깨어납니다.
+                events = selectors.EVENT_READ | (selectors.EVENT_WRITE if buffer else 0)
+                if self._selector.get_key(sock).events != events:
+                    self._selector.modify(sock, events)
+        for sock in dropped:
+            self._drop(sock)
+
+    def _drop(self, sock):
+        with self._lock:
+            self._clients.pop(sock, None)
+        try:
+            self._selector.unregister(sock)
+        except KeyError:
+            pass
+        sock.close()
+
+    def close(self):
+        self._running = False
+        self._wake()
+        self._thread.join(1)
+        for sock in list(self._clients):
+            self._drop(sock)
+        self._selector.close()
+        self._server.close()
+
+
+def apply_message(tournament, message):
+    # 표시 기기 쪽에서 받은 메시지를 로컬 토너먼트에 반영합니다. 명령(@command)이 아니므로 저널에 남지 않습니다.
+    kind = message['type']
+    if kind == 'snapshot':
+        tournament.restore(message['state'])
+    elif kind == 'clock':
+        tournament.set_anchor(message['index'], message['level_time'], message['total_time'], message['is_paused'])
+    elif kind == 'stats':
+        for key in STATS_FIELDS:
+            setattr(tournament, key, message[key])
+        tournament.notify('stats')
+    elif kind == 'entrant_added':
+        tournament.entrants.insert(message['index'], message['name'])
+        tournament.registry.insert_record(message['index'], message['record'])
+        tournament.notify(kind, message['index'], message['name'])
+    elif kind == 'entrants_added':
+        index = message['index']
+        tournament.entrants[index:index] = message['names']
+        tournament.registry.insert_records(index, message['records'])
+        tournament.notify(kind, index, message['names'])
+    elif kind == 'entrant_removed':
+        del tournament.entrants[message['index']]
+        tournament.registry.delete(message['index'])
+        tournament.notify(kind, message['index'])
+    elif kind == 'players':
+        tournament.registry.set_records(message['records'])
+        tournament.notify('players_changed', [index for index, record in message['records']])
+    elif kind == 'entrant_renamed':
+        tournament.entrants[message['index']] = message['name']
+        tournament.notify(kind, message['index'], message['name'])
+
+
+class DisplayClient:
+    # 서버에 접속해 받은 메시지를 dispatch(apply_message, tournament, message)로 넘깁니다.
+    # Kivy 앱에서는 dispatch가 UI 스레드로 옮겨 실행하고, 기본값은 수신 스레드에서 바로 실행합니다.
+
+    def __init__(self, tournament, host, port=BROADCAST_PORT, dispatch=None):
+        self.tournament = tournament
+        self.host = host
+        self.port = port
+        self.dispatch = dispatch or (lambda func, *args: func(*args))
+        self.messages_received = 0
+        self.connected = False
+        self._running = False
+        self._sock = None
+        self._thread = None
+
+    def start(self):
+        self._running = True
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        while self._running:
+            try:
+                self._sock = socket.create_connection((self.host, self.port))
+                self.connected = True
+                with self._sock.makefile('r', encoding='utf-8') as stream:
+                    for line in stream:
+                        self.messages_received += 1
+                        self.dispatch(apply_message, self.tournament, json.loads(line))
+            except (OSError, ValueError) as e:
+                if self._running:
+                    print(f"Broadcast connection to {self.host}:{self.port} lost: {e}")
+            self.connected = False
+            if self._running:
+                time.sleep(RECONNECT_DELAY)
+
+    def stop(self):
+        self._running = False
+        if self._sock is not None:
+            try:
+                self._sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+            self._sock.close()
@@ -23,6 +23,7 @@ source.include_exts = py,png,jpg,kv,atlas,mp3
 
 # (list) List of directory to exclude (let empty to not exclude anything)
 #source.exclude_dirs = tests, bin, venv
+source.exclude_dirs = benchmarks
 
 # (list) List of exclusions using pattern matching
 # Do not prefix with './'
@@ -37,7 +38,7 @@ version = 0.1
 
 # (list) Application requirements
 # comma separated e.g. requirements = sqlite3,kivy
-requirements = python3,kivy
+requirements = python3,kivy==2.3.1,numpy,sqlite3
 
 # Python version to use
 python.version = 3.9
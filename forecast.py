@@ -0,0 +1,170 @@
+# 남은 인원과 블라인드 압박(M-ratio)으로 토너먼트가 언제 끝날지 예측합니다.
+#
+# 인원 수를 시행(trial)마다 하나씩 두고 시간을 STEP_SECONDS 단위로 나눠 진행하면서,
+# 각 구간에서 한 사람이 탈락할 확률을 평균 스택의 M(= 평균 스택 / 한 바퀴 비용)으로 정해
+# 모든 시행을 NumPy 배열 연산으로 한꺼번에 뽑습니다. 브레이크 중에는 탈락이 없고,
+# 스케줄이 끝난 뒤에도 마지막 두 레벨의 비율로 블라인드가 계속 오른다고 봅니다.
+# 계산은 Forecaster의 백그라운드 스레드에서 하며 입력이 바뀌었을 때만 다시 돌립니다.
+# 종료 시각과 함께 상금권(입상 인원)과 파이널 테이블에 들어가는 시각, 레벨마다 끝날 때 남은 인원도 구합니다.
+import threading
+import time
+
+import numpy as np
+
+from payouts import paid_places
+
+TRIALS = 10000
+STEP_SECONDS = 300
+HORIZON_SECONDS = 24 * 3600
+# M이 1일 때 한 사람이 1분 안에 탈락할 확률에 해당하는 값. M이 클수록 그만큼 줄어듭니다.
+ELIMINATION_RATE = 0.07
+FINAL_TABLE_SIZE = 9
+BANDS = (10, 50, 90)
+# 스케줄에 레벨이 하나뿐이라 블라인드 상승률을 알 수 없을 때 쓰는 값
+DEFAULT_GROWTH = 1.25
+
+
+def forecast_key(tournament):
+    # 같은 레벨 안에서 시간만 흐른 경우에는 결과(실제 시각 기준)가 그대로이므로 다시 계산하지 않습니다.
+    # 레벨 종료 시각은 10초 단위로 비교해 시간 조정/일시정지 중에만 바뀌게 합니다.
+    i = tournament.current_index
+    ends_at = time.time() + tournament.level_remaining()
+    return (i, tournament.players, tournament.total_players, tournament.total_chips, round(ends_at / 10),
+            bytes(tournament.schedule.durations[i:]))
+
+
+def forecast_inputs(tournament):
+    # UI 스레드에서 현재 상태를 복사해 둡니다. 예측할 것이 없으면 None입니다.
+    schedule = tournament.schedule
+    i = tournament.current_index
+    if tournament.players < 2 or i >= len(schedule):
+        return None
+    bigs = [schedule.bigs[j] for j in range(len(schedule)) if not schedule.breaks[j]]
+    growth = bigs[-1] / bigs[-2] if len(bigs) > 1 and bigs[-2] > 0 else DEFAULT_GROWTH
+    return {
+        'requested_at': time.time(),
+        'start_index': i,
+        'level_remaining': max(0.0, tournament.level_remaining()),
+        'players': tournament.players,
+        'money': paid_places(tournament.total_players),
+        'total_chips': tournament.total_chips,
+        'durations': np.frombuffer(schedule.durations[i:], dtype=np.int64).astype(float),
+        'costs': (np.frombuffer(schedule.smalls[i:], dtype=np.int64)
+                  + np.frombuffer(schedule.bigs[i:], dtype=np.int64)
+                  + np.frombuffer(schedule.antes[i:], dtype=np.int64)).astype(float),
+        'breaks': np.frombuffer(bytes(schedule.breaks[i:]), dtype=np.uint8).astype(bool),
+        'growth': max(1.0, growth),
+    }
+
+
+def percentiles(values):
+    return tuple(float(v) for v in np.percentile(values, BANDS))
+
+
+def simulate(inputs, trials=TRIALS, rng=None):
+    # 반환값의 시간은 모두 요청 시점(requested_at)으로부터의 초입니다.
+    # milestones는 남은 인원 -> 그 인원 이하가 되는 시각의 밴드이고, 이미 지난 인원은 빠집니다.
+    rng = rng or np.random.default_rng()
+    milestones = (inputs['money'], FINAL_TABLE_SIZE)
+    durations = inputs['durations'].copy()
+    durations[0] = inputs['level_remaining']
+    costs = inputs['costs']
+    breaks = inputs['breaks']
+
+    # 레벨을 STEP_SECONDS 이하의 구간으로 나누고, 스케줄 뒤에는 가상의 레벨을 이어 붙입니다.
+    steps_per_level = np.maximum(1, np.ceil(durations / STEP_SECONDS)).astype(int)
+    step_len = np.repeat(durations / steps_per_level, steps_per_level)
+    step_cost = np.repeat(costs, steps_per_level)
+    step_break = np.repeat(breaks, steps_per_level)
+    level_last_step = np.cumsum(steps_per_level) - 1
+
+    playable = ~breaks
+    if playable.any():
+        last_duration = max(float(STEP_SECONDS), inputs['durations'][playable][-1])
+        extra_levels = int(max(0.0, HORIZON_SECONDS - durations.sum()) // last_duration)
+        if extra_levels:
+            per_level = int(np.ceil(last_duration / STEP_SECONDS))
+            extra_cost = costs[playable][-1] * inputs['growth'] ** np.arange(1, extra_levels + 1)
+            step_len = np.concatenate([step_len, np.full(extra_levels * per_level, last_duration / per_level)])
+            step_cost = np.concatenate([step_cost, np.repeat(extra_cost, per_level)])
+            step_break = np.concatenate([step_break, np.zeros(extra_levels * per_level, dtype=bool)])
+    step_ends = np.cumsum(step_len)
+
+    total_chips = float(inputs['total_chips'])
+    players = np.full(trials, inputs['players'], dtype=np.int64)
+    # history[k]: k번째 구간이 끝났을 때 시행별 남은 인원. 모든 시행이 끝나면 더 쌓지 않습니다.
+    history = []
+    for k in range(len(step_len)):
+        if not step_break[k] and step_cost[k] > 0:
+            m_ratio = np.maximum(1.0, total_chips / players / step_cost[k])
+            p = -np.expm1(-ELIMINATION_RATE / m_ratio * (step_len[k] / 60))
+            # 마지막 한 명은 남깁니다.
+            players -= rng.binomial(players - 1, p)
+        history.append(players.astype(np.int32))
+        if players.max() == 1:
+            break
+    history = np.stack(history)
+    horizon = step_ends[len(history) - 1]
+
+    def reached_at(count):
+        # 남은 인원이 처음으로 count 이하가 된 시각. 끝까지 가지 못한 시행은 horizon으로 둡니다.
+        below = history <= count
+        return np.where(below.any(axis=0), step_ends[below.argmax(axis=0)], horizon)
+
+    level_players = history[np.minimum(level_last_step, len(history) - 1)]
+    level_bands = np.percentile(level_players, BANDS, axis=1).T
+    return {
+        'requested_at': inputs['requested_at'],
+        'trials': trials,
+        'finish': percentiles(reached_at(1)),
+        'money': inputs['money'],
+        'milestones': {m: percentiles(reached_at(m)) for m in milestones if m < inputs['players']},
+        # (스케줄 위치, 레벨이 끝날 때 남은 인원의 하위/중앙/상위 밴드). 브레이크에는 탈락이 없으므로 뺍니다.
+        'levels': [(inputs['start_index'] + j, *map(float, bands))
+                   for j, bands in enumerate(level_bands) if not breaks[j]],
+    }
+
+
+class Forecaster:
+    # request()는 UI 스레드에서 부르고, 결과는 백그라운드 스레드에서 callback(result)으로 전달됩니다.
+    # 계산 중에 새 요청이 오면 끝난 결과는 버리고 가장 최근 요청만 다시 계산합니다.
+
+    def __init__(self, callback, trials=TRIALS):
+        self.callback = callback
+        self.trials = trials
+        self._condition = threading.Condition()
+        self._pending = None
+        self._thread = None
+        self._last_key = None
+
+    def request(self, tournament):
+        key = forecast_key(tournament)
+        if key == self._last_key:
+            return
+        self._last_key = key
+        inputs = forecast_inputs(tournament)
+        if inputs is None:
+            with self._condition:
+                self._pending = None
+            self.callback(None)
+            return
+        with self._condition:
+            self._pending = inputs
+            self._condition.notify()
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        rng = np.random.default_rng()
+        while True:
+            with self._condition:
+                while self._pending is None:
+                    self._condition.wait()
+                inputs = self._pending
+                self._pending = None
+            result = simulate(inputs, self.trials, rng)
+            with self._condition:
+                if self._pending is not None:
+                    continue
+            self.callback(result)
@@ -0,0 +1,179 @@
+# 토너먼트 조작을 되돌리고(undo) 다시 하는(redo) 기록입니다.
+#
+# 기록 하나에는 그 명령이 바꾼 것만 담습니다(바뀐 참가자 기록, 레벨 시간, 인원/칩, 레벨 길이).
+# 바뀌지 않은 상태는 따로 복사하지 않고 지금 토너먼트의 것을 그대로 쓰므로, 참가자가 수천 명이어도
+# 기록 하나는 보통 몇백 바이트이고 되돌리기/다시 하기도 바뀐 만큼만 적용합니다.
+# 무엇이 바뀌었는지는 Journal/BroadcastServer처럼 Tournament 이벤트로 알아내고, 바뀌기 전 값은
+# 참가자 목록의 사본(_names, _records)에서 꺼냅니다.
+#
+# 되돌리기는 Tournament.apply_changes 명령으로 적용되므로 저널에 그대로 남고 재생됩니다.
+# 기록 자체는 메모리에만 두며 앱을 다시 켜면 비어 있습니다.
+from collections import deque
+
+HISTORY_LIMIT = 5000
+# 되돌릴 대상이 아닌 명령 (시계 시작/정지, 되돌리기 자체) / 기록을 비우는 명령 (새 구조, 초기화)
+UNTRACKED_COMMANDS = {'start', 'pause', 'toggle_pause', 'apply_changes'}
+CLEARING_COMMANDS = {'reset', 'setup'}
+# 바로 앞 기록도 같은 명령이면 하나로 합치는 명령 (슬라이더를 한 번 끄는 동안 seek이 여러 번 옵니다).
+# 슬라이더를 놓거나(seal) 다른 명령이 실행되면 거기서 끊어, 따로 끈 두 번은 따로 되돌립니다.
+MERGED_COMMANDS = {'seek'}
+# 레벨 남은 시간이 시계 흐름과 이만큼(초) 넘게 어긋나면 명령이 시간을 바꾼 것으로 봅니다.
+LEVEL_EPSILON = 0.01
+
+
+class History:
+
+    def __init__(self, limit=HISTORY_LIMIT):
+        # 기록: (명령 이름, 다시 할 변경, 되돌릴 변경, 명령 전 레벨, 명령 후 레벨)
+        # 레벨은 (인덱스, 남은 시간, 그때의 경과 시간)이고 바뀌지 않았으면 None입니다.
+        self.undo_stack = deque(maxlen=limit)
+        self.redo_stack = []
+        self.tournament = None
+        self._applying = False
+        self._sealed = True
+
+    def attach(self, tournament):
+        self.tournament = tournament
+        tournament.bind(self.on_tournament_event)
+        self._reload()
+
+    def _reload(self):
+        t = self.tournament
+        self._names = list(t.entrants)
+        self._records = [t.registry.record(i) for i in range(len(t.entrants))]
+        self._durations = list(t.schedule.durations)
+        self._stats = self._read_stats()
+        self._level = self._read_level()
+        self._forward = []
+        self._backward = []
+
+    def clear(self):
+        self.undo_stack.clear()
+        self.redo_stack.clear()
+
+    def seal(self):
+        # 슬라이더를 놓으면 부릅니다. 다음 seek은 앞 기록과 합치지 않습니다.
+        self._sealed = True
+
+    def _read_stats(self):
+        t = self.tournament
+        return [t.players, t.total_players, t.total_chips, t.buy_in]
+
+    def _read_level(self):
+        t = self.tournament
+        return (t.current_index, t.level_remaining(), t.total_elapsed())
+
+    def _record(self, forward, backward):
+        if not self._applying:
+            self._forward.append(forward)
+            self._backward.insert(0, backward)
+
+    def on_tournament_event(self, event, *args):
+        t = self.tournament
+        if event in ('entrant_added', 'entrants_added'):
+            index = args[0]
+            names = [args[1]] if event == 'entrant_added' else list(args[1])
+            records = [t.registry.record(i) for i in range(index, index + len(names))]
+            self._names[index:index] = names
+            self._records[index:index] = records
+            self._record(['insert', index, names, records], ['delete', index, len(names)])
+        elif event == 'entrant_removed':
+            index = args[0]
+            name = self._names.pop(index)
+            record = self._records.pop(index)
+            self._record(['delete', index, 1], ['insert', index, [name], [record]])
+        elif event in ('entrant_renamed', 'players_changed'):
+            forward = []
+            backward = []
+            for index in dict.fromkeys([args[0]] if event == 'entrant_renamed' else args[0]):
+                name = t.entrants[index]
+                record = t.registry.record(index)
+                forward.append([index, name, record])
+                backward.append([index, self._names[index], self._records[index]])
+                self._names[index] = name
+                self._records[index] = record
+            self._record(['set', forward], ['set', backward])
+        elif event == 'schedule':
+            durations = list(t.schedule.durations)
+            if len(durations) == len(self._durations):
+                changed = [i for i, (old, new) in enumerate(zip(self._durations, durations)) if old != new]
+                if changed:
+                    self._record(['durations', [[i, durations[i]] for i in changed]],
+                                 ['durations', [[i, self._durations[i]] for i in changed]])
+            self._durations = durations
+        elif event in ('level', 'clock'):
+            # 명령 밖(틱)에서 레벨이 넘어가거나 시간이 흐른 것은 기록하지 않고 기준만 옮깁니다.
+            if not t.in_command:
+                self._level = self._read_level()
+        elif event == 'entrants_reset':
+            self.clear()
+            self._reload()
+        elif event == 'command':
+            self._finish(args[0])
+
+    def _finish(self, name):
+        forward, backward = self._forward, self._backward
+        self._forward = []
+        self._backward = []
+        if name not in MERGED_COMMANDS:
+            self._sealed = True
+        if name in CLEARING_COMMANDS:
+            self.clear()
+            self._reload()
+            return
+        stats = self._read_stats()
+        level = self._read_level()
+        if name not in UNTRACKED_COMMANDS:
+            if stats != self._stats:
+                forward.append(['stats'] + stats)
+                backward.append(['stats'] + self._stats)
+            before = after = None
+            index, remaining, elapsed = self._level
+            if level[0] != index or abs(level[1] - (remaining - (level[2] - elapsed))) > LEVEL_EPSILON:
+                before, after = self._level, level
+            if forward or before:
+                last = self.undo_stack[-1] if self.undo_stack else None
+                if not self._sealed and last and last[0] == name and not self.redo_stack:
+                    # 합친 기록은 처음 명령 전 상태로 되돌리고 마지막 명령 후 상태로 다시 합니다.
+                    self.undo_stack[-1] = (name, last[1] + forward, backward + last[2], last[3], after)
+                else:
+                    self.undo_stack.append((name, forward, backward, before, after))
+                self.redo_stack.clear()
+                self._sealed = name not in MERGED_COMMANDS
+        self._stats = stats
+        self._level = level
+
+    def can_undo(self):
+        return bool(self.undo_stack)
+
+    def can_redo(self):
+        return bool(self.redo_stack)
+
+    def undo(self):
+        if not self.undo_stack:
+            return None
+        entry = self.undo_stack.pop()
+        self._apply(entry[2], entry[3])
+        self.redo_stack.append(entry)
+        return entry[0]
+
+    def redo(self):
+        if not self.redo_stack:
+            return None
+        entry = self.redo_stack.pop()
+        self._apply(entry[1], entry[4])
+        self.undo_stack.append(entry)
+        return entry[0]
+
+    def _apply(self, changes, level):
+        # 레벨은 그 뒤로 흐른 시간만큼 남은 시간을 줄여서 되돌립니다.
+        self._sealed = True
+        changes = list(changes)
+        if level is not None:
+            index, remaining, elapsed = level
+            changes.append(['level', index, max(0, remaining - (self.tournament.total_elapsed() - elapsed))])
+        self._applying = True
+        try:
+            self.tournament.apply_changes(changes)
+        finally:
+            self._applying = False
@@ -0,0 +1,112 @@
+# 등록 내보내기 파일(CSV, JSON Lines, JSON 배열)로 참가자와 칩을 한 번에 등록합니다.
+#
+# 파일은 한 줄씩 읽어 검증하고, 문제가 있는 줄은 건너뛰며 줄 번호와 이유를 모아 돌려줍니다.
+# 통과한 줄은 Tournament.register_batch 한 번으로 반영하므로 저널에는 명령 하나가 남고,
+# 화면의 참가자 목록/통계도 한 번씩만 갱신됩니다.
+#
+# 열: name(필수), buy_ins(기본 1), reentries(기본 0), addons(기본 0)
+#     참가 횟수(total_players)는 buy_ins + reentries, 칩은 참가마다 STARTING_STACK, 애드온마다 ADDON_STACK
+import codecs
+import csv
+import json
+import os
+
+from tournament import STARTING_STACK
+
+ADDON_STACK = STARTING_STACK
+FALLBACK_ENCODING = 'cp949'
+COUNT_FIELDS = (('buy_ins', 1), ('reentries', 0), ('addons', 0))
+
+
+def detect_encoding(path):
+    # 한국어 Windows의 엑셀은 CSV를 CP949로 저장합니다. UTF-8로 끝까지 읽히지 않으면 CP949로 읽습니다.
+    decoder = codecs.getincrementaldecoder('utf-8')()
+    try:
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 16), b''):
+                decoder.decode(chunk)
+        decoder.decode(b'', final=True)
+    except UnicodeDecodeError:
+        return FALLBACK_ENCODING
+    return 'utf-8-sig'
+
+
+def read_rows(path):
+    # (줄 번호, 행 dict, 읽기 오류)를 하나씩 돌려줍니다. 더 읽을 수 없는 곳을 만나면 그 줄의 오류로 알리고 멈춥니다.
+    number = 0
+    try:
+        for number, row, error in _read_rows(path, detect_encoding(path)):
+            yield number, row, error
+    except (UnicodeDecodeError, csv.Error) as e:
+        yield number + 1, None, f"unreadable: {e}"
+
+
+def _read_rows(path, encoding):
+    extension = os.path.splitext(path)[1].lower()
+    with open(path, encoding=encoding, newline='') as f:
+        if extension == '.csv':
+            reader = csv.DictReader(f)
+            for row in reader:
+                yield reader.line_num, row, None
+        elif extension == '.json':
+            # JSON 배열은 한 번에 읽을 수밖에 없으므로 큰 파일은 JSON Lines(.jsonl)를 권장합니다.
+            try:
+                rows = json.load(f)
+            except ValueError as e:
+                yield 1, None, f"invalid JSON: {e}"
+                return
+            if not isinstance(rows, list):
+                yield 1, None, "JSON file is not an array of rows"
+                return
+            for i, row in enumerate(rows, 1):
+                yield i, row, None
+        else:
+            for i, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    yield i, json.loads(line), None
+                except ValueError as e:
+                    yield i, None, f"invalid JSON: {e}"
+
+
+def validate_row(row):
+    # [이름, 참가 횟수, 칩]을 돌려주고, 잘못된 행이면 ValueError를 냅니다.
+    if not isinstance(row, dict):
+        raise ValueError("row is not an object")
+    name = str(row.get('name') or '').strip()
+    if not name:
+        raise ValueError("missing name")
+    counts = {}
+    for field, default in COUNT_FIELDS:
+        value = row.get(field)
+        if value is None or str(value).strip() == '':
+            counts[field] = default
+            continue
+        try:
+            counts[field] = int(str(value).replace(',', ''))
+        except ValueError:
+            raise ValueError(f"{field} is not a number: {value!r}")
+        if counts[field] < 0:
+            raise ValueError(f"{field} is negative: {value!r}")
+    entries = counts['buy_ins'] + counts['reentries']
+    if entries < 1:
+        raise ValueError("no buy-in")
+    return [name, entries, entries * STARTING_STACK + counts['addons'] * ADDON_STACK]
+
+
+def ingest(tournament, path):
+    # (등록한 행 목록, [(줄 번호, 오류)])를 돌려줍니다. 파일을 열 수 없으면 OSError가 그대로 올라갑니다.
+    registrations = []
+    errors = []
+    for number, row, error in read_rows(path):
+        if error is None:
+            try:
+                registrations.append(validate_row(row))
+            except ValueError as e:
+                error = str(e)
+        if error:
+            errors.append((number, error))
+    if registrations:
+        tournament.register_batch(registrations)
+    return registrations, errors
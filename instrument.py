@@ -0,0 +1,215 @@
+# 핫패스 계측 도구입니다. HOLDEM_TIMER_PROFILE=1 환경 변수로 켜며, 꺼져 있을 때는
+# timed()가 원래 함수를 그대로 돌려주므로 실행 비용이 전혀 없습니다.
+#
+# 켜져 있으면 Clock 콜백/이벤트 핸들러마다 소요 시간 히스토그램과 초당 호출 수를 모으고,
+# F12로 화면 오버레이를 켜고 끄며, F11 또는 앱 종료 시 Chrome trace 형식(JSON) 파일을 남깁니다.
+import json
+import os
+import threading
+import time
+from collections import deque
+from functools import wraps
+
+ENABLED = os.environ.get('HOLDEM_TIMER_PROFILE') == '1'
+TRACE_LIMIT = 200000
+OVERLAY_KEY = 293  # F12
+TRACE_KEY = 292  # F11
+
+
+class Histogram:
+    # 마이크로초 단위 2의 거듭제곱 버킷
+    __slots__ = ('buckets', 'count', 'total', 'max')
+
+    def __init__(self):
+        self.buckets = [0] * 32
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, seconds):
+        micros = int(seconds * 1e6)
+        self.buckets[min(31, micros.bit_length())] += 1
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def percentile(self, fraction):
+        if not self.count:
+            return 0.0
+        target = self.count * fraction
+        seen = 0
+        for i, n in enumerate(self.buckets):
+            seen += n
+            if seen >= target:
+                return min(self.max, (1 << i) / 1e6)
+        return self.max
+
+    def summary(self):
+        return {
+            'count': self.count,
+            'mean_ms': self.total / self.count * 1000 if self.count else 0.0,
+            'p50_ms': self.percentile(0.5) * 1000,
+            'p99_ms': self.percentile(0.99) * 1000,
+            'max_ms': self.max * 1000,
+            'buckets_us': {1 << i if i else 0: n for i, n in enumerate(self.buckets) if n},
+        }
+
+
+class Recorder:
+
+    def __init__(self):
+        self.histograms = {}
+        self.frames = Histogram()
+        self.rates = {}
+        self._window = {}
+        self._window_started = time.perf_counter()
+        self.trace = deque(maxlen=TRACE_LIMIT)
+        self._origin = time.perf_counter()
+        self._pid = os.getpid()
+
+    def record(self, name, started, duration):
+        histogram = self.histograms.get(name)
+        if histogram is None:
+            histogram = self.histograms[name] = Histogram()
+        histogram.add(duration)
+        self._window[name] = self._window.get(name, 0) + 1
+        self.trace.append((name, started, duration, threading.get_ident()))
+
+    def record_frame(self, dt):
+        self.frames.add(dt)
+        now = time.perf_counter()
+        elapsed = now - self._window_started
+        if elapsed >= 1:
+            self.rates = {name: n / elapsed for name, n in self._window.items()}
+            self._window = {}
+            self._window_started = now
+
+    def slowest(self, limit=5):
+        ranked = sorted(self.histograms.items(), key=lambda item: item[1].percentile(0.99), reverse=True)
+        return ranked[:limit]
+
+    def report(self):
+        return {
+            'frames': self.frames.summary(),
+            'rates_per_second': dict(self.rates),
+            'handlers': {name: h.summary() for name, h in self.histograms.items()},
+        }
+
+    def dump_trace(self, path):
+        events = [{
+            'name': name,
+            'ph': 'X',
+            'ts': (started - self._origin) * 1e6,
+            'dur': duration * 1e6,
+            'pid': self._pid,
+            'tid': tid,
+        } for name, started, duration, tid in list(self.trace)]
+        with open(path, 'w') as f:
+            json.dump({'traceEvents': events, 'otherData': self.report()}, f)
+        return path
+
+
+recorder = Recorder()
+
+
+class StartupTimer:
+    # 앱 시작 단계별 소요 시간입니다. 비용이 거의 없어 프로파일링을 켜지 않아도 재고,
+    # 켜져 있으면 trace에도 남깁니다.
+
+    def __init__(self, started_at):
+        self.started_at = started_at
+        self.phases = {}
+        self._last = started_at
+
+    def mark(self, name):
+        now = time.perf_counter()
+        self.phases[name] = now - self._last
+        if ENABLED:
+            recorder.record(f"startup:{name}", self._last, now - self._last)
+        self._last = now
+
+    def total(self):
+        return self._last - self.started_at
+
+    def report(self, budget):
+        phases = ', '.join(f"{name} {seconds * 1000:.0f} ms" for name, seconds in self.phases.items())
+        print(f"Startup: {phases} (total {self.total() * 1000:.0f} ms)")
+        if self.total() > budget:
+            print(f"Warning: First frame took {self.total() * 1000:.0f} ms, over the {budget * 1000:.0f} ms budget")
+
+
+def timed(name=None, by_first_arg=False):
+    # by_first_arg=True 이면 메서드의 첫 번째 인자(이벤트 이름 등)별로 따로 집계합니다.
+    def decorator(func):
+        if not ENABLED:
+            return func
+        label = name or func.__qualname__
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                key = f"{label}:{args[1]}" if by_first_arg and len(args) > 1 else label
+                recorder.record(key, started, time.perf_counter() - started)
+        return wrapper
+    return decorator
+
+
+def wrap_method(cls, attr, name):
+    setattr(cls, attr, timed(name)(getattr(cls, attr)))
+
+
+def install(app):
+    # Kivy 쪽 훅과 오버레이를 붙입니다. 위젯이 만들어지기 전에(App.build 시작 시) 불러야 합니다.
+    if not ENABLED:
+        return
+    from kivy.animation import Animation
+    from kivy.clock import Clock
+    from kivy.core.window import Window
+    from kivy.uix.label import Label
+
+    wrap_method(Label, 'texture_update', 'Label.texture_update')
+    wrap_method(Animation, '_update', 'Animation._update')
+
+    overlay = Label(size_hint=(None, None), halign='left', valign='top', font_size='14sp',
+                    color=(0, 1, 0, 1), opacity=0)
+    overlay.bind(texture_size=lambda label, size: setattr(label, 'size', size))
+
+    def refresh(dt):
+        if not overlay.opacity:
+            return
+        frames = recorder.frames
+        lines = [f"frame {frames.percentile(0.5) * 1000:.1f} ms  p99 {frames.percentile(0.99) * 1000:.1f} ms"]
+        busiest = sorted(recorder.rates.items(), key=lambda item: item[1], reverse=True)[:5]
+        lines.append('calls/s  ' + '  '.join(f"{n} {rate:.0f}" for n, rate in busiest))
+        wakeups, redraws = app.power.rates()
+        lines.append(f"wakeups/min {wakeups:.0f}  redraws/min {redraws:.0f}")
+        for n, histogram in recorder.slowest():
+            lines.append(f"{n}  p99 {histogram.percentile(0.99) * 1000:.2f} ms  max {histogram.max * 1000:.2f} ms")
+        overlay.text = '\n'.join(lines)
+        overlay.top = Window.height
+
+    def dump(*args):
+        path = os.path.join(app.user_data_dir, f"trace-{int(time.time())}.json")
+        print(f"Profile trace written to {recorder.dump_trace(path)}")
+
+    def on_key_down(window, key, *args):
+        if key == OVERLAY_KEY:
+            overlay.opacity = 0 if overlay.opacity else 1
+            refresh(0)
+            return True
+        if key == TRACE_KEY:
+            dump()
+            return True
+        return False
+
+    def attach(*args):
+        Window.add_widget(overlay)
+        Clock.schedule_interval(recorder.record_frame, 0)
+        Clock.schedule_interval(refresh, 0.5)
+
+    Window.bind(on_key_down=on_key_down)
+    app.bind(on_start=attach, on_stop=dump)
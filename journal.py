@@ -0,0 +1,123 @@
+# 토너먼트 상태 변경을 파일에 남겨 두었다가 앱이 갑자기 종료돼도 이어서 진행할 수 있게 합니다.
+#
+# Tournament의 'command' 이벤트(@command 메서드 호출)를 실제 시각(time.time)과 함께
+# journal.jsonl에 덧붙여 쓰고, fsync는 flush()가 불릴 때 묶어서 한 번만 합니다.
+# 이벤트가 일정 개수 쌓이면 snapshot.json으로 압축하고 저널을 비웁니다.
+# 다시 켤 때는 스냅샷과 남은 이벤트를 가상 시계로 재생한 뒤 현재 시각까지 진행시킵니다.
+import json
+import os
+import time
+
+from tournament import VirtualClock
+
+SNAPSHOT_EVERY = 500
+FLUSH_BATCH = 64
+
+
+class Journal:
+
+    def __init__(self, directory, clock=time.time, snapshot_every=SNAPSHOT_EVERY):
+        os.makedirs(directory, exist_ok=True)
+        self.journal_path = os.path.join(directory, 'journal.jsonl')
+        self.snapshot_path = os.path.join(directory, 'snapshot.json')
+        self.clock = clock
+        self.snapshot_every = snapshot_every
+        self.seq = 0
+        self.events_since_snapshot = 0
+        self.tournament = None
+        self._pending = []
+        self._file = None
+
+    def attach(self, tournament):
+        self.tournament = tournament
+        tournament.bind(self.on_tournament_event)
+        # 좌석 추첨 seed처럼 reset()에서 정해진 값이 재생 때도 같도록 처음부터 스냅샷을 남겨 둡니다.
+        if not os.path.exists(self.snapshot_path):
+            self.compact()
+
+    def on_tournament_event(self, event, *args):
+        if event != 'command':
+            return
+        name, op_args = args
+        self.seq += 1
+        self._pending.append(json.dumps(
+            {'seq': self.seq, 't': self.clock(), 'op': name, 'args': op_args}, separators=(',', ':')))
+        self.events_since_snapshot += 1
+        if name == 'reset' or self.events_since_snapshot >= self.snapshot_every:
+            self.compact()
+        elif len(self._pending) >= FLUSH_BATCH:
+            self.flush()
+
+    def flush(self):
+        if not self._pending:
+            return
+        if self._file is None:
+            self._file = open(self.journal_path, 'a', encoding='utf-8')
+        self._file.write('\n'.join(self._pending) + '\n')
+        self._pending = []
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def compact(self):
+        # 스냅샷을 임시 파일에 쓰고 교체한 뒤 저널을 비웁니다. 교체 직후 종료돼도
+        # 재생 시 스냅샷의 seq 이하 이벤트는 건너뛰므로 두 번 적용되지 않습니다.
+        snapshot = {'seq': self.seq, 't': self.clock(), 'state': self.tournament.snapshot()}
+        tmp_path = self.snapshot_path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(snapshot, f, separators=(',', ':'))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.snapshot_path)
+
+        self._pending = []
+        if self._file is not None:
+            self._file.close()
+        self._file = open(self.journal_path, 'w', encoding='utf-8')
+        self.events_since_snapshot = 0
+
+    def close(self):
+        self.flush()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def replay(self, tournament):
+        # 이벤트마다 가상 시계를 기록된 시각으로 맞추고 그 시점까지의 레벨 진행(tick)을 먼저 반영합니다.
+        # 재생 중에는 리스너를 붙이지 않은 상태여야 소리/화면 갱신이 일어나지 않습니다.
+        original_clock = tournament.clock
+        clock = VirtualClock(self.clock())
+        tournament.clock = clock
+        replayed = 0
+
+        if os.path.exists(self.snapshot_path):
+            try:
+                with open(self.snapshot_path, encoding='utf-8') as f:
+                    snapshot = json.load(f)
+                clock.now = snapshot['t']
+                tournament.restore(snapshot['state'])
+                self.seq = snapshot['seq']
+                replayed += 1
+            except (ValueError, KeyError) as e:
+                print(f"Warning: Ignoring unreadable snapshot '{self.snapshot_path}': {e}")
+
+        if os.path.exists(self.journal_path):
+            with open(self.journal_path, encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        event = json.loads(line)
+                    except ValueError:
+                        # 전원이 꺼지며 마지막 줄이 잘린 경우
+                        continue
+                    if event['seq'] <= self.seq:
+                        continue
+                    clock.now = event['t']
+                    tournament.tick()
+                    getattr(tournament, event['op'])(*event['args'])
+                    self.seq = event['seq']
+                    self.events_since_snapshot += 1
+                    replayed += 1
+
+        clock.now = self.clock()
+        tournament.tick()
+        tournament.set_clock(original_clock)
+        return replayed > 0
@@ -0,0 +1,100 @@
+# 이름을 붙인 블라인드 구조(레벨, 브레이크 설정, 효과음)를 SQLite에 저장해 두고 찾아 불러옵니다.
+#
+# 레벨 목록은 JSON 한 칸으로 저장해 200레벨짜리 구조도 행 하나만 읽으면 되고, 검색에 쓰는
+# 이름/시작 스택/전체 길이는 따로 열로 두어 인덱스로 찾습니다. 이름은 대소문자를 구분하지 않으며
+# 앞부분 일치(LIKE 'abc%')로 찾으므로 이름 인덱스를 그대로 씁니다.
+import json
+import sqlite3
+import time
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS structures (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE COLLATE NOCASE,
+    starting_stack INTEGER NOT NULL,
+    total_seconds INTEGER NOT NULL,
+    level_count INTEGER NOT NULL,
+    break_levels TEXT NOT NULL,
+    break_duration TEXT NOT NULL,
+    level_up_sound TEXT NOT NULL,
+    break_sound TEXT NOT NULL,
+    levels TEXT NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS structures_stack ON structures (starting_stack);
+CREATE INDEX IF NOT EXISTS structures_length ON structures (total_seconds);
+"""
+SEARCH_LIMIT = 100
+
+
+class StructureLibrary:
+
+    def __init__(self, path):
+        try:
+            self.db = sqlite3.connect(path)
+            self.db.executescript(SCHEMA)
+        except sqlite3.DatabaseError as e:
+            print(f"Warning: Could not open structure library '{path}': {e}")
+            self.db = sqlite3.connect(':memory:')
+            self.db.executescript(SCHEMA)
+
+    def save(self, name, levels, break_levels, break_duration, level_up_sound, break_sound,
+             starting_stack, total_seconds):
+        # levels는 설정 화면의 형식(small/big/ante/duration(분) dict 목록)입니다. 같은 이름이 있으면 덮어씁니다.
+        levels = [{'small': row['small'], 'big': row['big'], 'ante': row['ante'], 'duration': row['duration']}
+                  for row in levels]
+        with self.db:
+            self.db.execute(
+                "INSERT INTO structures (name, starting_stack, total_seconds, level_count, break_levels,"
+                " break_duration, level_up_sound, break_sound, levels, updated_at)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+                " ON CONFLICT (name) DO UPDATE SET name = excluded.name,"
+                " starting_stack = excluded.starting_stack, total_seconds = excluded.total_seconds,"
+                " level_count = excluded.level_count, break_levels = excluded.break_levels,"
+                " break_duration = excluded.break_duration, level_up_sound = excluded.level_up_sound,"
+                " break_sound = excluded.break_sound, levels = excluded.levels, updated_at = excluded.updated_at",
+                (name, starting_stack, total_seconds, len(levels), break_levels, break_duration,
+                 level_up_sound or '', break_sound or '', json.dumps(levels, separators=(',', ':')), time.time()))
+
+    def load(self, name):
+        row = self.db.execute(
+            "SELECT name, starting_stack, break_levels, break_duration, level_up_sound, break_sound, levels"
+            " FROM structures WHERE name = ?", (name,)).fetchone()
+        if row is None:
+            return None
+        return {
+            'name': row[0],
+            'starting_stack': row[1],
+            'break_levels': row[2],
+            'break_duration': row[3],
+            'level_up_sound': row[4],
+            'break_sound': row[5],
+            'levels': json.loads(row[6]),
+        }
+
+    def search(self, name='', starting_stack=None, max_seconds=None, limit=SEARCH_LIMIT):
+        # 조건을 준 것만 WHERE에 넣습니다. 레벨 목록은 읽지 않습니다.
+        conditions = []
+        params = []
+        if name:
+            conditions.append("name LIKE ? ESCAPE '\\'")
+            params.append(name.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_') + '%')
+        if starting_stack is not None:
+            conditions.append("starting_stack = ?")
+            params.append(starting_stack)
+        if max_seconds is not None:
+            conditions.append("total_seconds <= ?")
+            params.append(max_seconds)
+        where = f" WHERE {' AND '.join(conditions)}" if conditions else ''
+        rows = self.db.execute(
+            "SELECT name, starting_stack, total_seconds, level_count FROM structures"
+            f"{where} ORDER BY name LIMIT ?", params + [limit]).fetchall()
+        return [{'name': row[0], 'starting_stack': row[1], 'total_seconds': row[2], 'level_count': row[3]}
+                for row in rows]
+
+    def delete(self, name):
+        with self.db:
+            self.db.execute("DELETE FROM structures WHERE name = ?", (name,))
+
+    def close(self):
+        self.db.close()
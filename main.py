@@ -1,17 +1,49 @@
+import time
+
+# 시작 단계별 시간을 재기 위해 Kivy를 불러오기 전에 기록해 둡니다.
+STARTED_AT = time.perf_counter()
+
+import os
+# HOLDEM_TIMER_POWER=full 이면 입력이 없어도 프레임 속도를 낮추지 않습니다.
+POWER_ENV = 'HOLDEM_TIMER_POWER'
+# 입력이 없을 때 프레임 속도를 낮춰도 예약된 틱은 제때 깨어나도록 interrupt Clock을 씁니다 (power.py).
+# kivy.clock을 처음 불러오기 전에 정해야 하고, 낮추지 않을 때는 기본 Clock을 그대로 씁니다.
+if os.environ.get(POWER_ENV) != 'full':
+    os.environ.setdefault('KIVY_CLOCK', 'interrupt')
+
 import kivy
 from kivy.app import App
 from kivy.lang import Builder
 from kivy.uix.screenmanager import ScreenManager, Screen
 from kivy.properties import NumericProperty, StringProperty, BooleanProperty, ObjectProperty, ListProperty
+from kivy.uix.boxlayout import BoxLayout
+from kivy.uix.widget import Widget
 from kivy.uix.label import Label
-from kivy.uix.textinput import TextInput
-from kivy.uix.button import Button
-from kivy.clock import Clock
-from kivy.core.audio import SoundLoader
-from plyer import filechooser
+from kivy.uix.slider import Slider
+from kivy.uix.popup import Popup
+from kivy.uix.behaviors import ButtonBehavior
+from kivy.uix.recycleview import RecycleView
+from kivy.uix.recycleview.views import RecycleDataViewBehavior
+from kivy.core.text import Label as CoreLabel
+from kivy.graphics import Color, InstructionGroup, Line, Rectangle
+from kivy.clock import Clock, mainthread
+from kivy.animation import Animation
 import math
-import os
-from functools import partial
+
+import instrument
+from instrument import StartupTimer, timed
+from broadcast import BROADCAST_PORT, BroadcastServer, DisplayClient
+from history import History
+from ingest import ingest
+from journal import Journal
+from library import StructureLibrary
+from payouts import payout_table
+from power import PowerGovernor
+from registry import ACTIVE
+from runtime import Runtime
+from sounds import SoundBank
+from timeseries import TimeSeries
+from tournament import STARTING_STACK, Tournament, build_schedule, parse_blind_structure
 
 # Kivy 앱의 최소 버전을 설정합니다.
 kivy.require('2.1.0')
@@ -48,13 +80,61 @@ DEFAULT_BLIND_STRUCTURE = (
 )
 
 
+# DigitLabel이 아틀라스에 미리 그려 두는 글자들
+DIGIT_GLYPHS = '0123456789:'
+
+# 상태 저널을 디스크에 fsync하는 간격 (초)
+JOURNAL_FLUSH_INTERVAL = 1
+
+# 종료 시각 예측을 다시 요청하기 전에 상태 변화를 모으는 시간 (초)
+FORECAST_DELAY = 0.5
+
+# 메인 이벤트 이름과, 함께 돌리는 다른 이벤트들의 저널을 두는 폴더 (user_data_dir 기준)
+MAIN_EVENT_NAME = 'Main Event'
+# 구조 라이브러리 파일과, PLAY를 누를 때마다 덮어써 다음 실행 때 불러오는 구조의 이름
+LIBRARY_FILE = 'library.sqlite3'
+LAST_STRUCTURE_NAME = 'Last played'
+EVENTS_DIR = 'events'
+
+# 방송: HOLDEM_TIMER_BROADCAST=<포트> 이면 보고 있는 이벤트를 방송하고,
+# HOLDEM_TIMER_DISPLAY=<호스트[:포트]> 이면 그 서버를 따라가는 표시 전용 기기로 실행합니다.
+BROADCAST_ENV = 'HOLDEM_TIMER_BROADCAST'
+DISPLAY_ENV = 'HOLDEM_TIMER_DISPLAY'
+
+# Entry 목록 자동 스크롤 속도 (px/s)
+ENTRANT_SCROLL_SPEED = 40
+# 저전력 모드에서는 매끄럽게 흘리지 않고 이 간격(초)마다 같은 속도만큼 건너뜁니다.
+ENTRANT_STEP_INTERVAL = 1
+# 탈락한 참가자 이름 색
+BUSTED_COLOR = (0.5, 0.5, 0.5, 1)
+
+# 추이 그래프: 선 하나를 이 점 수만큼씩 나눠 그리고, 시간 축은 처음 이 길이(초)에서 넘칠 때마다 두 배로 늘립니다.
+CHART_CHUNK = 128
+CHART_MIN_SPAN = 3600
+CHART_LINES = (('players', (0.3, 0.8, 1, 1)), ('avr_stack_bb', (1, 0.85, 0.2, 1)))
+
+# 되돌리기/다시 하기 단축키 (Ctrl+Z, Ctrl+Y 또는 Ctrl+Shift+Z)
+UNDO_KEY = 122  # z
+REDO_KEY = 121  # y
+
+# 첫 프레임까지 걸린 시간이 이보다 길면 경고를 출력합니다 (초)
+FIRST_FRAME_BUDGET = 1.5
+
+# flush_ui에서 다시 계산할 화면 항목 묶음
+UI_CLOCK = 'clock'  # 경과/남은 시간, 다음 브레이크까지 시간, 슬라이더
+UI_LEVEL = 'level'  # 레벨/블라인드 문구와 색상, 다음 레벨 안내
+UI_STATS = 'stats'  # 칩/평균 스택/인원 및 BB 환산
+
+
 # UI 레이아웃을 정의하는 KV 언어 문자열입니다.
 KV = """
 Manager:
     SettingsScreen:
         name: 'settings'
-    TimerScreen:
-        name: 'timer'
+    DashboardScreen:
+        name: 'dashboard'
+    LibraryScreen:
+        name: 'library'
 
 <SettingsScreen>:
     on_pre_enter: app.build_blind_settings_ui()
@@ -82,6 +162,12 @@ Manager:
                 id: break_duration_input
                 text: '7'
                 input_filter: 'int'
+            Label:
+                text: 'Buy-in:'
+            TextInput:
+                id: buy_in_input
+                text: '0'
+                input_filter: 'int'
             Label:
                 text: 'Level Up Sound:'
             BoxLayout:
@@ -116,6 +202,31 @@ Manager:
                 text: 'Apply'
                 on_press: app.set_all_durations(all_duration_spinner.text)
 
+        BoxLayout:
+            size_hint_y: 0.1
+            spacing: 10
+            Label:
+                text: 'Generate (players / end / chips):'
+            TextInput:
+                id: gen_players_input
+                text: '30'
+                input_filter: 'int'
+                multiline: False
+                size_hint_x: 0.4
+            TextInput:
+                id: gen_end_input
+                hint_text: 'HH:MM'
+                multiline: False
+                size_hint_x: 0.5
+            TextInput:
+                id: gen_chips_input
+                text: '100, 500, 1000, 5000, 25000'
+                multiline: False
+            Button:
+                text: 'Generate'
+                size_hint_x: 0.6
+                on_press: app.generate_blind_structure(gen_players_input.text, gen_end_input.text, gen_chips_input.text, break_levels_input.text, break_duration_input.text)
+
         GridLayout:
             cols: 6
             size_hint_y: 0.05
@@ -137,24 +248,194 @@ Manager:
             Label:
                 text: ''
 
-        ScrollView:
+        RecycleView:
+            id: blind_grid
             size_hint_y: 0.4
-            GridLayout:
-                id: blind_grid
-                cols: 6
+            viewclass: 'BlindRow'
+            RecycleBoxLayout:
+                orientation: 'vertical'
+                default_size: None, 40
+                default_size_hint: 1, None
                 size_hint_y: None
                 height: self.minimum_height
                 spacing: 5
                 padding: 5
                 
-        Button:
-            text: 'PLAY'
-            font_size: '24sp'
+        BoxLayout:
             size_hint_y: 0.1
-            on_press:
-                app.setup_blinds(break_levels_input.text, break_duration_input.text)
-                root.manager.current = 'timer'
+            spacing: 10
+            Button:
+                text: 'EVENTS'
+                size_hint_x: 0.3
+                on_press: root.manager.current = 'dashboard'
+            Button:
+                text: 'LIBRARY'
+                size_hint_x: 0.3
+                on_press: root.manager.current = 'library'
+            Button:
+                text: 'PLAY'
+                font_size: '24sp'
+                on_press:
+                    app.setup_blinds(break_levels_input.text, break_duration_input.text)
+                    app.set_buy_in(buy_in_input.text)
+                    app.show_timer()
+
+<EventRow@BoxLayout>:
+    index: 0
+    name_text: ''
+    level_text: ''
+    time_text: ''
+    players_text: ''
+    spacing: 5
+    Label:
+        text: root.name_text
+        size_hint_x: 2
+    Label:
+        text: root.level_text
+    Label:
+        text: root.time_text
+    Label:
+        text: root.players_text
+    Button:
+        text: 'SHOW'
+        on_press: app.promote_event(root.index)
+
+<DashboardScreen>:
+    on_enter: app.start_dashboard()
+    on_leave: app.stop_dashboard()
+    BoxLayout:
+        orientation: 'vertical'
+        padding: 20
+        spacing: 10
+        Label:
+            text: 'Events'
+            font_size: '32sp'
+            size_hint_y: 0.1
+        RecycleView:
+            id: event_list
+            viewclass: 'EventRow'
+            RecycleBoxLayout:
+                orientation: 'vertical'
+                default_size: None, 50
+                default_size_hint: 1, None
+                size_hint_y: None
+                height: self.minimum_height
+                spacing: 5
+        BoxLayout:
+            size_hint_y: 0.1
+            spacing: 10
+            Button:
+                text: 'NEW EVENT'
+                on_press: app.new_event()
+            Button:
+                text: 'BACK'
+                on_press: app.show_event_screen()
+
+<StructureRow@BoxLayout>:
+    name_text: ''
+    info_text: ''
+    spacing: 5
+    Label:
+        text: root.name_text
+        size_hint_x: 2
+    Label:
+        text: root.info_text
+        size_hint_x: 2
+    Button:
+        text: 'LOAD'
+        on_press: app.load_structure(root.name_text)
+    Button:
+        text: 'DELETE'
+        on_press: app.delete_structure(root.name_text)
+
+<LibraryScreen>:
+    on_enter: app.search_library(search_name_input.text, search_stack_input.text, search_hours_input.text)
+    BoxLayout:
+        orientation: 'vertical'
+        padding: 20
+        spacing: 10
+        Label:
+            text: 'Structure Library'
+            font_size: '32sp'
+            size_hint_y: 0.1
+        BoxLayout:
+            size_hint_y: 0.1
+            spacing: 10
+            TextInput:
+                id: save_name_input
+                hint_text: 'Name'
+                multiline: False
+            Button:
+                text: 'SAVE CURRENT'
+                size_hint_x: 0.5
+                on_press: app.save_structure(save_name_input.text)
+        BoxLayout:
+            size_hint_y: 0.1
+            spacing: 10
+            TextInput:
+                id: search_name_input
+                hint_text: 'Search name'
+                multiline: False
+                on_text: app.search_library(self.text, search_stack_input.text, search_hours_input.text)
+            TextInput:
+                id: search_stack_input
+                hint_text: 'Starting stack'
+                multiline: False
+                input_filter: 'int'
+                on_text: app.search_library(search_name_input.text, self.text, search_hours_input.text)
+            TextInput:
+                id: search_hours_input
+                hint_text: 'Max hours'
+                multiline: False
+                input_filter: 'float'
+                on_text: app.search_library(search_name_input.text, search_stack_input.text, self.text)
+        RecycleView:
+            id: structure_list
+            viewclass: 'StructureRow'
+            RecycleBoxLayout:
+                orientation: 'vertical'
+                default_size: None, 50
+                default_size_hint: 1, None
+                size_hint_y: None
+                height: self.minimum_height
+                spacing: 5
+        BoxLayout:
+            size_hint_y: 0.1
+            Button:
+                text: 'BACK'
+                on_press: root.manager.current = 'settings'
+
+<BlindInput@TextInput>:
+    multiline: False
+    input_filter: 'int'
+
+<BlindRow>:
+    spacing: 5
+    Label:
+        text: str(root.index + 1)
+    BlindInput:
+        id: small
+        on_text: app.store_blind_input(root.index, 'small', self.text)
+        on_focus: if not self.focus: app.commit_blind_input(root.index, 'small', self)
+    BlindInput:
+        id: big
+        on_text: app.store_blind_input(root.index, 'big', self.text)
+        on_focus: if not self.focus: app.commit_blind_input(root.index, 'big', self)
+    BlindInput:
+        id: ante
+        on_text: app.store_blind_input(root.index, 'ante', self.text)
+        on_focus: if not self.focus: app.commit_blind_input(root.index, 'ante', self)
+    BlindInput:
+        id: duration
+        on_text: app.store_blind_input(root.index, 'duration', self.text)
+        on_focus: if not self.focus: app.commit_blind_input(root.index, 'duration', self)
+    Button:
+        text: 'Apply Below'
+        on_press: app.apply_duration_below(root.index)
+"""
 
+# Timer 화면은 처음 열 때(show_timer) 규칙을 읽어 만듭니다.
+TIMER_KV = """
 <TimerScreen>:
     on_enter: app.start_scrolling_entrants()
     on_leave: app.stop_scrolling_entrants()
@@ -174,7 +455,7 @@ Manager:
                 size_hint_y: 0.13
                 Label:
                     text: 'TOTAL TIME'
-                Label:
+                DigitLabel:
                     id: total_time
                     text: app.total_time_str
                     font_size: '24sp'
@@ -223,6 +504,11 @@ Manager:
                     text: app.players_str
                     font_size: '24sp'
                     bold: True
+                Label:
+                    id: players_forecast
+                    text: app.players_forecast_str
+                    font_size: '14sp'
+                    color: 0.7, 0.7, 0.7, 1
 
             BoxLayout:
                 orientation: 'vertical'
@@ -239,6 +525,11 @@ Manager:
                     id: next_break
                     text: app.next_break_str
                     font_size: '16sp'
+                Label:
+                    id: forecast
+                    text: app.forecast_str
+                    font_size: '14sp'
+                    color: 0.7, 0.7, 0.7, 1
             
             BoxLayout:
                 orientation: 'vertical'
@@ -253,27 +544,27 @@ Manager:
                         text: '1st:'
                         font_size: '18sp'
                     Label:
-                        text: '0'
+                        text: app.prize_strs[0]
                     Label:
                         text: '2nd:'
                         font_size: '18sp'
                     Label:
-                        text: '0'
+                        text: app.prize_strs[1]
                     Label:
                         text: '3rd:'
                         font_size: '18sp'
                     Label:
-                        text: '0'
+                        text: app.prize_strs[2]
                     Label:
                         text: '4th:'
                         font_size: '18sp'
                     Label:
-                        text: '0'
+                        text: app.prize_strs[3]
                     Label:
                         text: '5th:'
                         font_size: '18sp'
                     Label:
-                        text: '0'
+                        text: app.prize_strs[4]
 
 
         # 중앙 패널
@@ -289,7 +580,7 @@ Manager:
                 font_size: '48sp'
                 size_hint_y: 0.3
                 color: app.level_label_color
-            Label:
+            DigitLabel:
                 id: timer_label
                 text: app.level_time_str
                 font_size: self.height * 0.8
@@ -307,11 +598,20 @@ Manager:
                 font_size: '20sp'
                 color: 0.7, 0.7, 0.7, 1
                 size_hint_y: 0.1
+            Label:
+                text: '[color=4dccff]PLAYERS[/color]   [color=ffd933]AVR STACK (BB)[/color]'
+                markup: True
+                font_size: '14sp'
+                size_hint_y: 0.04
+            TrendChart:
+                id: trend_chart
+                size_hint_y: 0.2
 
         # 오른쪽 패널
         BoxLayout:
             id: right_panel
             orientation: 'vertical'
+            disabled: app.read_only
             size_hint_x: 0.75
             padding: 10
             spacing: 5
@@ -336,12 +636,13 @@ Manager:
                 Button:
                     text: '- 10s'
                     on_press: app.adjust_time(-10)
-            Slider:
+            SeekSlider:
                 id: time_slider
                 min: 0
                 max: 1
                 value: 1
-                on_touch_move: app.seek_time(self.value)
+                on_seek: app.seek_time(args[1])
+                on_seek_end: app.end_seek()
                 size_hint_y: 0.05
             
             BoxLayout:
@@ -377,28 +678,76 @@ Manager:
             Button:
                 text: 'HEADS-UP'
                 size_hint_y: 0.08
+                disabled: app.players != 2
                 on_press: app.set_heads_up()
-            Button:
-                text: 'FINISH'
+            BoxLayout:
+                size_hint_y: 0.06
+                Button:
+                    text: 'UNDO'
+                    disabled: not app.can_undo
+                    on_press: app.undo()
+                Button:
+                    text: 'REDO'
+                    disabled: not app.can_redo
+                    on_press: app.redo()
+            BoxLayout:
                 size_hint_y: 0.08
-                on_press:
-                    app.reset_game()
-                    root.manager.current = 'settings'
+                Button:
+                    text: 'IMPORT'
+                    on_press: app.choose_registrations()
+                Button:
+                    text: 'EVENTS'
+                    on_press: root.manager.current = 'dashboard'
+                Button:
+                    text: 'FINISH'
+                    on_press:
+                        app.reset_game()
+                        root.manager.current = 'settings'
             
             Label:
                 text: 'Entry'
                 size_hint_y: 0.05
                 bold: True
             
-            ScrollView:
+            EntrantList:
                 id: entry_scroll
                 bar_width: 0
-                GridLayout:
+                viewclass: 'EntrantLabel'
+                on_height: app._check_scroll_trigger()
+                RecycleBoxLayout:
                     id: entry_list
-                    cols: 1
+                    orientation: 'vertical'
+                    default_size: None, 60
+                    default_size_hint: 1, None
                     size_hint_y: None
                     height: self.minimum_height
                     spacing: 2
+
+<EntrantLabel>:
+    font_size: '24sp'
+    on_release: app.confirm_bust(self.index)
+
+<BustPopup>:
+    title: 'Bust player'
+    size_hint: 0.5, 0.35
+    BoxLayout:
+        orientation: 'vertical'
+        padding: 10
+        spacing: 10
+        Label:
+            text: 'Bust ' + root.entrant + '?'
+            font_size: '24sp'
+        BoxLayout:
+            size_hint_y: 0.4
+            spacing: 10
+            Button:
+                text: 'CANCEL'
+                on_press: root.dismiss()
+            Button:
+                text: 'BUST'
+                on_press:
+                    app.bust_entrant(root.index)
+                    root.dismiss()
 """
 
 class Manager(ScreenManager):
@@ -410,20 +759,246 @@ class SettingsScreen(Screen):
 class TimerScreen(Screen):
     pass
 
+class DashboardScreen(Screen):
+    pass
+
+class LibraryScreen(Screen):
+    pass
+
+class BlindRow(RecycleDataViewBehavior, BoxLayout):
+    # 블라인드 설정 한 줄. 화면에 보이는 줄만 만들어지고 스크롤 시 다른 레벨의 값으로 다시 채워집니다.
+    index = NumericProperty(0)
+
+    def refresh_view_attrs(self, rv, index, data):
+        self.index = index
+        self.ids.small.text = f"{data['small']:,}"
+        self.ids.big.text = f"{data['big']:,}"
+        self.ids.ante.text = f"{data['ante']:,}"
+        self.ids.duration.text = str(data['duration'])
+
+class EntrantLabel(RecycleDataViewBehavior, ButtonBehavior, Label):
+    # Entry 목록 한 줄. 누르면 그 참가자를 탈락 처리합니다.
+    index = NumericProperty(0)
+
+    def refresh_view_attrs(self, rv, index, data):
+        self.index = index
+        return super().refresh_view_attrs(rv, index, data)
+
+class BustPopup(Popup):
+    # Entry 목록을 스크롤하다 잘못 눌러도 바로 탈락 처리되지 않도록 한 번 더 묻습니다.
+    index = NumericProperty(0)
+    entrant = StringProperty('')
+
+class SeekSlider(Slider):
+    # on_touch_move는 화면의 모든 위젯에 오므로, 이 슬라이더가 잡은 터치로 값이 바뀐 뒤에만 on_seek을 보냅니다.
+    # 그렇지 않으면 Entry 목록을 스크롤해도 시계가 옮겨지고 되돌리기 기록이 쌓입니다.
+    # 손을 떼면 on_seek_end를 보내 한 번 끈 동안의 seek만 되돌리기 기록 하나로 합칩니다.
+    __events__ = ('on_seek', 'on_seek_end')
+
+    def on_touch_move(self, touch):
+        return self._seek_after(super().on_touch_move, touch)
+
+    def on_touch_up(self, touch):
+        grabbed = touch.grab_current is self
+        result = self._seek_after(super().on_touch_up, touch)
+        if grabbed:
+            self.dispatch('on_seek_end')
+        return result
+
+    def _seek_after(self, handler, touch):
+        grabbed = touch.grab_current is self
+        result = handler(touch)
+        if grabbed:
+            self.dispatch('on_seek', self.value)
+        return result
+
+    def on_seek(self, value):
+        pass
+
+    def on_seek_end(self):
+        pass
+
+class EntrantList(RecycleView):
+    # Entry 목록은 스크롤 막대를 숨겨 두므로(bar_width: 0) 스크롤할 때마다 막대를 흐리게 하는
+    # 0.5초 애니메이션을 돌리지 않습니다. 저전력 모드에서는 한 칸씩 건너뛸 때마다 이 애니메이션이
+    # 0.5초 동안 매 프레임 루프를 깨웁니다.
+    def _bind_inactive_bar_color(self, *args):
+        pass
+
+class DigitLabel(Widget):
+    # 시계 숫자용 라벨. 0-9와 ':'를 크기별로 한 번만 텍스처 아틀라스에 그려 두고,
+    # 글자가 바뀔 때는 각 사각형의 텍스처 영역만 바꿔 끼워 매 초 재래스터화를 피합니다.
+    text = StringProperty('')
+    font_size = NumericProperty('15sp')
+    bold = BooleanProperty(False)
+    color = ListProperty([1, 1, 1, 1])
+
+    def __init__(self, **kwargs):
+        self._glyphs = {}
+        self._glyph_height = 0
+        self._rects = []
+        self._atlas_trigger = Clock.create_trigger(self.build_atlas)
+        self._layout_trigger = Clock.create_trigger(self.layout_glyphs)
+        super().__init__(**kwargs)
+        with self.canvas:
+            self._color = Color(*self.color)
+        self.fbind('font_size', self._atlas_trigger)
+        self.fbind('bold', self._atlas_trigger)
+        self.fbind('text', self._layout_trigger)
+        self.fbind('pos', self._layout_trigger)
+        self.fbind('size', self._layout_trigger)
+        self._atlas_trigger()
+
+    def on_color(self, instance, value):
+        if hasattr(self, '_color'):
+            self._color.rgba = value
+
+    @timed()
+    def build_atlas(self, *args):
+        if self.font_size <= 0:
+            return
+        label = CoreLabel(text=DIGIT_GLYPHS, font_size=self.font_size, bold=self.bold)
+        label.refresh()
+        atlas = label.texture
+        glyphs = {}
+        x = 0
+        for ch in DIGIT_GLYPHS:
+            width = label.get_extents(ch)[0]
+            glyphs[ch] = atlas.get_region(x, 0, width, atlas.height)
+            x += width
+        self._glyphs = glyphs
+        self._glyph_height = atlas.height
+        self.layout_glyphs()
+
+    @timed()
+    def layout_glyphs(self, *args):
+        glyphs = self._glyphs
+        if not glyphs:
+            return
+        textures = [glyphs[ch] for ch in self.text if ch in glyphs]
+        while len(self._rects) < len(textures):
+            rect = Rectangle()
+            self.canvas.add(rect)
+            self._rects.append(rect)
+
+        x = self.center_x - sum(texture.width for texture in textures) / 2.
+        y = self.center_y - self._glyph_height / 2.
+        for rect, texture in zip(self._rects, textures):
+            rect.texture = texture
+            rect.pos = (x, y)
+            rect.size = texture.size
+            x += texture.width
+        for rect in self._rects[len(textures):]:
+            rect.size = (0, 0)
+
+class TrendChart(Widget):
+    # 인원과 평균 스택(BB) 추이 그래프. 선마다 CHART_CHUNK 점씩 나눈 Line 여러 개로 그려서 새 샘플이
+    # 들어오면 마지막 조각만 고칩니다. 축 범위를 넘는 값이 오거나 크기/기록 단계가 바뀔 때만 전부 다시 그립니다.
+
+    def __init__(self, **kwargs):
+        self.series = None
+        self._tier = None
+        self._count = 0
+        self._groups = {}
+        self._points = {}
+        self._lines = {}
+        self._x_span = CHART_MIN_SPAN
+        self._y_max = {}
+        super().__init__(**kwargs)
+        self.fbind('pos', self.redraw)
+        self.fbind('size', self.redraw)
+
+    def set_series(self, series):
+        self.series = series
+        self.redraw()
+
+    @timed()
+    def redraw(self, *args):
+        for group in self._groups.values():
+            self.canvas.remove(group)
+        self._groups = {}
+        self._tier = None
+        self._count = 0
+        if self.series is None:
+            return
+        tier = self.series.chart_tier()
+        last = len(tier) - 1
+        self._x_span = CHART_MIN_SPAN
+        while last >= 0 and tier.get(last, 'elapsed') > self._x_span:
+            self._x_span *= 2
+        for field, color in CHART_LINES:
+            group = InstructionGroup()
+            group.add(Color(*color))
+            self.canvas.add(group)
+            self._groups[field] = group
+            self._lines[field] = []
+            self._points[field] = []
+            values = [value for _, value in tier.points(field)]
+            self._y_max[field] = max(values) * 1.25 if values and max(values) > 0 else 1
+        self._tier = tier
+        self.update()
+
+    @timed()
+    def update(self, *args):
+        if self.series is None:
+            return
+        tier = self.series.chart_tier()
+        if tier is not self._tier or tier.count < self._count or not tier.covers_all():
+            self.redraw()
+            return
+        # 마지막으로 그린 점은 같은 구간의 새 값으로 바뀌었을 수 있으므로 다시 가져옵니다.
+        start = max(0, self._count - 1)
+        new_points = {field: tier.points(field, start) for field, _ in CHART_LINES}
+        for field, points in new_points.items():
+            for elapsed, value in points:
+                if elapsed > self._x_span or value > self._y_max[field]:
+                    self.redraw()
+                    return
+        for field, points in new_points.items():
+            flat = self._points[field]
+            del flat[start * 2:]
+            for elapsed, value in points:
+                flat.append(self.x + elapsed / self._x_span * self.width)
+                flat.append(self.y + value / self._y_max[field] * self.height)
+            self._sync_lines(field, start)
+        self._count = tier.count
+
+    def _sync_lines(self, field, first_changed):
+        # k번째 Line은 점 k*CHART_CHUNK부터 (k+1)*CHART_CHUNK까지(양 끝 포함)를 그립니다.
+        flat = self._points[field]
+        lines = self._lines[field]
+        needed = max(1, -(-(len(flat) // 2 - 1) // CHART_CHUNK))
+        while len(lines) < needed:
+            line = Line(width=1.2)
+            self._groups[field].add(line)
+            lines.append(line)
+        for k in range(max(0, first_changed - 1) // CHART_CHUNK, needed):
+            lines[k].points = flat[2 * k * CHART_CHUNK:2 * ((k + 1) * CHART_CHUNK + 1)]
+
+def open_file(**kwargs):
+    # plyer는 불러오는 데 시간이 걸리므로 파일 선택 창을 처음 열 때 불러옵니다.
+    from plyer import filechooser
+    filechooser.open_file(**kwargs)
+
+def parse_break_settings(break_levels_text, break_duration_text):
+    try:
+        break_duration_seconds = int(break_duration_text.strip()) * 60
+    except ValueError:
+        break_duration_seconds = 420
+
+    try:
+        break_after_levels = {int(x.strip()) for x in break_levels_text.split(',')}
+    except ValueError:
+        break_after_levels = set()
+    return break_after_levels, break_duration_seconds
+
+
 class HoldemTimerApp(App):
-    total_time = NumericProperty(0)
-    level_time = NumericProperty(0)
+    # 토너먼트 상태는 self.tournament(Tournament)가 갖고, 앱은 화면 표시만 담당합니다.
+    # is_paused / players 는 KV 바인딩을 위해 엔진 값을 그대로 비춰 둡니다.
+    tournament = ObjectProperty(None)
     is_paused = BooleanProperty(True)
-    time_to_next_break_seconds = NumericProperty(0)
-    
-    schedule = []
-    current_schedule_index = NumericProperty(0)
-    
     players = NumericProperty(0)
-    total_players = NumericProperty(0)
-    total_chips = NumericProperty(0)
-    avr_stack = NumericProperty(0)
-    entrants = ListProperty([])
 
     total_time_str = StringProperty("00:00:00")
     level_time_str = StringProperty("00:00")
@@ -432,168 +1007,447 @@ class HoldemTimerApp(App):
     next_blinds_str = StringProperty("Next: 0/0")
     next_break_str = StringProperty("...")
     next_break_time_str = StringProperty("00:00:00")
+    forecast_str = StringProperty("")
+    players_forecast_str = StringProperty("")
     total_chips_str = StringProperty("0")
     total_chips_bb_str = StringProperty("(0 BB)")
     avr_stack_str = StringProperty("0")
     avr_stack_bb_str = StringProperty("(0 BB)")
     players_str = StringProperty("0/0")
-    
-    sounds = {}
+    # Prize 패널의 1~5등 상금 (입상하지 않는 순위는 '-')
+    prize_strs = ListProperty(['0'] * 5)
     
     level_up_sound_path = StringProperty("levelup.mp3")
     break_start_sound_path = StringProperty("break.mp3")
     _sound_to_update = StringProperty(None, allownone=True)
     scroll_event = ObjectProperty(None, allownone=True)
-    blind_setting_widgets = ListProperty([])
+    # 블라인드 설정 화면의 데이터 (레벨마다 small/big/ante/duration(분) dict)
+    blind_levels = ListProperty([])
     
+    # 표시 전용 기기에서는 조작 버튼을 막습니다.
+    read_only = BooleanProperty(False)
+    can_undo = BooleanProperty(False)
+    can_redo = BooleanProperty(False)
+
     level_label_color = ListProperty([1, 1, 1, 1])
     blinds_label_color = ListProperty([1, 1, 1, 1])
 
 
     def build(self):
+        self.startup = StartupTimer(STARTED_AT)
+        self.startup.mark('imports')
         self.title = 'Holdem Poker Timer'
-        return Builder.load_string(KV)
-
+        self.power = PowerGovernor(self.on_power_mode, os.environ.get(POWER_ENV) != 'full')
+        instrument.install(self)
+        self.timer_screen = None
+        self._dirty_ui = set()
+        self._flush_ui_trigger = Clock.create_trigger(self.flush_ui)
+        self._check_scroll_trigger = Clock.create_trigger(self.check_scroll_necessity, 0.1)
+        self._chart_trigger = Clock.create_trigger(self.update_chart)
+        self._tick_event = None
+        self._scroll_step_event = None
+        self.sound_bank = SoundBank()
+        # 종료 시각 예측은 백그라운드 스레드에서 계산하고, 상태 변화가 몰려도 잠시 모아서 한 번만 요청합니다.
+        # NumPy를 불러오는 데 시간이 걸리므로 Forecaster는 첫 요청 때 만듭니다.
+        self.forecaster = None
+        self._forecast_trigger = Clock.create_trigger(self.request_forecast, FORECAST_DELAY)
+        # 모든 이벤트의 레벨 종료는 Runtime의 힙 하나로 관리하고, 화면/효과음/예측은
+        # self.tournament(대시보드에서 고른 이벤트)만 따라갑니다.
+        self.runtime = Runtime(wakeup=self.arm_runtime)
+        self._runtime_event = None
+        self._dashboard_event = None
+        self.journals = {}
+        self.histories = {}
+        self.series = {}
+        self._library = None
+        self.broadcaster = None
+        self.display_client = None
+        display = os.environ.get(DISPLAY_ENV)
+        if display:
+            # 표시 전용 기기는 서버 상태를 따라가기만 하므로 저널을 남기지 않습니다.
+            self.read_only = True
+            self.resumed = False
+            tournament = self.runtime.add(MAIN_EVENT_NAME, Tournament())
+            self.series[tournament] = TimeSeries()
+            self.series[tournament].attach(tournament)
+            host, _, port = display.partition(':')
+            self.display_client = DisplayClient(tournament, host, int(port or BROADCAST_PORT), self.apply_broadcast)
+        else:
+            self.resumed = self.open_event(MAIN_EVENT_NAME, os.path.join(self.user_data_dir, 'journal'))
+        events_dir = os.path.join(self.user_data_dir, EVENTS_DIR)
+        if not display and os.path.isdir(events_dir):
+            for directory in sorted((d for d in os.listdir(events_dir) if d.startswith('event-')),
+                                   key=lambda d: int(d.split('-')[-1])):
+                self.open_event(f"Event {directory.split('-')[-1]}", os.path.join(events_dir, directory))
+        self.tournament = self.runtime.events[0][1]
+        self.tournament.bind(self.on_tournament_event)
+        if os.environ.get(BROADCAST_ENV):
+            self.broadcaster = BroadcastServer(port=int(os.environ[BROADCAST_ENV]))
+            self.broadcaster.follow(self.tournament)
+        self.startup.mark('engine')
+        root = Builder.load_string(KV)
+        self.startup.mark('build')
+        return root
+
+    def open_event(self, name, directory):
+        # 비정상 종료 후라면 저널을 재생해 마지막 상태(현재 시각 기준)로 되돌립니다.
+        tournament = Tournament()
+        journal = Journal(directory)
+        resumed = journal.replay(tournament)
+        journal.attach(tournament)
+        if resumed:
+            journal.compact()
+        self.journals[tournament] = journal
+        history = History()
+        history.attach(tournament)
+        self.histories[tournament] = history
+        self.series[tournament] = TimeSeries()
+        self.series[tournament].attach(tournament)
+        self.runtime.add(name, tournament)
+        return resumed
+
+    @timed()
     def build_blind_settings_ui(self):
-        grid = self.root.get_screen('settings').ids.blind_grid
-        if self.blind_setting_widgets:
-            return
-        grid.clear_widgets()
-        self.blind_setting_widgets = []
-        
-        lines = DEFAULT_BLIND_STRUCTURE.strip().split('\n')
-
-        for i, line in enumerate(lines):
-            try:
-                s, b, a, d = line.split('/')
-            except ValueError:
-                continue
+        if not self.blind_levels:
+            # 지난번 PLAY 때의 구조가 있으면 그것으로, 없으면 기본 구조로 시작합니다.
+            structure = self.get_library().load(LAST_STRUCTURE_NAME)
+            if structure:
+                self.apply_structure(structure)
+                return
+            self.blind_levels = parse_blind_structure(DEFAULT_BLIND_STRUCTURE)
+        self.refresh_blind_grid()
+
+    def refresh_blind_grid(self):
+        # RecycleView의 data는 blind_levels의 dict를 그대로 공유하므로, 같은 dict들의 값만 바뀐 경우에는
+        # refresh_from_data로 보이는 줄만 다시 채웁니다. 구조를 불러오거나 생성해 dict가 바뀌었으면
+        # 개수가 같아도 다시 연결해야 화면과 입력이 새 모델을 가리킵니다.
+        rv = self.root.get_screen('settings').ids.blind_grid
+        if len(rv.data) != len(self.blind_levels) or any(
+                shown is not level for shown, level in zip(rv.data, self.blind_levels)):
+            rv.data = self.blind_levels
+        else:
+            rv.refresh_from_data()
 
-            row_widgets = {}
-            grid.add_widget(Label(text=str(i + 1), size_hint_y=None, height=40))
-            
-            small_input = TextInput(text=f"{int(s):,}", multiline=False, input_filter='int', size_hint_y=None, height=40)
-            big_input = TextInput(text=f"{int(b):,}", multiline=False, input_filter='int', size_hint_y=None, height=40)
-            ante_input = TextInput(text=f"{int(a):,}", multiline=False, input_filter='int', size_hint_y=None, height=40)
-            duration_input = TextInput(text=d, multiline=False, input_filter='int', size_hint_y=None, height=40)
-            
-            small_input.bind(focus=self.format_text_input)
-            big_input.bind(focus=self.format_text_input)
-            ante_input.bind(focus=self.format_text_input)
-
-            row_widgets['small'] = small_input
-            row_widgets['big'] = big_input
-            row_widgets['ante'] = ante_input
-            row_widgets['duration'] = duration_input
-            
-            grid.add_widget(small_input)
-            grid.add_widget(big_input)
-            grid.add_widget(ante_input)
-            grid.add_widget(duration_input)
-
-            apply_button = Button(text='Apply Below', size_hint_y=None, height=40)
-            apply_button.bind(on_press=partial(self.apply_duration_below, i))
-            grid.add_widget(apply_button)
-            
-            self.blind_setting_widgets.append(row_widgets)
+    def store_blind_input(self, index, field, text):
+        # 입력하는 대로 모델에 반영합니다. 포커스는 터치가 끝난 뒤에야 풀리므로 포커스 해제 때 반영하면
+        # 같은 터치의 버튼(on_press)이 바뀌기 전 값을 읽습니다. 빈칸처럼 숫자가 아닌 동안은 그대로 둡니다.
+        try:
+            self.blind_levels[index][field] = int(text.replace(',', ''))
+        except (ValueError, IndexError):
+            pass
 
-    def format_text_input(self, instance, is_focused):
-        if not is_focused:
-            try:
-                num = int(instance.text.replace(',', ''))
-                instance.text = f"{num:,}"
-            except (ValueError, TypeError):
-                instance.text = '0'
+    def commit_blind_input(self, index, field, instance):
+        level = self.blind_levels[index]
+        try:
+            value = int(instance.text.replace(',', ''))
+        except (ValueError, TypeError):
+            value = level['duration'] if field == 'duration' else 0
+        level[field] = value
+        instance.text = str(value) if field == 'duration' else f"{value:,}"
 
-    def apply_duration_below(self, start_index, instance):
+    def apply_duration_below(self, start_index):
         try:
-            duration_to_apply = self.blind_setting_widgets[start_index]['duration'].text
-            for i in range(start_index + 1, len(self.blind_setting_widgets)):
-                self.blind_setting_widgets[i]['duration'].text = duration_to_apply
+            duration_to_apply = self.blind_levels[start_index]['duration']
         except IndexError:
-            pass
+            return
+        for level in self.blind_levels[start_index + 1:]:
+            level['duration'] = duration_to_apply
+        self.refresh_blind_grid()
 
     def set_all_durations(self, duration):
-        for row in self.blind_setting_widgets:
-            row['duration'].text = duration
+        try:
+            duration = int(duration)
+        except ValueError:
+            return
+        for level in self.blind_levels:
+            level['duration'] = duration
+        self.refresh_blind_grid()
+
+    @timed()
+    def generate_blind_structure(self, players_text, end_text, chips_text, break_levels_text, break_duration_text):
+        # 지금 시작해 end_text(HH:MM) 무렵에 끝나도록 블라인드 구조를 새로 만듭니다.
+        try:
+            field_size = int(players_text)
+            hours, minutes = (int(x) for x in end_text.strip().split(':'))
+            denominations = [int(x.replace(',', '')) for x in chips_text.split(',') if x.strip()]
+        except ValueError:
+            print(f"Invalid generator settings: '{players_text}', '{end_text}', '{chips_text}'")
+            return
+        if field_size < 2 or not denominations:
+            return
+        now = time.localtime()
+        target = (hours * 60 + minutes - now.tm_hour * 60 - now.tm_min) % (24 * 60) * 60
+        if target <= 0:
+            return
+        break_after_levels, break_duration_seconds = parse_break_settings(break_levels_text, break_duration_text)
+        # 구조 생성기는 NumPy를 쓰므로 시작할 때가 아니라 처음 Generate를 누를 때 불러옵니다.
+        from structure_gen import generate_structure
+        levels = generate_structure(field_size, target, denominations,
+                                    break_after_levels=break_after_levels,
+                                    break_minutes=break_duration_seconds / 60)
+        if not levels:
+            print("Could not generate a blind structure for these settings")
+            return
+        self.blind_levels = levels
+        self.refresh_blind_grid()
 
     def on_start(self):
+        from kivy.core.window import Window
+        # 설정 화면 표(RecycleView)는 첫 프레임을 그린 다음에 채웁니다.
         Clock.schedule_once(lambda dt: self.build_blind_settings_ui())
-        self.total_players = self.players
-        self.total_chips = self.players * 40000
-        self.update_avr_stack()
+        Clock.schedule_interval(self.housekeeping, JOURNAL_FLUSH_INTERVAL)
+        # PLAY를 누르기 전에 미리 백그라운드에서 효과음을 디코딩해 둡니다.
+        self.load_sounds()
+        if self.display_client:
+            self.display_client.start()
+        if self.resumed and self.tournament.schedule:
+            self.show_tournament(self.tournament)
+            self.show_timer()
+        self.update_ui()
+        self.startup.mark('start')
+        Window.bind(on_flip=self.on_first_frame)
+        Window.bind(on_key_down=self.on_key_down)
+        self.power.attach(Window)
+
+    def on_first_frame(self, window):
+        window.unbind(on_flip=self.on_first_frame)
+        self.startup.mark('first_frame')
+        self.startup.report(FIRST_FRAME_BUDGET)
+
+    def on_key_down(self, window, key, scancode, codepoint, modifiers):
+        # Timer 화면에는 글자 입력칸이 없으므로 그 화면에서만 단축키를 받습니다.
+        if not self.timer_screen or self.root.current != 'timer' or 'ctrl' not in modifiers:
+            return False
+        if key == UNDO_KEY and 'shift' not in modifiers:
+            self.undo()
+        elif key == REDO_KEY or key == UNDO_KEY:
+            self.redo()
+        else:
+            return False
+        return True
+
+    def show_timer(self):
+        if self.timer_screen is None:
+            Builder.load_string(TIMER_KV)
+            self.timer_screen = TimerScreen(name='timer')
+            self.root.add_widget(self.timer_screen)
+            self.refresh_entrants()
+            self.timer_screen.ids.trend_chart.set_series(self.series.get(self.tournament))
+            self.update_ui()
+        self.root.current = 'timer'
+
+    def show_event_screen(self):
+        if self.tournament.schedule:
+            self.show_timer()
+        else:
+            self.root.current = 'settings'
+
+    def housekeeping(self, dt):
+        # 저널 fsync와 깨어난 횟수 표본을 같은 타이머에서 처리해 루프를 따로 깨우지 않습니다.
+        self.flush_journal()
+        self.power.sample()
+
+    def flush_journal(self, dt=None):
+        for journal in self.journals.values():
+            journal.flush()
+
+    def on_power_mode(self, idle):
+        # 자동 스크롤을 애니메이션과 건너뛰기 중 현재 모드에 맞는 쪽으로 바로 바꿉니다.
+        # 애니메이션이 남아 있으면 저전력 모드에서도 루프가 매 프레임 깨어납니다.
+        self.check_scroll_necessity(0)
+
+    def on_pause(self):
+        self.flush_journal()
+        return True
+
+    def on_stop(self):
+        self.power.sample()
+        self.power.report()
+        for journal in self.journals.values():
+            journal.close()
+        if self._library:
+            self._library.close()
+        if self.broadcaster:
+            self.broadcaster.close()
+        if self.display_client:
+            self.display_client.stop()
+
+    @mainthread
+    def apply_broadcast(self, func, *args):
+        # 수신 스레드에서 받은 메시지를 UI 스레드에서 반영합니다.
+        func(*args)
+
+    # 여러 이벤트
+
+    def arm_runtime(self, deadline=None):
+        # 모든 이벤트의 다음 레벨 종료 시각 중 가장 이른 때에 한 번만 깨어납니다.
+        if self._runtime_event:
+            self._runtime_event.cancel()
+            self._runtime_event = None
+        wakeup = self.runtime.next_wakeup()
+        if wakeup is not None:
+            self._runtime_event = Clock.schedule_once(self.run_runtime, max(0, wakeup - self.runtime.clock()))
+
+    def run_runtime(self, dt):
+        self._runtime_event = None
+        self.runtime.run_due()
+        self.arm_runtime()
+
+    def show_tournament(self, tournament):
+        if tournament is not self.tournament:
+            self.tournament.unbind(self.on_tournament_event)
+            self.sound_bank.cancel()
+            self.tournament = tournament
+            tournament.bind(self.on_tournament_event)
+            if self.broadcaster:
+                self.broadcaster.follow(tournament)
+        self.is_paused = tournament.is_paused
+        self.players = tournament.players
+        self.refresh_history_state()
+        self.refresh_entrants()
+        if self.timer_screen:
+            self.timer_screen.ids.trend_chart.set_series(self.series.get(tournament))
+        self.schedule_tick()
+        self.schedule_boundary_sound()
+        self._forecast_trigger()
+        self.update_ui()
+
+    def promote_event(self, index):
+        tournament = self.runtime.events[index][1]
+        self.show_tournament(tournament)
+        self.show_event_screen()
+
+    def new_event(self):
+        events_dir = os.path.join(self.user_data_dir, EVENTS_DIR)
+        number = len(self.runtime.events) + 1
+        while os.path.exists(os.path.join(events_dir, f"event-{number}")):
+            number += 1
+        self.open_event(f"Event {number}", os.path.join(events_dir, f"event-{number}"))
+        self.promote_event(len(self.runtime.events) - 1)
+
+    def start_dashboard(self):
+        self.refresh_dashboard()
+        self._dashboard_event = Clock.schedule_interval(self.refresh_dashboard, 1)
+
+    def stop_dashboard(self):
+        if self._dashboard_event:
+            self._dashboard_event.cancel()
+            self._dashboard_event = None
+
+    def refresh_dashboard(self, dt=None):
+        rows = []
+        for i, (name, t) in enumerate(self.runtime.events):
+            item = t.current_item()
+            if not t.schedule:
+                level = '-'
+            elif item.get('is_break'):
+                level = 'BREAK'
+            else:
+                level = f"Level {item.get('level', 1)}"
+            time_text = self.format_time(math.ceil(max(0, t.level_remaining())))
+            rows.append({
+                'index': i,
+                'name_text': f"> {name}" if t is self.tournament else name,
+                'level_text': level,
+                'time_text': f"{time_text} (paused)" if t.is_paused else time_text,
+                'players_text': f"{t.players}/{t.total_players}",
+            })
+        self.root.get_screen('dashboard').ids.event_list.data = rows
 
     def reset_game(self):
-        self.is_paused = True
-        Clock.unschedule(self.update)
         self.stop_scrolling_entrants()
-        self.total_time = 0
-        self.level_time = 0
-        self.time_to_next_break_seconds = 0
-        self.current_schedule_index = 0
-        self.players = 0
-        self.total_players = 0
-        self.total_chips = 0
-        self.schedule = []
-        self.sounds = {}
-        self.entrants = []
-        self.update_ui()
-        if self.root:
-            timer_screen = self.root.get_screen('timer')
-            if timer_screen:
-                timer_screen.ids.play_pause_button.text = '>'
+        self.tournament.reset()
 
+    @timed()
     def setup_blinds(self, break_levels_text, break_duration_text):
-        self.schedule = []
+        schedule = self.build_schedule_from_settings(break_levels_text, break_duration_text)
+        self.store_structure(LAST_STRUCTURE_NAME, break_levels_text, break_duration_text, schedule)
+        self.load_sounds()
+        self.tournament.setup(schedule)
+
+    def build_schedule_from_settings(self, break_levels_text, break_duration_text):
         temp_blinds = []
+        break_after_levels, break_duration_seconds = parse_break_settings(break_levels_text, break_duration_text)
+
+        for i, row in enumerate(self.blind_levels):
+            temp_blinds.append({'level': i + 1, 'small': row['small'], 'big': row['big'],
+                                'ante': row['ante'], 'duration': row['duration'] * 60})
         
+        return build_schedule(temp_blinds, break_after_levels, break_duration_seconds)
+
+    # 구조 라이브러리
+
+    def get_library(self):
+        # 처음 저장하거나 불러올 때 엽니다.
+        if self._library is None:
+            self._library = StructureLibrary(os.path.join(self.user_data_dir, LIBRARY_FILE))
+        return self._library
+
+    def store_structure(self, name, break_levels_text, break_duration_text, schedule):
+        self.get_library().save(name, self.blind_levels, break_levels_text, break_duration_text,
+                                self.level_up_sound_path, self.break_start_sound_path,
+                                STARTING_STACK, sum(item['duration'] for item in schedule))
+
+    def save_structure(self, name):
+        name = name.strip()
+        if not name:
+            return
+        ids = self.root.get_screen('settings').ids
+        schedule = self.build_schedule_from_settings(ids.break_levels_input.text, ids.break_duration_input.text)
+        self.store_structure(name, ids.break_levels_input.text, ids.break_duration_input.text, schedule)
+        self.refresh_library()
+
+    def load_structure(self, name):
+        structure = self.get_library().load(name)
+        if structure is None:
+            print(f"Structure '{name}' not found in the library")
+            return
+        self.apply_structure(structure)
+        self.root.current = 'settings'
+
+    def apply_structure(self, structure):
+        ids = self.root.get_screen('settings').ids
+        ids.break_levels_input.text = structure['break_levels']
+        ids.break_duration_input.text = structure['break_duration']
+        if structure['level_up_sound']:
+            self.level_up_sound_path = structure['level_up_sound']
+        if structure['break_sound']:
+            self.break_start_sound_path = structure['break_sound']
+        self.load_sounds()
+        self.blind_levels = structure['levels']
+        self.refresh_blind_grid()
+
+    def delete_structure(self, name):
+        self.get_library().delete(name)
+        self.refresh_library()
+
+    def search_library(self, name_text, stack_text, hours_text):
         try:
-            break_duration_seconds = int(break_duration_text.strip()) * 60
-        except ValueError:
-            break_duration_seconds = 420
-            
-        try:
-            break_after_levels = {int(x.strip()) for x in break_levels_text.split(',')}
+            starting_stack = int(stack_text) if stack_text.strip() else None
+            max_seconds = float(hours_text) * 3600 if hours_text.strip() else None
         except ValueError:
-            break_after_levels = set()
-
-        for i, row in enumerate(self.blind_setting_widgets):
-            try:
-                small = int(row['small'].text.replace(',', ''))
-                big = int(row['big'].text.replace(',', ''))
-                ante = int(row['ante'].text.replace(',', ''))
-                duration = int(row['duration'].text)
-                temp_blinds.append({'level': i + 1, 'small': small, 'big': big, 'ante': ante, 'duration': duration * 60})
-            except (ValueError, KeyError):
-                print(f"Skipping invalid blind format in row {i+1}")
-                continue
-        
-        for i, level_info in enumerate(temp_blinds):
-            self.schedule.append(level_info)
-            if level_info['level'] in break_after_levels and i < len(temp_blinds) - 1:
-                self.schedule.append({'is_break': True, 'level': 'Break', 'duration': break_duration_seconds})
-
-        self.sounds = {}
-        sound_files = {
-            'level_up': self.level_up_sound_path,
-            'break_start': self.break_start_sound_path
-        }
-        for key, path in sound_files.items():
-            if path and os.path.exists(path):
-                self.sounds[key] = SoundLoader.load(path)
-                if not self.sounds[key]:
-                    print(f"Error: Could not load sound file '{path}'")
-            elif path:
-                print(f"Warning: Sound file '{path}' not found.")
-
-        self.current_schedule_index = 0
-        self.reset_level_timer()
-        self.calculate_time_to_next_break()
-        self.update_ui()
+            return
+        rows = []
+        for found in self.get_library().search(name_text.strip(), starting_stack, max_seconds):
+            rows.append({
+                'name_text': found['name'],
+                'info_text': f"{found['starting_stack']:,} chips / {found['level_count']} levels / "
+                             f"{self.format_time(found['total_seconds'], with_hours=True)}",
+            })
+        self.root.get_screen('library').ids.structure_list.data = rows
+
+    def refresh_library(self):
+        ids = self.root.get_screen('library').ids
+        self.search_library(ids.search_name_input.text, ids.search_stack_input.text, ids.search_hours_input.text)
+
+    def load_sounds(self):
+        # 이미 캐시에 있는 파일은 다시 불러오지 않습니다.
+        self.sound_bank.assign('level_up', self.level_up_sound_path)
+        self.sound_bank.assign('break_start', self.break_start_sound_path)
 
     def choose_sound(self, sound_type):
         self._sound_to_update = sound_type
-        filechooser.open_file(on_selection=self.handle_selection, filters=['*.wav', '*.mp3', '*.ogg'])
+        open_file(on_selection=self.handle_selection, filters=['*.wav', '*.mp3', '*.ogg'])
 
     def handle_selection(self, selection):
         if not selection:
@@ -604,118 +1458,211 @@ class HoldemTimerApp(App):
             self.level_up_sound_path = path
         elif self._sound_to_update == 'break_start':
             self.break_start_sound_path = path
+        self.load_sounds()
         
         self.root.get_screen('settings').ids.level_up_sound_label.text = self.get_filename(self.level_up_sound_path)
         self.root.get_screen('settings').ids.break_start_sound_label.text = self.get_filename(self.break_start_sound_path)
 
 
+    def choose_registrations(self):
+        open_file(on_selection=self.import_registrations, filters=['*.csv', '*.jsonl', '*.json'])
+
+    @mainthread
+    def import_registrations(self, selection):
+        if not selection:
+            return
+        path = selection[0]
+        try:
+            registrations, errors = ingest(self.tournament, path)
+        except OSError as e:
+            print(f"Error: Could not read registrations from '{path}': {e}")
+            return
+        for number, error in errors:
+            print(f"Skipping invalid registration in row {number}: {error}")
+        print(f"Imported {len(registrations)} registration(s) from '{path}'")
+
     def get_filename(self, path):
         if not path:
             return ''
         return os.path.basename(path)
 
+    @timed()
     def play_sound(self, key):
-        if key in self.sounds and self.sounds[key]:
-            self.sounds[key].play()
-
-    def start_timer(self):
-        Clock.schedule_interval(self.update, 1)
+        self.sound_bank.play(key)
+
+    def transition_sound(self, prev_is_break, new_is_break):
+        if new_is_break:
+            return None if prev_is_break else 'break_start'
+        return 'level_up'
+
+    def schedule_boundary_sound(self):
+        # 다음 레벨 종료 시각에 맞춰 효과음을 예약해 화면 전환과 같은 순간에 울리게 합니다.
+        t = self.tournament
+        deadline = t.next_deadline()
+        key = None
+        if deadline is not None and t.current_index < len(t.schedule) - 1:
+            key = self.transition_sound(t.schedule.is_break(t.current_index), t.schedule.is_break(t.current_index + 1))
+        if key:
+            self.sound_bank.schedule(key, deadline, deadline - t.clock())
+        else:
+            self.sound_bank.cancel()
+
+    @timed(by_first_arg=True)
+    def on_tournament_event(self, event, *args):
+        if event in ('clock', 'level', 'schedule', 'stats'):
+            self._forecast_trigger()
+        if event == 'clock':
+            self.is_paused = self.tournament.is_paused
+            self.schedule_tick()
+            self.schedule_boundary_sound()
+            self.mark_dirty(UI_CLOCK)
+        elif event == 'level':
+            prev_item, new_item, advanced, started_at = args
+            if advanced:
+                key = self.transition_sound(prev_item.get('is_break'), new_item.get('is_break'))
+                if key:
+                    self.sound_bank.boundary_reached(key, started_at)
+            self.mark_dirty(UI_CLOCK, UI_LEVEL)
+            self._chart_trigger()
+        elif event == 'schedule':
+            self.update_ui()
+            self._chart_trigger()
+            if self.read_only and self.tournament.schedule and self.root:
+                self.show_timer()
+        elif event == 'stats':
+            self.players = self.tournament.players
+            self.mark_dirty(UI_STATS)
+            self._chart_trigger()
+        elif self.timer_screen is None and (event.startswith('entrant') or event == 'players_changed'):
+            # Entry 목록은 Timer 화면을 만들 때 한꺼번에 채웁니다.
+            pass
+        elif event == 'entrant_added':
+            self.get_entrant_data().insert(args[0], self.entrant_view(args[0]))
+            self._check_scroll_trigger()
+        elif event == 'entrants_added':
+            # RecycleView는 중간에 여러 줄을 끼워 넣는 변경(슬라이스 대입)을 처리하지 못하므로
+            # 끝에 붙이는 경우가 아니면(되돌리기로 되살린 경우) 목록을 다시 만듭니다.
+            data = self.get_entrant_data()
+            if args[0] == len(data):
+                data.extend(self.entrant_view(i) for i in range(args[0], args[0] + len(args[1])))
+                self._check_scroll_trigger()
+            else:
+                self.refresh_entrants()
+        elif event == 'entrant_removed':
+            del self.get_entrant_data()[args[0]]
+            self._check_scroll_trigger()
+        elif event in ('entrant_renamed', 'players_changed'):
+            data = self.get_entrant_data()
+            for index in ([args[0]] if event == 'entrant_renamed' else set(args[0])):
+                data[index] = self.entrant_view(index)
+        elif event == 'entrants_reset':
+            self.refresh_entrants()
+        elif event == 'command':
+            self.refresh_history_state()
+
+    def update_chart(self, dt=None):
+        if self.timer_screen:
+            self.timer_screen.ids.trend_chart.update()
+
+    def request_forecast(self, dt=None):
+        if self.forecaster is None:
+            from forecast import Forecaster
+            self.forecaster = Forecaster(self.on_forecast)
+        self.forecaster.request(self.tournament)
+
+    @mainthread
+    def on_forecast(self, result):
+        if result is None:
+            self.forecast_str = ""
+            self.players_forecast_str = ""
+            return
 
+        def at(seconds):
+            return time.strftime('%H:%M', time.localtime(result['requested_at'] + seconds))
+
+        low, mid, high = result['finish']
+        lines = [f"End ~{at(mid)} ({at(low)}-{at(high)})"]
+        from forecast import FINAL_TABLE_SIZE
+        milestones = []
+        for label, count in (('Money', result['money']), ('Final table', FINAL_TABLE_SIZE)):
+            reached = result['milestones'].get(count)
+            if reached:
+                milestones.append(f"{label} ~{at(reached[1])}")
+        if milestones:
+            lines.append(', '.join(milestones))
+        self.forecast_str = '\n'.join(lines)
+        # 지금 레벨과 다음 레벨이 끝날 때 남을 인원의 중앙값(하위-상위 밴드)
+        self.players_forecast_str = '\n'.join(
+            f"{label} ~{median:.0f} ({lower:.0f}-{upper:.0f})"
+            for label, (index, lower, median, upper) in zip(('Level end', 'Next'), result['levels']))
+
+    @timed()
+    def schedule_tick(self):
+        # 화면의 초 표시가 바뀌는 시점에 맞춰 다음 틱을 예약하므로 틱 간격과 무관하게 오차가 쌓이지 않습니다.
+        if self._tick_event:
+            self._tick_event.cancel()
+            self._tick_event = None
+        if not self.tournament.is_paused:
+            self._tick_event = Clock.schedule_once(self.update, self.tournament.next_tick_delay())
+
+    @timed()
     def update(self, dt):
-        if self.is_paused:
-            return
-        self.level_time -= 1
-        self.total_time += 1
-        if self.time_to_next_break_seconds > 0:
-            self.time_to_next_break_seconds -= 1
-        if self.level_time <= 0:
-            self.next_level()
-        self.update_ui()
+        self.tournament.tick()
 
     def toggle_pause(self):
-        self.is_paused = not self.is_paused
-        if self.is_paused:
-            Clock.unschedule(self.update)
-        else:
-            self.start_timer()
-        self.root.get_screen('timer').ids.play_pause_button.text = '>' if self.is_paused else '||'
+        self.tournament.toggle_pause()
 
     def next_level(self):
-        prev_item = self.get_current_schedule_item()
-        if self.current_schedule_index < len(self.schedule) - 1:
-            self.current_schedule_index += 1
-            self.reset_level_timer()
-            
-            new_item = self.get_current_schedule_item()
-            if new_item.get('is_break') and not prev_item.get('is_break'):
-                self.play_sound('break_start')
-            elif not new_item.get('is_break'):
-                self.play_sound('level_up')
-        else:
-            self.is_paused = True
-            
-        self.calculate_time_to_next_break()
-        self.update_ui()
+        self.tournament.next_level()
 
     def prev_level(self):
-        if self.current_schedule_index > 0:
-            self.current_schedule_index -= 1
-            self.reset_level_timer()
-        self.calculate_time_to_next_break()
-        self.update_ui()
+        self.tournament.prev_level()
 
-    def reset_level_timer(self):
-        current_item = self.get_current_schedule_item()
-        self.level_time = current_item.get('duration', 600)
-    
     def adjust_time(self, seconds):
-        self.level_time += seconds
-        if self.level_time < 0:
-            self.level_time = 0
-        self.calculate_time_to_next_break()
-        self.update_ui()
+        self.tournament.adjust_time(seconds)
 
     def seek_time(self, value):
-        current_item = self.get_current_schedule_item()
-        duration = current_item.get('duration', 1)
-        self.level_time = duration * (1 - value)
-        self.calculate_time_to_next_break()
-        self.update_ui()
+        self.tournament.seek(value)
 
-    def get_current_schedule_item(self):
-        if not self.schedule or self.current_schedule_index >= len(self.schedule):
-             return {'level': 1, 'small': 0, 'big': 0, 'ante': 0, 'duration': 600}
-        return self.schedule[self.current_schedule_index]
-
-    def get_next_blinds_info(self):
-        for i in range(self.current_schedule_index + 1, len(self.schedule)):
-            if not self.schedule[i].get('is_break'):
-                return self.schedule[i]
-        return None
-
-    def calculate_time_to_next_break(self):
-        current_item = self.get_current_schedule_item()
-        if not self.schedule or current_item.get('is_break'):
-            self.time_to_next_break_seconds = 0
-            return
+    def end_seek(self):
+        history = self.histories.get(self.tournament)
+        if history:
+            history.seal()
 
-        time_left = self.level_time
-        for i in range(self.current_schedule_index + 1, len(self.schedule)):
-            next_item = self.schedule[i]
-            if next_item.get('is_break'):
-                self.time_to_next_break_seconds = time_left
-                return
-            else:
-                time_left += next_item.get('duration', 0)
-        
-        self.time_to_next_break_seconds = 0
+    def mark_dirty(self, *fields):
+        # 상태가 바뀐 항목만 표시해 두고, 실제 문자열 갱신은 프레임마다 한 번 flush_ui에서 합니다.
+        self._dirty_ui.update(fields)
+        self._flush_ui_trigger()
 
     def update_ui(self):
-        self.total_time_str = self.format_time(self.total_time, with_hours=True)
-        self.level_time_str = self.format_time(self.level_time)
-        self.next_break_time_str = self.format_time(self.time_to_next_break_seconds, with_hours=True)
+        self.mark_dirty(UI_CLOCK, UI_LEVEL, UI_STATS)
 
-        current_item = self.get_current_schedule_item()
+    @timed()
+    def flush_ui(self, dt=None):
+        dirty = self._dirty_ui
+        if not dirty or not self.root:
+            return
+        self._dirty_ui = set()
+        if UI_CLOCK in dirty:
+            self.render_clock()
+        if UI_LEVEL in dirty:
+            self.render_level(self.tournament.current_item())
+        if UI_LEVEL in dirty or UI_STATS in dirty:
+            self.render_stats()
+
+    def render_clock(self):
+        # 남은 시간은 올림, 경과 시간은 내림으로 표시해야 두 값이 같은 순간에 바뀝니다.
+        t = self.tournament
+        level_time = t.level_remaining()
+        self.total_time_str = self.format_time(t.total_elapsed(), with_hours=True)
+        self.level_time_str = self.format_time(math.ceil(level_time))
+        self.next_break_time_str = self.format_time(math.ceil(t.time_to_next_break()), with_hours=True)
+
+        duration = t.current_duration()
+        if duration > 0 and self.timer_screen:
+            self.timer_screen.ids.time_slider.value = 1 - (level_time / duration)
+
+    def render_level(self, current_item):
         if current_item.get('is_break'):
             self.level_str = "BREAK"
             self.blinds_str = "Tournament is paused"
@@ -733,21 +1680,14 @@ class HoldemTimerApp(App):
             self.level_label_color = [1, 1, 1, 1]
             self.blinds_label_color = [1, 1, 1, 1]
 
-            levels_left = 0
-            found_break = False
-            for item in self.schedule[self.current_schedule_index:]:
-                if item.get('is_break'):
-                    found_break = True
-                    break
-                if not item.get('is_break'):
-                    levels_left += 1
-            
-            if found_break:
-                 self.next_break_str = f"{levels_left} level(s) left"
+            t = self.tournament
+            if t.schedule.has_break_after(t.current_index):
+                levels_left = t.schedule.levels_until_break(t.current_index)
+                self.next_break_str = f"{levels_left} level(s) left"
             else:
-                 self.next_break_str = "No more breaks"
+                self.next_break_str = "No more breaks"
 
-        next_blinds = self.get_next_blinds_info()
+        next_blinds = self.tournament.next_blinds()
         if next_blinds:
             level = next_blinds.get('level', 1)
             small = next_blinds.get('small', 0)
@@ -758,31 +1698,25 @@ class HoldemTimerApp(App):
         else:
             self.next_blinds_str = "Last Level"
 
-        self.total_chips_str = f"{self.total_chips:,}"
-        self.avr_stack_str = f"{self.avr_stack:,}"
-        self.players_str = f"{self.players}/{self.total_players}"
-
-        big_blind = 0
-        if current_item.get('is_break'):
-            if self.current_schedule_index > 0:
-                prev_level_info = self.schedule[self.current_schedule_index - 1]
-                big_blind = prev_level_info.get('big', 0)
-        else:
-            big_blind = current_item.get('big', 0)
+    def render_stats(self):
+        t = self.tournament
+        self.total_chips_str = f"{t.total_chips:,}"
+        self.avr_stack_str = f"{t.avr_stack:,}"
+        self.players_str = f"{t.players}/{t.total_players}"
+        payouts = payout_table(t.total_players, t.prize_pool)
+        self.prize_strs = [f"{payouts[i]:,}" if i < len(payouts) else ('-' if payouts else '0')
+                           for i in range(len(self.prize_strs))]
 
+        big_blind = t.current_big_blind()
         if big_blind > 0:
-            total_chips_bb = round(self.total_chips / big_blind, 1)
-            avr_stack_bb = round(self.avr_stack / big_blind, 1)
+            total_chips_bb = round(t.total_chips / big_blind, 1)
+            avr_stack_bb = round(t.avr_stack / big_blind, 1)
             self.total_chips_bb_str = f"({total_chips_bb} BB)"
             self.avr_stack_bb_str = f"({avr_stack_bb} BB)"
         else:
             self.total_chips_bb_str = "(0 BB)"
             self.avr_stack_bb_str = "(0 BB)"
 
-        duration = current_item.get('duration', 1)
-        if duration > 0:
-            self.root.get_screen('timer').ids.time_slider.value = 1 - (self.level_time / duration)
-
     def format_time(self, seconds, with_hours=False):
         m, s = divmod(int(seconds), 60)
         h, m = divmod(m, 60)
@@ -790,9 +1724,15 @@ class HoldemTimerApp(App):
             return f"{h:02d}:{m:02d}:{s:02d}"
         return f"{m:02d}:{s:02d}"
 
+    def set_buy_in(self, text):
+        try:
+            amount = int(text.replace(',', ''))
+        except ValueError:
+            amount = 0
+        self.tournament.set_buy_in(amount)
+
     def add_chips(self, amount):
-        self.total_chips += amount
-        self.update_avr_stack()
+        self.tournament.add_chips(amount)
 
     def add_selected_chips(self, amount_str):
         try:
@@ -803,80 +1743,120 @@ class HoldemTimerApp(App):
 
     def adjust_players(self, amount):
         if amount > 0:
-            self.players += 1
-            self.total_players += 1
-            self.total_chips += 40000
-            self.entrants.append(f"Guest_{self.total_players}")
+            self.tournament.add_player()
         elif amount < 0:
-            if self.players > 1:
-                self.players -= 1
-        self.update_avr_stack()
-
-    def update_avr_stack(self):
-        if self.players > 0:
-            self.avr_stack = math.ceil(self.total_chips / self.players)
-        else:
-            self.avr_stack = 0
-        self.update_ui()
+            self.tournament.remove_player()
     
     def set_heads_up(self):
-        if self.total_players >= 2:
-            self.players = 2
-
-            for i in range(self.current_schedule_index + 1, len(self.schedule)):
-                if not self.schedule[i].get('is_break'):
-                    self.schedule[i]['duration'] = 300
-            
-            self.calculate_time_to_next_break()
-            self.update_avr_stack()
+        self.tournament.set_heads_up()
+
+    def undo(self):
+        history = self.histories.get(self.tournament)
+        if history and not self.read_only:
+            history.undo()
+            self.refresh_history_state()
+
+    def redo(self):
+        history = self.histories.get(self.tournament)
+        if history and not self.read_only:
+            history.redo()
+            self.refresh_history_state()
+
+    def refresh_history_state(self):
+        history = self.histories.get(self.tournament)
+        self.can_undo = bool(history and history.can_undo())
+        self.can_redo = bool(history and history.can_redo())
     
+    @timed()
     def start_scrolling_entrants(self):
         self.stop_scrolling_entrants()
-        self.scroll_event = Clock.schedule_interval(self.scroll_entrants, 1 / 60.)
+        sv = self.timer_screen.ids.entry_scroll
+        grid = self.timer_screen.ids.entry_list
+
+        overflow = grid.height - sv.height
+        if overflow <= 0:
+            return
+        if sv.scroll_y <= 0:
+            sv.scroll_y = 1
+        if self.power.idle:
+            self._scroll_step_event = Clock.schedule_interval(self.step_entrants, ENTRANT_STEP_INTERVAL)
+            return
+        # 목록 길이와 상관없이 같은 픽셀 속도로 내려가도록 남은 거리로 애니메이션 시간을 정합니다.
+        anim = Animation(scroll_y=0, duration=overflow * sv.scroll_y / ENTRANT_SCROLL_SPEED)
+        anim.bind(on_complete=self.restart_scrolling_entrants)
+        anim.start(sv)
+        self.scroll_event = anim
+
+    def restart_scrolling_entrants(self, anim, sv):
+        sv.scroll_y = 1
+        self.start_scrolling_entrants()
+
+    def step_entrants(self, dt):
+        sv = self.timer_screen.ids.entry_scroll
+        overflow = self.timer_screen.ids.entry_list.height - sv.height
+        if overflow <= 0:
+            return
+        # 끝에 닿은 다음 칸에서 처음으로 돌아가 끝 부분도 한 번은 보이게 합니다.
+        sv.scroll_y = 1 if sv.scroll_y <= 0 else max(0, sv.scroll_y - ENTRANT_SCROLL_SPEED * dt / overflow)
 
     def stop_scrolling_entrants(self):
         if self.scroll_event:
-            self.scroll_event.cancel()
+            self.scroll_event.cancel(self.timer_screen.ids.entry_scroll)
             self.scroll_event = None
-
-    def scroll_entrants(self, dt):
-        timer_screen = self.root.get_screen('timer')
-        sv = timer_screen.ids.entry_scroll
-        grid = timer_screen.ids.entry_list
-
-        if grid.height > sv.height:
-            sv.scroll_y -= 0.0005
-
-            if sv.scroll_y <= 0:
-                sv.scroll_y = 1
-        else:
-            self.stop_scrolling_entrants()
+        if self._scroll_step_event:
+            self._scroll_step_event.cancel()
+            self._scroll_step_event = None
     
+    @timed()
     def check_scroll_necessity(self, dt):
-        timer_screen = self.root.get_screen('timer')
-        sv = timer_screen.ids.entry_scroll
-        grid = timer_screen.ids.entry_list
-        if grid.height > sv.height:
+        if self.timer_screen is None:
+            return
+        sv = self.timer_screen.ids.entry_scroll
+        grid = self.timer_screen.ids.entry_list
+        if self.root.current == 'timer' and grid.height > sv.height:
             self.start_scrolling_entrants()
         else:
             self.stop_scrolling_entrants()
 
-    def on_entrants(self, instance, value):
-        entry_grid = self.root.get_screen('timer').ids.entry_list
-        entry_grid.clear_widgets()
-        for name in value:
-            entry_grid.add_widget(Label(text=name, size_hint_y=None, height=60, font_size='24sp'))
-        Clock.schedule_once(self.check_scroll_necessity, 0.1)
+    # Entry 목록은 RecycleView의 data만 고치므로 화면에 보이는 줄만 위젯으로 만들어집니다.
+    def get_entrant_data(self):
+        return self.timer_screen.ids.entry_scroll.data
 
-    def on_players(self, instance, value):
-        self.root.get_screen('timer').ids.players_right.text = str(value)
-        self.update_ui()
+    def refresh_entrants(self):
+        if self.timer_screen is None:
+            return
+        self.timer_screen.ids.entry_scroll.data = [
+            self.entrant_view(i) for i in range(len(self.tournament.entrants))]
+        self._check_scroll_trigger()
+
+    def entrant_view(self, index):
+        # 남은 참가자는 이름 옆에 테이블-좌석을, 탈락한 참가자는 흐린 색으로 보여 줍니다.
+        registry = self.tournament.registry
+        name = self.tournament.entrants[index]
+        if registry.status[index] != ACTIVE:
+            return {'text': name, 'color': BUSTED_COLOR}
+        seat = registry.seat_label(index)
+        return {'text': f"{name}  {seat}" if seat else name, 'color': (1, 1, 1, 1)}
+
+    def confirm_bust(self, index):
+        t = self.tournament
+        if self.read_only or t.registry.status[index] != ACTIVE or t.players <= 1:
+            return
+        BustPopup(index=index, entrant=t.entrants[index]).open()
 
-    def on_total_chips(self, instance, value):
-        self.update_avr_stack()
+    def bust_entrant(self, index):
+        if not self.read_only:
+            self.tournament.bust_player(index)
 
-    def on_avr_stack(self, instance, value):
-        self.update_ui()
+    def add_entrant(self, name):
+        # 등록이므로 인원과 칩도 함께 늘어나는 add_player로 넣습니다.
+        self.tournament.add_player(name)
+
+    def remove_entrant(self, index):
+        self.tournament.remove_entrant(index)
+
+    def rename_entrant(self, index, name):
+        self.tournament.rename_entrant(index, name)
 
 if __name__ == '__main__':
     HoldemTimerApp().run()
@@ -0,0 +1,85 @@
+# 상금 분배표와 ICM(Independent Chip Model) 지분 계산입니다.
+#
+# 분배표는 참가 인원의 PAID_FRACTION만큼 입상시키고 순위 k에 1/k^PAYOUT_EXPONENT 비율로 나눕니다.
+# ICM은 칩이 많을수록 그 비율만큼 먼저 높은 순위를 가져간다고 보는(Malmuth-Harville) 모델입니다.
+# 인원이 EXACT_LIMIT 이하이면 이미 순위가 정해진 사람들의 집합(비트마스크)별 확률을 입상 순위
+# 수만큼만 차례로 쌓아 정확히 계산하고, 그보다 많으면 Efraimidis-Spirakis 가중 비복원 추출로
+# 순위를 한꺼번에 뽑는 몬테카를로로 근사합니다.
+import math
+
+PAID_FRACTION = 0.15
+PAYOUT_EXPONENT = 1.0
+PAYOUT_ROUNDING = 100
+EXACT_LIMIT = 10
+ICM_TRIALS = 20000
+
+
+def paid_places(entrants):
+    if entrants < 2:
+        return entrants
+    return max(1, min(entrants, math.ceil(entrants * PAID_FRACTION)))
+
+
+def payout_table(entrants, prize_pool, rounding=PAYOUT_ROUNDING):
+    # 1등부터의 상금 목록. 반올림하고 남은 금액은 1등에게 더합니다.
+    places = paid_places(entrants)
+    if not places or prize_pool <= 0:
+        return []
+    weights = [1 / (k ** PAYOUT_EXPONENT) for k in range(1, places + 1)]
+    total_weight = sum(weights)
+    payouts = [int(prize_pool * w / total_weight // rounding * rounding) for w in weights]
+    payouts[0] += prize_pool - sum(payouts)
+    return payouts
+
+
+def icm(stacks, payouts, trials=ICM_TRIALS, rng=None):
+    # 각 플레이어의 상금 기대값 목록을 stacks와 같은 순서로 돌려줍니다.
+    if len(stacks) <= EXACT_LIMIT:
+        return icm_exact(stacks, payouts)
+    return icm_monte_carlo(stacks, payouts, trials, rng)
+
+
+def icm_exact(stacks, payouts):
+    n = len(stacks)
+    total = sum(stacks)
+    equity = [0.0] * n
+    if total <= 0:
+        return equity
+    # layer[mask] = (mask에 든 사람들이 위 순위를 차지했을 확률, 그 사람들의 칩 합)
+    layer = {0: (1.0, 0)}
+    for prize in payouts[:n]:
+        next_layer = {}
+        for mask, (p, placed) in layer.items():
+            rest = total - placed
+            if rest <= 0:
+                continue
+            for j in range(n):
+                bit = 1 << j
+                if mask & bit or not stacks[j]:
+                    continue
+                q = p * stacks[j] / rest
+                equity[j] += q * prize
+                prev = next_layer.get(mask | bit)
+                next_layer[mask | bit] = (q + prev[0] if prev else q, placed + stacks[j])
+        layer = next_layer
+    return equity
+
+
+def icm_monte_carlo(stacks, payouts, trials=ICM_TRIALS, rng=None):
+    # 상금표만 필요한 화면에서 NumPy를 불러오지 않도록 여기서 불러옵니다.
+    import numpy as np
+
+    rng = rng or np.random.default_rng()
+    weights = np.asarray(stacks, dtype=float)
+    n = len(weights)
+    places = min(n, len(payouts))
+    if not places or weights.sum() <= 0:
+        return [0.0] * n
+    # 키 u^(1/w)가 큰 순서가 가중치 w에 비례한 비복원 추출 순서입니다. (로그를 취해 log(u)/w로 비교)
+    with np.errstate(divide='ignore'):
+        keys = np.log(rng.random((trials, n))) / weights
+    order = np.argsort(-keys, axis=1)[:, :places]
+    equity = np.zeros(n)
+    for place in range(places):
+        equity += np.bincount(order[:, place], minlength=n) * payouts[place]
+    return list(equity / trials)
@@ -0,0 +1,126 @@
+# 상시 켜 두는 표시 기기를 위한 프레임 속도 조절입니다.
+#
+# Kivy 이벤트 루프는 그릴 것이 없어도 maxfps(60)만큼 깨어나 입력을 확인합니다. 터치/키 입력이
+# IDLE_TIMEOUT초 동안 없으면 maxfps를 IDLE_FPS로 낮추고, 입력이 들어오면 바로 원래대로 올립니다.
+# 저전력 모드에서는 'interrupt' Clock이 예약된 콜백 시각에 맞춰 깨어나므로 초 경계에 맞춘 틱과
+# 다른 스레드에서 넘어온 콜백은 늦지 않고, 낮춘 fps는 입력을 확인하는 간격만 늘립니다.
+#
+# 다만 이렇게 깨어나면 0초 간격 콜백(애니메이션, 스크롤 관성)이 있는 동안 루프가 쉬지 않고 돌므로,
+# 원래 속도에서는 예약 시각을 보지 않고 기본 Clock처럼 1/maxfps마다 깨어나게 하고, 저전력 모드에서도
+# 그런 콜백이 있는 동안에는 원래 속도의 프레임 간격으로 깨어나게 합니다.
+#
+# 루프가 깨어난 횟수(Clock.frames)와 화면을 실제로 그린 횟수(창의 on_flip)를 sample()로 모아
+# 최근 RATE_WINDOW초 기준 분당 횟수로 보여 줍니다. Clock.frames_displayed는 그릴 것이 없어도
+# 루프마다 늘어나므로 쓰지 않습니다.
+import time
+from collections import deque
+
+from kivy.clock import Clock, ClockBaseInterrupt
+
+# 입력이 없을 때의 maxfps. 첫 터치에 반응하기까지 최대 1/IDLE_FPS초 걸립니다.
+IDLE_FPS = 2
+# 마지막 입력 후 저전력 모드로 내려가기까지의 시간 (초)
+IDLE_TIMEOUT = 10
+# 분당 깨어난 횟수를 계산하는 구간 (초)
+RATE_WINDOW = 60
+# 바꿔 쓰는 Clock 내부 속성. Kivy 버전이 달라 하나라도 없으면 원래 속도로만 돌립니다 (buildozer.spec에서 버전 고정).
+CLOCK_ATTRIBUTES = ('_max_fps', '_get_min_timeout_func', 'interupt_next_only', '_last_tick', 'clock_resolution')
+
+
+def no_deadline():
+    return float('inf')
+
+
+class PowerGovernor:
+
+    def __init__(self, on_mode=None, adaptive=True):
+        missing = [name for name in CLOCK_ATTRIBUTES if not hasattr(Clock, name)]
+        self.interrupt = isinstance(Clock, ClockBaseInterrupt) and not missing
+        self.full_fps = Clock._max_fps if self.interrupt else 0
+        # 시간 해상도를 정하지 않으면 maxfps로 계산하므로, fps를 낮추면 잠들어야 할 시간까지 '곧'으로 보고
+        # 쉬지 않고 돕니다. 원래 속도의 해상도로 고정해 둡니다.
+        if self.interrupt and Clock.clock_resolution < 0:
+            Clock.clock_resolution = Clock.get_resolution()
+        # 다른 Clock에서는 낮춘 fps만큼 예약된 콜백도 늦어지므로 항상 원래 속도로 둡니다.
+        self.adaptive = adaptive and self.interrupt and self.full_fps > IDLE_FPS
+        if adaptive and not self.adaptive:
+            if missing:
+                # interrupt Clock은 이미 골라졌으므로 기본 Clock으로 돌리려면 다시 켜야 합니다.
+                print(f"Warning: This Kivy clock has no {', '.join(missing)}; running at full rate "
+                      "(set HOLDEM_TIMER_POWER=full to use the default clock)")
+            else:
+                print("Warning: Adaptive frame rate needs the 'interrupt' Kivy clock; running at full rate")
+        self.on_mode = on_mode
+        self.idle = False
+        self.draws = 0
+        self._samples = deque()
+        self._relax_trigger = Clock.create_trigger(self.relax, IDLE_TIMEOUT)
+        if self.interrupt:
+            self._full_rate()
+
+    def attach(self, window):
+        window.bind(on_touch_down=self.wake, on_touch_move=self.wake, on_key_down=self.wake,
+                    on_flip=self.count_draw)
+        self.sample()
+        self.wake()
+
+    def wake(self, *args):
+        # 입력 이벤트를 가로채지 않도록 아무것도 돌려주지 않습니다.
+        if not self.adaptive:
+            return
+        self._relax_trigger.cancel()
+        self._relax_trigger()
+        if self.idle:
+            self.idle = False
+            self._full_rate()
+            if self.on_mode:
+                self.on_mode(False)
+
+    def _full_rate(self):
+        Clock._max_fps = self.full_fps
+        # 다음 프레임 전에 실행할 콜백이 새로 예약될 때만 일찍 깨어납니다 (다른 스레드의 @mainthread 등).
+        Clock.interupt_next_only = True
+        Clock._get_min_timeout_func = no_deadline
+
+    def _next_deadline(self):
+        # interrupt Clock은 예약 시각까지 남은 시간이 해상도의 두 배쯤 되면 더 자지 않고, 콜백은 해상도
+        # 안으로 들어와야 실행하므로 그 사이를 빈 루프로 돕니다. 예약 시각을 해상도만큼 늦춰 알려 주면
+        # 한 번에 예약 시각 직후까지 잡니다. 0은 매 프레임 실행할 콜백이 있다는 뜻입니다.
+        deadline = Clock.get_min_timeout()
+        if not deadline:
+            return Clock._last_tick + 1 / self.full_fps
+        return deadline + Clock.clock_resolution
+
+    def count_draw(self, *args):
+        self.draws += 1
+
+    def relax(self, dt=None):
+        if not self.adaptive or self.idle:
+            return
+        self.idle = True
+        Clock._max_fps = IDLE_FPS
+        Clock.interupt_next_only = False
+        Clock._get_min_timeout_func = self._next_deadline
+        if self.on_mode:
+            self.on_mode(True)
+
+    def sample(self):
+        now = time.perf_counter()
+        samples = self._samples
+        samples.append((now, Clock.frames, self.draws))
+        while len(samples) > 2 and samples[1][0] <= now - RATE_WINDOW:
+            samples.popleft()
+
+    def rates(self):
+        # (분당 깨어난 횟수, 분당 그린 횟수)
+        if len(self._samples) < 2:
+            return 0.0, 0.0
+        (t0, frames0, drawn0), (t1, frames1, drawn1) = self._samples[0], self._samples[-1]
+        if t1 <= t0:
+            return 0.0, 0.0
+        return (frames1 - frames0) / (t1 - t0) * 60, (drawn1 - drawn0) / (t1 - t0) * 60
+
+    def report(self):
+        wakeups, redraws = self.rates()
+        mode = 'idle' if self.idle else 'full'
+        print(f"Power: {wakeups:.0f} wakeups/min, {redraws:.0f} redraws/min ({mode} rate)")
@@ -0,0 +1,282 @@
+# 참가자 기록(상태, 테이블/좌석, 재참가 수, 탈락 시각)과 좌석 추첨, 테이블 밸런싱입니다.
+#
+# 기록은 Tournament.entrants와 같은 순서의 병렬 배열이고 위치(인덱스)가 곧 참가자 ID입니다.
+# 테이블마다 좌석 목록과 인원 수를 두고, 인원 수별 테이블 집합(_by_count)도 함께 관리해
+# 가장 많은/적은 테이블을 좌석 수만큼만 살펴보고 찾습니다.
+# 좌석 추첨은 (seed, 추첨 횟수)로 정해지는 난수를 쓰고 집합의 순회 순서에 기대지 않으므로
+# 저널을 재생하거나 스냅샷에서 되살려도 같은 자리가 나옵니다.
+import os
+from array import array
+
+SEATS_PER_TABLE = 9
+ACTIVE = 0
+BUSTED = 1
+UNSEATED = -1
+MASK64 = (1 << 64) - 1
+
+
+def _mix(seed, counter):
+    # splitmix64
+    x = (seed + counter * 0x9E3779B97F4A7C15) & MASK64
+    x = ((x ^ (x >> 30)) * 0xBF58476D1CE4E5B9) & MASK64
+    x = ((x ^ (x >> 27)) * 0x94D049BB133111EB) & MASK64
+    return x ^ (x >> 31)
+
+
+class Registry:
+
+    def __init__(self, seed=None, seats_per_table=SEATS_PER_TABLE):
+        self.seed = int.from_bytes(os.urandom(8), 'little') if seed is None else seed
+        self.draws = 0
+        self.seats_per_table = seats_per_table
+        self.status = bytearray()
+        self.table = array('q')
+        self.seat = array('q')
+        self.reentries = array('q')
+        self.bust_time = []
+        self.active = 0
+        # 테이블 번호 -> 좌석별 참가자 ID (빈 자리는 UNSEATED) / 앉은 인원
+        self.tables = {}
+        self.counts = {}
+        self._by_count = [set() for _ in range(seats_per_table + 1)]
+
+    def __len__(self):
+        return len(self.status)
+
+    def _random(self, n):
+        self.draws += 1
+        return _mix(self.seed, self.draws) % n
+
+    # 기록
+
+    def record(self, index):
+        return [self.status[index], self.table[index], self.seat[index], self.reentries[index], self.bust_time[index]]
+
+    def insert_record(self, index, record):
+        self.insert_records(index, [record])
+
+    def insert_records(self, index, records):
+        # 여러 기록을 index부터 끼워 넣습니다. 뒤쪽 ID는 한 번에 옮깁니다.
+        count = len(records)
+        if not count:
+            return
+        self._shift_ids(index, count)
+        self.status[index:index] = bytes([BUSTED]) * count
+        self.table[index:index] = array('q', [UNSEATED]) * count
+        self.seat[index:index] = array('q', [UNSEATED]) * count
+        self.reentries[index:index] = array('q', [0]) * count
+        self.bust_time[index:index] = [None] * count
+        for offset, record in enumerate(records):
+            self.set_record(index + offset, record)
+
+    def set_record(self, index, record):
+        status, table, seat, reentries, bust_time = record
+        if self.table[index] != UNSEATED:
+            self._unseat(index)
+        if self.status[index] == ACTIVE:
+            self.active -= 1
+        self.status[index] = status
+        self.reentries[index] = reentries
+        self.bust_time[index] = bust_time
+        if status == ACTIVE:
+            self.active += 1
+        if table != UNSEATED:
+            if table not in self.tables:
+                self._open_table(table)
+            self._sit(index, table, seat)
+
+    def set_records(self, records):
+        # [(ID, 기록)]을 한꺼번에 반영합니다. 먼저 모두 자리에서 일으켜 순서에 상관없이 맞게 앉히고,
+        # 그 결과 비게 된 테이블은 닫습니다.
+        left = set()
+        for index, record in records:
+            if self.table[index] != UNSEATED:
+                left.add(self.table[index])
+                self._unseat(index)
+        for index, record in records:
+            self.set_record(index, record)
+        for table in left:
+            if table in self.tables and not self.counts[table]:
+                self._close_table(table)
+
+    def delete(self, index):
+        self.delete_records(index, 1)
+
+    def delete_records(self, index, count):
+        # index부터 count개를 지우고 뒤쪽 ID는 한 번에 당깁니다.
+        end = index + count
+        left = set()
+        for i in range(index, end):
+            if self.table[i] != UNSEATED:
+                left.add(self.table[i])
+            self.set_record(i, [BUSTED, UNSEATED, UNSEATED, 0, None])
+        # 등록을 되돌려 테이블이 비면 닫습니다. 그렇지 않으면 빈 테이블이 남아 다음 좌석 추첨이 달라집니다.
+        for table in left:
+            if not self.counts[table]:
+                self._close_table(table)
+        del self.status[index:end]
+        del self.table[index:end]
+        del self.seat[index:end]
+        del self.reentries[index:end]
+        del self.bust_time[index:end]
+        self._shift_ids(end, -count)
+
+    def _shift_ids(self, start, delta):
+        # start 이상의 ID를 delta만큼 옮깁니다. 목록 중간에 넣거나 뺄 때만 쓰입니다.
+        for seats in self.tables.values():
+            for s, pid in enumerate(seats):
+                if pid >= start:
+                    seats[s] = pid + delta
+
+    def seat_label(self, index):
+        if self.table[index] == UNSEATED:
+            return ''
+        return f"T{self.table[index]}-{self.seat[index] + 1}"
+
+    # 등록 / 탈락
+
+    def add(self, reentries=0):
+        index = len(self.status)
+        self.status.append(ACTIVE)
+        self.table.append(UNSEATED)
+        self.seat.append(UNSEATED)
+        self.reentries.append(reentries)
+        self.bust_time.append(None)
+        self.active += 1
+        self._seat_at_shortest(index, open_new=True)
+        return index
+
+    def bust(self, index, time):
+        # 탈락 처리 후 자리를 맞추고, 자리가 바뀐 참가자 목록을 돌려줍니다.
+        if self.status[index] != ACTIVE:
+            return []
+        self.status[index] = BUSTED
+        self.bust_time[index] = time
+        self.active -= 1
+        if self.table[index] != UNSEATED:
+            self._unseat(index)
+        return self.balance()
+
+    def reenter(self, index):
+        if self.status[index] == ACTIVE:
+            return []
+        self.status[index] = ACTIVE
+        self.bust_time[index] = None
+        self.reentries[index] += 1
+        self.active += 1
+        self._seat_at_shortest(index, open_new=True)
+        return [index] + self.balance()
+
+    def remove(self, index):
+        # 목록에서 지웁니다(잘못 등록한 경우). 돌려주는 ID는 지운 뒤의 번호입니다.
+        self.delete(index)
+        return self.balance()
+
+    def balance(self):
+        # 필요한 테이블 수보다 많이 열려 있으면 가장 인원이 적은 테이블을 닫아 그 인원을 나머지 테이블의
+        # 빈자리에 앉히고, 테이블 간 인원 차이가 2명 이상이면 가장 많은 테이블에서 가장 적은 테이블로
+        # 한 명씩 옮깁니다. 탈락 한 번에는 보통 한 명만 옮기거나 테이블 하나만 닫게 됩니다.
+        moved = []
+        needed = -(-self.active // self.seats_per_table)
+        while len(self.tables) > needed:
+            table = self._smallest_table()
+            players = [pid for pid in self.tables[table] if pid != UNSEATED]
+            for pid in players:
+                self._unseat(pid)
+            self._close_table(table)
+            for pid in players:
+                self._seat_at_shortest(pid, open_new=False)
+                moved.append(pid)
+        while self.tables:
+            largest = self._largest_table()
+            smallest = self._smallest_table()
+            if self.counts[largest] - self.counts[smallest] <= 1:
+                break
+            occupied = [pid for pid in self.tables[largest] if pid != UNSEATED]
+            pid = occupied[self._random(len(occupied))]
+            self._unseat(pid)
+            self._sit(pid, smallest, self._random_empty_seat(smallest))
+            moved.append(pid)
+        return moved
+
+    # 테이블
+
+    def _smallest_table(self):
+        for group in self._by_count:
+            if group:
+                return min(group)
+        return None
+
+    def _largest_table(self):
+        for group in reversed(self._by_count):
+            if group:
+                return min(group)
+        return None
+
+    def _seat_at_shortest(self, index, open_new):
+        # 인원이 가장 적은 테이블들 중 하나를 뽑아 빈자리에 앉힙니다. 빈자리가 없으면 테이블을 엽니다.
+        for group in self._by_count[:-1]:
+            if group:
+                candidates = sorted(group)
+                table = candidates[self._random(len(candidates))]
+                break
+        else:
+            if not open_new:
+                raise ValueError("no open seat to move a player to")
+            table = self._open_table()
+        self._sit(index, table, self._random_empty_seat(table))
+
+    def _random_empty_seat(self, table):
+        empty = [s for s, pid in enumerate(self.tables[table]) if pid == UNSEATED]
+        return empty[self._random(len(empty))]
+
+    def _open_table(self, number=None):
+        if number is None:
+            number = 1
+            while number in self.tables:
+                number += 1
+        self.tables[number] = [UNSEATED] * self.seats_per_table
+        self.counts[number] = 0
+        self._by_count[0].add(number)
+        return number
+
+    def _close_table(self, table):
+        self._by_count[self.counts.pop(table)].discard(table)
+        del self.tables[table]
+
+    def _sit(self, index, table, seat):
+        count = self.counts[table]
+        self._by_count[count].discard(table)
+        self._by_count[count + 1].add(table)
+        self.counts[table] = count + 1
+        self.tables[table][seat] = index
+        self.table[index] = table
+        self.seat[index] = seat
+
+    def _unseat(self, index):
+        table = self.table[index]
+        count = self.counts[table]
+        self._by_count[count].discard(table)
+        self._by_count[count - 1].add(table)
+        self.counts[table] = count - 1
+        self.tables[table][self.seat[index]] = UNSEATED
+        self.table[index] = UNSEATED
+        self.seat[index] = UNSEATED
+
+    # 스냅샷
+
+    def to_state(self):
+        return {
+            'seed': self.seed,
+            'draws': self.draws,
+            'seats_per_table': self.seats_per_table,
+            'records': [self.record(i) for i in range(len(self.status))],
+        }
+
+    @classmethod
+    def from_state(cls, state):
+        registry = cls(state['seed'], state['seats_per_table'])
+        # 빈 기록에 한꺼번에 붙이므로 ID를 옮길 좌석이 없습니다.
+        registry.insert_records(0, state['records'])
+        registry.draws = state['draws']
+        return registry
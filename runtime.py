@@ -0,0 +1,77 @@
+# 한 프로세스에서 여러 토너먼트(메인 이벤트, 새틀라이트 등)를 함께 돌립니다.
+#
+# 모든 토너먼트는 같은 clock을 쓰고, 레벨 종료 시각은 힙 하나에 모아 둡니다.
+# 앱은 가장 이른 종료 시각에 한 번만 깨어나 run_due()를 부르면 되므로 토너먼트 수가 늘어도
+# 예약되는 타이머는 하나입니다. 종료 시각이 바뀌면(일시정지, 시간 조정 등) 힙에 새로 넣고
+# 이전 항목은 꺼낼 때 _deadlines와 비교해 버립니다.
+import heapq
+import itertools
+import time
+
+
+class Runtime:
+
+    def __init__(self, clock=time.monotonic, wakeup=None):
+        self.clock = clock
+        # wakeup(deadline): 가장 이른 종료 시각이 더 앞당겨졌을 때 호출됩니다.
+        self.wakeup = wakeup
+        self.events = []
+        self._heap = []
+        self._seq = itertools.count()
+        self._deadlines = {}
+        self._listeners = {}
+
+    def add(self, name, tournament):
+        tournament.set_clock(self.clock)
+        listener = lambda event, *args: self._on_tournament_event(tournament, event)
+        self._listeners[tournament] = listener
+        tournament.bind(listener)
+        self.events.append((name, tournament))
+        self._reschedule(tournament)
+        return tournament
+
+    def remove(self, tournament):
+        tournament.unbind(self._listeners.pop(tournament))
+        self._deadlines.pop(tournament, None)
+        self.events = [(name, t) for name, t in self.events if t is not tournament]
+
+    def name_of(self, tournament):
+        for name, t in self.events:
+            if t is tournament:
+                return name
+        return None
+
+    def _on_tournament_event(self, tournament, event):
+        if event == 'clock':
+            self._reschedule(tournament)
+
+    def _reschedule(self, tournament):
+        deadline = tournament.next_deadline()
+        if deadline == self._deadlines.get(tournament):
+            return
+        if deadline is None:
+            del self._deadlines[tournament]
+            return
+        self._deadlines[tournament] = deadline
+        heapq.heappush(self._heap, (deadline, next(self._seq), tournament))
+        if self.wakeup and self._heap[0][0] == deadline:
+            self.wakeup(deadline)
+
+    def next_wakeup(self):
+        heap = self._heap
+        while heap and self._deadlines.get(heap[0][2]) != heap[0][0]:
+            heapq.heappop(heap)
+        return heap[0][0] if heap else None
+
+    def run_due(self):
+        # 종료 시각이 지난 토너먼트만 tick합니다. tick이 새 종료 시각을 알리면 다시 힙에 들어갑니다.
+        now = self.clock()
+        heap = self._heap
+        while heap and heap[0][0] <= now:
+            deadline, _, tournament = heapq.heappop(heap)
+            if self._deadlines.get(tournament) != deadline:
+                continue
+            del self._deadlines[tournament]
+            tournament.tick()
+            self._reschedule(tournament)
+        return self.next_wakeup()
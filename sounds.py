@@ -0,0 +1,95 @@
+# 효과음 로딩과 재생을 맡습니다.
+# SoundLoader.load는 파일을 디코딩하느라 느리므로 백그라운드 스레드에서 불러오고, 불러온 소리는
+# 경로별 LRU 캐시에 보관해 게임을 새로 시작하거나 소리 파일을 바꿔도 다시 디코딩하지 않습니다.
+# 레벨 종료 소리는 틱을 기다리지 않고 종료 시각에 맞춰 따로 예약해 둡니다.
+import os
+import threading
+from collections import OrderedDict
+
+from kivy.clock import Clock, mainthread
+from kivy.core.audio import SoundLoader
+
+SOUND_CACHE_SIZE = 8
+
+
+class SoundBank:
+
+    def __init__(self, cache_size=SOUND_CACHE_SIZE):
+        self.cache_size = cache_size
+        self.paths = {}
+        self._cache = OrderedDict()
+        self._loading = set()
+        self._scheduled = None
+        self._scheduled_for = None
+        self._played_for = None
+
+    def assign(self, key, path):
+        self.paths[key] = path
+        self.preload(path)
+
+    def preload(self, path):
+        if not path:
+            return
+        if path in self._cache:
+            self._cache.move_to_end(path)
+            return
+        if path in self._loading:
+            return
+        if not os.path.exists(path):
+            print(f"Warning: Sound file '{path}' not found.")
+            return
+        self._loading.add(path)
+        threading.Thread(target=self._load, args=(path,), daemon=True).start()
+
+    def _load(self, path):
+        self._store(path, SoundLoader.load(path))
+
+    @mainthread
+    def _store(self, path, sound):
+        self._loading.discard(path)
+        if not sound:
+            print(f"Error: Could not load sound file '{path}'")
+            return
+        self._cache[path] = sound
+        self._cache.move_to_end(path)
+        in_use = set(self.paths.values())
+        for cached_path in list(self._cache):
+            if len(self._cache) <= self.cache_size:
+                break
+            if cached_path not in in_use:
+                self._cache.pop(cached_path).unload()
+
+    def play(self, key):
+        sound = self._cache.get(self.paths.get(key))
+        if sound:
+            sound.play()
+
+    # 경계 정렬 재생
+    # deadline(레벨이 바뀌는 시각)을 식별자로 써서, 예약된 소리와 틱에서 감지한 레벨 변경이
+    # 어느 쪽이 먼저 오든 한 번만 울리게 합니다.
+
+    def schedule(self, key, deadline, delay):
+        if self._scheduled_for == (key, deadline):
+            return
+        self.cancel()
+        self._scheduled_for = (key, deadline)
+        self._scheduled = Clock.schedule_once(lambda dt: self._play_scheduled(key, deadline), max(0, delay))
+
+    def _play_scheduled(self, key, deadline):
+        self._scheduled = None
+        self._scheduled_for = None
+        self._played_for = deadline
+        self.play(key)
+
+    def cancel(self):
+        if self._scheduled:
+            self._scheduled.cancel()
+        self._scheduled = None
+        self._scheduled_for = None
+
+    def boundary_reached(self, key, started_at):
+        if self._played_for == started_at:
+            return
+        self.cancel()
+        self._played_for = started_at
+        self.play(key)
@@ -0,0 +1,73 @@
+# 시작 스택, 예상 인원, 목표 진행 시간, 칩 단위로 블라인드 구조를 만듭니다.
+#
+# 레벨 시간 x 블라인드 상승률 x 시작 깊이(시작 스택 / 첫 빅 블라인드) 조합 수천 개를 2차원 배열로
+# 한꺼번에 펼쳐 놓고, 칩 단위로 반올림한 빅 블라인드가 종료 기준에 닿는 시간, 상승률이 고른 정도,
+# 시작 깊이를 점수로 매겨 가장 좋은 후보를 고릅니다. 결과는 설정 화면의 blind_levels 형식
+# (small/big/ante/duration(분) dict 목록)이며 앤티는 빅 블라인드 앤티로 둡니다.
+import numpy as np
+
+from tournament import STARTING_STACK
+
+DEFAULT_DENOMINATIONS = (100, 500, 1000, 5000, 25000)
+LEVEL_MINUTES = np.array([10, 12, 15, 20, 25, 30])
+GROWTH_RATES = np.linspace(1.12, 1.6, 49)
+START_DEPTHS = np.array([50, 75, 100, 125, 150, 200, 250, 300, 400])
+MAX_LEVELS = 80
+# 전체 칩이 이 BB 수 이하가 되는 레벨(헤즈업 기준 20BB씩)쯤에서 끝난다고 봅니다.
+END_DEPTH_BB = 40
+# 예상보다 길어질 때를 대비해 뒤에 더 붙이는 레벨 수
+EXTRA_LEVELS = 3
+# 레벨마다 빅 블라인드의 1/CHIP_FRACTION 이하인 칩 중 가장 큰 것을 최소 단위로 씁니다.
+CHIP_FRACTION = 4
+IDEAL_START_DEPTH = 150
+IDEAL_LEVEL_MINUTES = 15
+
+
+def round_to_chips(values, denominations):
+    # values와 같은 모양의 (반올림한 값, 쓰인 칩 단위)를 돌려줍니다.
+    denominations = np.sort(np.asarray(denominations, dtype=float))
+    slot = np.searchsorted(denominations, values / CHIP_FRACTION, side='right') - 1
+    unit = denominations[np.clip(slot, 0, len(denominations) - 1)]
+    return np.maximum(unit, np.floor(values / unit + 0.5) * unit), unit
+
+
+def generate_structure(field_size, target_seconds, denominations=DEFAULT_DENOMINATIONS,
+                       starting_stack=STARTING_STACK, break_after_levels=(), break_minutes=0):
+    minutes, growth, depth = (a.ravel() for a in np.meshgrid(LEVEL_MINUTES, GROWTH_RATES, START_DEPTHS, indexing='ij'))
+
+    # 후보마다 MAX_LEVELS개의 빅 블라인드 (후보 수 x 레벨 수)
+    raw = (starting_stack / depth)[:, None] * growth[:, None] ** np.arange(MAX_LEVELS)
+    bigs, _ = round_to_chips(raw, denominations)
+
+    # 종료 레벨과 그때까지 걸리는 시간 (브레이크 포함)
+    end_big = field_size * starting_stack / END_DEPTH_BB
+    reached = bigs >= end_big
+    end_levels = np.where(reached.any(axis=1), reached.argmax(axis=1) + 1, MAX_LEVELS + 1)
+    breaks = np.sort(np.asarray(list(break_after_levels), dtype=int))
+    break_count = np.searchsorted(breaks, end_levels, side='left')
+    length = (end_levels * minutes + break_count * break_minutes) * 60.0
+
+    # 레벨 간 상승 비율(로그)이 종료 레벨까지 얼마나 고른지. 반올림으로 안 오르는 레벨은 크게 감점합니다.
+    ratios = np.log(bigs[:, 1:] / bigs[:, :-1])
+    mask = np.arange(MAX_LEVELS - 1) < (end_levels - 1)[:, None]
+    count = np.maximum(1, mask.sum(axis=1))
+    mean = (ratios * mask).sum(axis=1) / count
+    spread = np.sqrt((((ratios - mean[:, None]) * mask) ** 2).sum(axis=1) / count)
+    stalls = ((ratios <= 0) & mask).sum(axis=1)
+
+    cost = (100 * ((length - target_seconds) / target_seconds) ** 2
+            + 10 * spread + 5 * stalls
+            + 0.5 * np.log(depth / IDEAL_START_DEPTH) ** 2
+            + 0.5 * np.log(minutes / IDEAL_LEVEL_MINUTES) ** 2)
+    cost[end_levels > MAX_LEVELS] = np.inf
+    best = int(np.argmin(cost))
+    if not np.isfinite(cost[best]):
+        return []
+
+    count = min(MAX_LEVELS, int(end_levels[best]) + EXTRA_LEVELS)
+    big = bigs[best, :count]
+    # 작은 블라인드는 같은 레벨 빅 블라인드의 칩 단위로 맞춥니다.
+    _, unit = round_to_chips(big, denominations)
+    small = np.maximum(unit, np.floor(big / 2 / unit + 0.5) * unit)
+    duration = int(minutes[best])
+    return [{'small': int(s), 'big': int(b), 'ante': int(b), 'duration': duration} for s, b in zip(small, big)]
@@ -0,0 +1,5 @@
+# 엔진 모듈은 Kivy 없이 불러올 수 있으므로 저장소 최상위를 경로에 넣고 바로 테스트합니다.
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
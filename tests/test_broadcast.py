@@ -0,0 +1,104 @@
+import json
+import time
+
+import pytest
+
+from broadcast import BroadcastServer, DisplayClient, apply_message
+from history import History
+from tournament import Tournament, VirtualClock, build_schedule, simulate
+
+LEVELS = [{'level': i, 'small': 100 * i, 'big': 200 * i, 'ante': 0, 'duration': 600} for i in range(1, 6)]
+
+
+@pytest.fixture
+def server():
+    server = BroadcastServer('127.0.0.1', 0)
+    yield server
+    server.close()
+
+
+def follow(server, t):
+    # 네트워크 스레드 대신 보내는 순간 표시 기기 쪽 토너먼트에 반영합니다. 같은 시계를 씁니다.
+    display = Tournament(t.clock)
+    kinds = []
+
+    def send(data):
+        message = json.loads(data)
+        kinds.append(message['type'])
+        apply_message(display, message)
+
+    server._send_all = send
+    server.follow(t)
+    return display, kinds
+
+
+def assert_mirrors(display, t):
+    assert display.entrants == t.entrants
+    assert [display.registry.record(i) for i in range(len(display.entrants))] == \
+        [t.registry.record(i) for i in range(len(t.entrants))]
+    for key in ('players', 'total_players', 'total_chips', 'buy_in', 'current_index', 'is_paused'):
+        assert getattr(display, key) == getattr(t, key)
+    assert display.level_remaining() == pytest.approx(t.level_remaining())
+
+
+def test_display_follows_every_change(server):
+    clock = VirtualClock()
+    t = Tournament(clock)
+    t.setup(build_schedule(LEVELS, {2}, 300))
+    t.register_batch([[f"P{i}", 1, 40000] for i in range(25)])
+    display, kinds = follow(server, t)
+    assert_mirrors(display, t)
+    history = History()
+    history.attach(t)
+    t.start()
+    simulate(t, clock, 700)
+    assert_mirrors(display, t)
+    steps = [
+        lambda: t.add_player('Late'),
+        lambda: t.bust_player(3),
+        lambda: t.bust_player(11),
+        lambda: t.reenter_player(3),
+        lambda: t.rename_entrant(0, 'Chip Leader'),
+        lambda: t.remove_entrant(5),
+        lambda: t.register_batch([[f"Q{i}", 1, 40000] for i in range(12)]),
+        lambda: t.set_buy_in(70),
+        lambda: t.pause(),
+        # 되돌리기는 여러 참가자를 한 번에 지우고 다시 넣습니다.
+        history.undo,
+        history.undo,
+        history.redo,
+    ]
+    for step in steps:
+        step()
+        assert_mirrors(display, t)
+        # 새로 접속하는 기기가 받을 서버 쪽 사본도 같습니다.
+        assert server._state['entrants'] == t.entrants
+        assert server._state['registry']['records'] == [t.registry.record(i) for i in range(len(t.entrants))]
+
+
+def test_new_snapshot_when_schedule_changes(server):
+    t = Tournament(VirtualClock())
+    t.setup(build_schedule(LEVELS, set(), 0))
+    display, kinds = follow(server, t)
+    t.setup(build_schedule(LEVELS[:2], set(), 0))
+    assert kinds == ['snapshot', 'snapshot']
+    assert len(display.schedule) == 2
+
+
+def test_client_receives_over_tcp(server):
+    t = Tournament(VirtualClock())
+    t.setup(build_schedule(LEVELS, set(), 0))
+    t.register_batch([[f"P{i}", 1, 40000] for i in range(5)])
+    server.follow(t)
+    display = Tournament(VirtualClock())
+    client = DisplayClient(display, '127.0.0.1', server.port)
+    client.start()
+    try:
+        t.bust_player(2)
+        deadline = time.monotonic() + 5
+        while display.players != 4 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert display.entrants == t.entrants
+        assert display.players == 4
+    finally:
+        client.stop()
@@ -0,0 +1,53 @@
+import numpy as np
+
+from forecast import FINAL_TABLE_SIZE, forecast_inputs, simulate
+from payouts import paid_places
+from tournament import Tournament, VirtualClock, build_schedule
+
+LEVELS = [{'level': i, 'small': 100 * i, 'big': 200 * i, 'ante': 0, 'duration': 1200} for i in range(1, 11)]
+
+
+def run(players, break_after=(2, 4)):
+    t = Tournament(VirtualClock())
+    t.setup(build_schedule(LEVELS, set(break_after), 600))
+    t.register_batch([[f"P{i}", 1, 40000] for i in range(players)])
+    inputs = forecast_inputs(t)
+    return t, simulate(inputs, 500, np.random.default_rng(1))
+
+
+def test_milestones_include_money_and_final_table():
+    t, result = run(100)
+    assert result['money'] == paid_places(100)
+    money, final_table = result['milestones'][result['money']], result['milestones'][FINAL_TABLE_SIZE]
+    # 상금권(15명)이 파이널 테이블(9명)보다 먼저이고, 둘 다 끝나기 전입니다.
+    assert money[1] <= final_table[1] <= result['finish'][1]
+    assert all(low <= mid <= high for low, mid, high in result['milestones'].values())
+
+
+def test_reached_milestones_are_left_out():
+    t = Tournament(VirtualClock())
+    t.setup(build_schedule(LEVELS, set(), 0))
+    t.register_batch([[f"P{i}", 1, 40000] for i in range(20)])
+    for index in range(17):
+        t.bust_player(index)
+    result = simulate(forecast_inputs(t), 500, np.random.default_rng(1))
+    # 20명 중 3명이 입상하므로 남은 3명은 이미 상금권이고 파이널 테이블입니다.
+    assert result['money'] == 3
+    assert result['milestones'] == {}
+
+
+def test_level_bands_skip_breaks_and_shrink():
+    t, result = run(100)
+    indices = [level[0] for level in result['levels']]
+    assert indices[:5] == [0, 1, 3, 4, 6]
+    assert not any(t.schedule.breaks[i] for i in indices)
+    medians = [mid for index, low, mid, high in result['levels']]
+    assert medians == sorted(medians, reverse=True)
+    assert all(low <= mid <= high <= 100 for index, low, mid, high in result['levels'])
+
+
+def test_nothing_to_forecast():
+    t = Tournament(VirtualClock())
+    t.setup(build_schedule(LEVELS, set(), 0))
+    t.add_player()
+    assert forecast_inputs(t) is None
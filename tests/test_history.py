@@ -0,0 +1,202 @@
+import random
+
+import pytest
+
+from history import History
+from registry import ACTIVE
+from tournament import Tournament, VirtualClock, build_schedule, simulate
+
+LEVELS = [{'level': i, 'small': 100 * i, 'big': 200 * i, 'ante': 0, 'duration': 600} for i in range(1, 6)]
+
+
+def make_tournament(players=20):
+    clock = VirtualClock()
+    t = Tournament(clock)
+    t.setup(build_schedule(LEVELS, {2}, 300))
+    t.register_batch([[f"P{i}", 1, 40000] for i in range(players)])
+    history = History()
+    history.attach(t)
+    return t, clock, history
+
+
+def state(t):
+    # 시계를 뺀 상태. 좌석 추첨 횟수(draws)는 되돌리지 않으므로 비교하지 않습니다.
+    return (list(t.entrants), [t.registry.record(i) for i in range(len(t.entrants))],
+            sorted((table, list(seats)) for table, seats in t.registry.tables.items()),
+            t.players, t.total_players, t.total_chips, t.buy_in, list(t.schedule.durations))
+
+
+def random_command(t, rng):
+    active = [i for i in range(len(t.entrants)) if t.registry.status[i] == ACTIVE]
+    busted = [i for i in range(len(t.entrants)) if t.registry.status[i] != ACTIVE]
+    choice = rng.randrange(7)
+    if choice == 0 or not t.entrants:
+        t.add_player()
+    elif choice == 1 and len(active) > 1:
+        t.bust_player(rng.choice(active))
+    elif choice == 2 and busted:
+        t.reenter_player(rng.choice(busted))
+    elif choice == 3:
+        t.rename_entrant(rng.randrange(len(t.entrants)), f"R{rng.randrange(1000)}")
+    elif choice == 4 and len(t.entrants) > 2:
+        t.remove_entrant(rng.randrange(len(t.entrants)))
+    elif choice == 5:
+        t.add_chips(rng.randrange(1, 10) * 1000)
+    else:
+        t.set_buy_in(rng.randrange(1, 10) * 10)
+
+
+def test_undo_redo_round_trip_restores_every_step():
+    t, clock, history = make_tournament()
+    rng = random.Random(7)
+    states = [state(t)]
+    for _ in range(200):
+        random_command(t, rng)
+        if state(t) != states[-1]:
+            states.append(state(t))
+    assert len(history.undo_stack) == len(states) - 1
+    for expected in reversed(states[:-1]):
+        assert history.undo() is not None
+        assert state(t) == expected
+    assert not history.can_undo()
+    for expected in states[1:]:
+        assert history.redo() is not None
+        assert state(t) == expected
+    assert not history.can_redo()
+
+
+def test_undo_registration_closes_new_table():
+    t, clock, history = make_tournament(players=9)
+    t.add_player()
+    assert len(t.registry.tables) == 2
+    history.undo()
+    assert len(t.registry.tables) == 1
+    history.redo()
+    assert len(t.registry.tables) == 2
+
+
+def test_undo_batch_registration():
+    t, clock, history = make_tournament()
+    t.bust_player(3)
+    before = state(t)
+    t.register_batch([[f"Q{i}", 1, 40000] for i in range(30)])
+    after = state(t)
+    history.undo()
+    assert state(t) == before
+    history.redo()
+    assert state(t) == after
+
+
+def test_bust_with_table_break_undoes_in_one_step():
+    t, clock, history = make_tournament(players=10)
+    before = state(t)
+    # 10명이면 두 테이블이고, 한 명이 탈락하면 한 테이블로 합쳐집니다.
+    assert len(t.registry.tables) == 2
+    t.bust_player(4)
+    assert len(t.registry.tables) == 1
+    assert history.undo() == 'bust_player'
+    assert state(t) == before
+    assert len(t.registry.tables) == 2
+
+
+def test_new_command_clears_redo():
+    t, clock, history = make_tournament()
+    t.add_chips(1000)
+    history.undo()
+    assert history.can_redo()
+    t.set_buy_in(20)
+    assert not history.can_redo()
+    assert history.redo() is None
+
+
+def test_undo_adjust_time_keeps_time_that_passed():
+    t, clock, history = make_tournament()
+    t.start()
+    simulate(t, clock, 100)
+    t.adjust_time(-200)
+    assert t.level_remaining() == pytest.approx(300)
+    simulate(t, clock, 50)
+    assert history.undo() == 'adjust_time'
+    assert t.level_remaining() == pytest.approx(450)
+    assert history.redo() == 'adjust_time'
+    assert t.level_remaining() == pytest.approx(250)
+
+
+def test_undo_next_level_returns_to_previous_level():
+    t, clock, history = make_tournament()
+    t.start()
+    simulate(t, clock, 100)
+    t.next_level()
+    assert t.current_index == 1
+    assert history.undo() == 'next_level'
+    assert t.current_index == 0
+    assert t.level_remaining() == pytest.approx(500)
+
+
+def test_clock_commands_and_ticks_are_not_recorded():
+    t, clock, history = make_tournament()
+    t.start()
+    simulate(t, clock, 1400)
+    t.pause()
+    assert t.current_index == 2
+    assert not history.can_undo()
+
+
+def test_consecutive_seeks_merge():
+    t, clock, history = make_tournament()
+    t.start()
+    simulate(t, clock, 60)
+    for value in (0.2, 0.5, 0.7):
+        t.seek(value)
+    assert len(history.undo_stack) == 1
+    assert history.undo() == 'seek'
+    assert t.level_remaining() == pytest.approx(540)
+    assert history.redo() == 'seek'
+    assert t.level_remaining() == pytest.approx(180)
+
+
+def test_separate_drags_undo_separately():
+    t, clock, history = make_tournament()
+    t.start()
+    t.seek(0.5)
+    history.seal()
+    simulate(t, clock, 200)
+    t.seek(0.9)
+    assert len(history.undo_stack) == 2
+    assert t.level_remaining() == pytest.approx(60)
+    history.undo()
+    assert t.level_remaining() == pytest.approx(100)
+    history.undo()
+    assert t.level_remaining() == pytest.approx(400)
+
+
+def test_pause_between_seeks_ends_the_merge():
+    t, clock, history = make_tournament()
+    t.start()
+    t.seek(0.5)
+    simulate(t, clock, 200)
+    t.pause()
+    t.start()
+    t.seek(0.9)
+    assert len(history.undo_stack) == 2
+
+
+def test_heads_up_durations_undo():
+    t, clock, history = make_tournament(players=3)
+    t.bust_player(0)
+    durations = list(t.schedule.durations)
+    t.set_heads_up()
+    assert list(t.schedule.durations) != durations
+    history.undo()
+    assert list(t.schedule.durations) == durations
+    assert t.players == 2
+
+
+def test_setup_and_reset_clear_history():
+    t, clock, history = make_tournament()
+    t.add_chips(1000)
+    t.setup(build_schedule(LEVELS, set(), 0))
+    assert not history.can_undo()
+    t.add_chips(1000)
+    t.reset()
+    assert not history.can_undo()
@@ -0,0 +1,81 @@
+import json
+
+from ingest import ADDON_STACK, ingest
+from tournament import STARTING_STACK, Tournament, VirtualClock
+
+
+def write(tmp_path, name, content, encoding='utf-8'):
+    path = tmp_path / name
+    if isinstance(content, str):
+        content = content.encode(encoding)
+    path.write_bytes(content)
+    return str(path)
+
+
+def run(path):
+    t = Tournament(VirtualClock())
+    registrations, errors = ingest(t, path)
+    return t, registrations, errors
+
+
+def test_csv_with_counts_and_bad_rows(tmp_path):
+    path = write(tmp_path, 'players.csv',
+                 "name,buy_ins,reentries,addons\n"
+                 "Alice,1,2,1\n"
+                 ",1,0,0\n"
+                 "Bob,,,\n"
+                 "Carol,x,0,0\n"
+                 "Dave,0,0,0\n"
+                 "Erin,1,-1,0\n", encoding='utf-8-sig')
+    t, registrations, errors = run(path)
+    assert registrations == [['Alice', 3, 3 * STARTING_STACK + ADDON_STACK], ['Bob', 1, STARTING_STACK]]
+    # 줄 번호는 머리글을 포함한 파일의 줄 번호입니다.
+    assert [number for number, error in errors] == [3, 5, 6, 7]
+    assert t.entrants == ['Alice', 'Bob']
+    assert (t.players, t.total_players) == (2, 4)
+    assert t.registry.reentries[0] == 2
+
+
+def test_cp949_csv_from_excel(tmp_path):
+    path = write(tmp_path, 'players.csv', "name,buy_ins\n김철수,1\n이영희,2\n", encoding='cp949')
+    t, registrations, errors = run(path)
+    assert errors == []
+    assert t.entrants == ['김철수', '이영희']
+
+
+def test_undecodable_file_reports_error(tmp_path):
+    path = write(tmp_path, 'players.csv', b"name\nAlice\n\xff\xff\n")
+    t, registrations, errors = run(path)
+    assert len(errors) == 1
+    assert errors[0][1].startswith('unreadable')
+
+
+def test_json_array(tmp_path):
+    path = write(tmp_path, 'players.json', json.dumps([{'name': 'Alice'}, 5, {'name': 'Bob', 'reentries': 1}]))
+    t, registrations, errors = run(path)
+    assert [r[0] for r in registrations] == ['Alice', 'Bob']
+    assert errors == [(2, 'row is not an object')]
+
+
+def test_json_that_is_not_an_array(tmp_path):
+    for content in ('5', '{"name": "Alice"}', '[{"name": '):
+        t, registrations, errors = run(write(tmp_path, 'players.json', content))
+        assert registrations == []
+        assert len(errors) == 1 and errors[0][0] == 1
+        assert t.players == 0
+
+
+def test_json_lines_skips_blank_and_broken_lines(tmp_path):
+    path = write(tmp_path, 'players.jsonl', '{"name": "Alice"}\n\n{"name": \n{"name": "Bob", "addons": 2}\n')
+    t, registrations, errors = run(path)
+    assert registrations == [['Alice', 1, STARTING_STACK], ['Bob', 1, STARTING_STACK + 2 * ADDON_STACK]]
+    assert [number for number, error in errors] == [3]
+
+
+def test_nothing_valid_registers_nothing(tmp_path):
+    events = []
+    t = Tournament(VirtualClock())
+    t.bind(lambda event, *args: events.append(event))
+    registrations, errors = ingest(t, write(tmp_path, 'players.jsonl', '{"buy_ins": 1}\n'))
+    assert registrations == []
+    assert 'command' not in events
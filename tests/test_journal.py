@@ -0,0 +1,118 @@
+import json
+
+import pytest
+
+from journal import Journal
+from tournament import Tournament, VirtualClock, build_schedule, simulate
+
+LEVELS = [{'level': i, 'small': 100 * i, 'big': 200 * i, 'ante': 0, 'duration': 600} for i in range(1, 6)]
+
+
+def start_event(directory, clock, snapshot_every=500):
+    # 시계 하나를 저널의 실제 시각과 토너먼트의 시계로 함께 씁니다.
+    t = Tournament(clock)
+    journal = Journal(directory, clock, snapshot_every)
+    journal.attach(t)
+    return t, journal
+
+
+def resume(directory, clock, snapshot_every=500):
+    t = Tournament(clock)
+    journal = Journal(directory, clock, snapshot_every)
+    resumed = journal.replay(t)
+    journal.attach(t)
+    return t, journal, resumed
+
+
+def play(t, clock):
+    t.setup(build_schedule(LEVELS, {2}, 300))
+    t.set_buy_in(50)
+    t.register_batch([[f"P{i}", 1, 40000] for i in range(30)])
+    t.start()
+    simulate(t, clock, 700)
+    for index in (3, 11, 12, 20):
+        t.bust_player(index)
+        simulate(t, clock, 45)
+    t.reenter_player(11)
+    t.rename_entrant(0, 'Chip Leader')
+    t.adjust_time(-60)
+
+
+def assert_same_state(a, b):
+    state_a, state_b = a.snapshot(), b.snapshot()
+    assert state_a.pop('level_time') == pytest.approx(state_b.pop('level_time'))
+    assert state_a.pop('total_time') == pytest.approx(state_b.pop('total_time'))
+    assert state_a == state_b
+
+
+def test_resume_after_crash_replays_flushed_commands(tmp_path):
+    clock = VirtualClock(1000.0)
+    t, journal = start_event(tmp_path, clock)
+    play(t, clock)
+    journal.flush()
+    # 닫지 않고 버립니다(강제 종료). 그동안에도 시간은 흐릅니다.
+    clock.advance(400)
+    resumed_t, resumed_journal, resumed = resume(tmp_path, clock)
+    t.tick()
+    assert resumed
+    assert not resumed_t.is_paused
+    assert_same_state(t, resumed_t)
+    assert resumed_t.current_index == 2
+
+
+def test_unflushed_commands_are_lost(tmp_path):
+    clock = VirtualClock(1000.0)
+    t, journal = start_event(tmp_path, clock)
+    play(t, clock)
+    journal.flush()
+    expected = t.snapshot()
+    t.add_chips(5000)
+    resumed_t, resumed_journal, resumed = resume(tmp_path, clock)
+    assert resumed_t.total_chips == expected['total_chips']
+
+
+def test_truncated_last_line_is_ignored(tmp_path):
+    clock = VirtualClock(1000.0)
+    t, journal = start_event(tmp_path, clock)
+    play(t, clock)
+    journal.flush()
+    with open(journal.journal_path, 'a', encoding='utf-8') as f:
+        f.write(json.dumps({'seq': journal.seq + 1, 't': clock.now, 'op': 'add_chips', 'args': [1]})[:20])
+    resumed_t, resumed_journal, resumed = resume(tmp_path, clock)
+    assert_same_state(t, resumed_t)
+
+
+def test_resume_from_snapshot_and_tail(tmp_path):
+    clock = VirtualClock(1000.0)
+    t, journal = start_event(tmp_path, clock, snapshot_every=5)
+    play(t, clock)
+    journal.flush()
+    with open(journal.journal_path, encoding='utf-8') as f:
+        tail = f.readlines()
+    # 스냅샷으로 압축된 뒤에 남은 이벤트만 저널에 있습니다.
+    assert 0 < len(tail) < 5
+    resumed_t, resumed_journal, resumed = resume(tmp_path, clock, snapshot_every=5)
+    assert_same_state(t, resumed_t)
+    assert resumed_journal.seq == journal.seq
+
+
+def test_resumed_event_keeps_journaling(tmp_path):
+    clock = VirtualClock(1000.0)
+    t, journal = start_event(tmp_path, clock)
+    play(t, clock)
+    journal.close()
+    t.unbind(journal.on_tournament_event)
+    resumed_t, resumed_journal, resumed = resume(tmp_path, clock)
+    resumed_t.bust_player(5)
+    resumed_journal.close()
+    t.bust_player(5)
+    clock.advance(1200)
+    final_t, final_journal, resumed = resume(tmp_path, clock)
+    t.tick()
+    assert_same_state(t, final_t)
+
+
+def test_empty_directory_does_not_resume(tmp_path):
+    t, journal, resumed = resume(tmp_path, VirtualClock(1000.0))
+    assert not resumed
+    assert t.players == 0
@@ -0,0 +1,75 @@
+import itertools
+import random
+
+import numpy as np
+import pytest
+
+from payouts import PAYOUT_ROUNDING, icm, icm_exact, icm_monte_carlo, paid_places, payout_table
+
+
+def harville(stacks, payouts):
+    # 모든 순위 순서를 나열해 확률을 곱하는 정의 그대로의 계산
+    n = len(stacks)
+    equity = [0.0] * n
+    for order in itertools.permutations(range(n)):
+        p, rest = 1.0, sum(stacks)
+        for pid in order:
+            p *= stacks[pid] / rest
+            rest -= stacks[pid]
+        for place, pid in enumerate(order[:len(payouts)]):
+            equity[pid] += p * payouts[place]
+    return equity
+
+
+@pytest.mark.parametrize('entrants, places', [(0, 0), (1, 1), (2, 1), (7, 2), (20, 3), (100, 15), (1000, 150)])
+def test_paid_places(entrants, places):
+    assert paid_places(entrants) == places
+
+
+@pytest.mark.parametrize('entrants', [2, 9, 45, 300])
+def test_payout_table_pays_out_the_whole_pool(entrants):
+    payouts = payout_table(entrants, 123456)
+    assert len(payouts) == paid_places(entrants)
+    assert sum(payouts) == 123456
+    assert payouts == sorted(payouts, reverse=True)
+    assert all(p % PAYOUT_ROUNDING == 0 for p in payouts[1:])
+
+
+def test_payout_table_without_pool():
+    assert payout_table(10, 0) == []
+    assert payout_table(0, 1000) == []
+
+
+@pytest.mark.parametrize('seed', range(4))
+def test_icm_exact_matches_definition(seed):
+    rng = random.Random(seed)
+    stacks = [rng.randrange(1, 100) * 1000 for _ in range(6)]
+    payouts = [500, 300, 200]
+    assert icm_exact(stacks, payouts) == pytest.approx(harville(stacks, payouts))
+
+
+def test_icm_exact_edges():
+    # 두 명이면 1등 확률은 칩 비율입니다.
+    assert icm_exact([3000, 1000], [100, 50]) == pytest.approx([87.5, 62.5])
+    assert icm_exact([5000] * 4, [600, 400]) == pytest.approx([250] * 4)
+    # 상금 순위가 인원보다 많으면 남는 상금은 나눠지지 않습니다.
+    assert sum(icm_exact([2000, 1000], [300, 200, 100])) == pytest.approx(500)
+    assert icm_exact([0, 0], [100]) == [0.0, 0.0]
+    equity = icm_exact([0, 4000, 1000], [100])
+    assert equity == pytest.approx([0, 80, 20])
+
+
+def test_monte_carlo_approximates_exact():
+    stacks = [12000, 8000, 5000, 3000, 2000, 1000, 1000, 500]
+    payouts = payout_table(60, 60000)
+    exact = icm_exact(stacks, payouts)
+    approx = icm_monte_carlo(stacks, payouts, 40000, np.random.default_rng(3))
+    assert approx == pytest.approx(exact, rel=0.05, abs=50)
+    assert sum(approx) == pytest.approx(sum(payouts[:len(stacks)]))
+
+
+def test_icm_switches_to_monte_carlo_for_large_fields():
+    stacks = [1000] * 30
+    equity = icm(stacks, payout_table(30, 30000), 2000, np.random.default_rng(1))
+    assert sum(equity) == pytest.approx(30000)
+    assert icm([], [100]) == []
@@ -0,0 +1,140 @@
+import random
+
+import pytest
+
+from registry import ACTIVE, SEATS_PER_TABLE, UNSEATED, Registry
+
+
+def check_invariants(registry, balanced=True):
+    active = [i for i in range(len(registry)) if registry.status[i] == ACTIVE]
+    assert registry.active == len(active)
+    # 남은 참가자는 모두 앉아 있고 탈락한 참가자는 자리가 없습니다.
+    for i in range(len(registry)):
+        if registry.status[i] == ACTIVE:
+            assert registry.tables[registry.table[i]][registry.seat[i]] == i
+        else:
+            assert registry.table[i] == UNSEATED and registry.seat[i] == UNSEATED
+    for table, seats in registry.tables.items():
+        seated = [pid for pid in seats if pid != UNSEATED]
+        assert registry.counts[table] == len(seated)
+        assert all(registry.table[pid] == table for pid in seated)
+        assert table in registry._by_count[len(seated)]
+    assert sum(len(group) for group in registry._by_count) == len(registry.tables)
+    # 필요한 만큼만 테이블을 열고, balance() 뒤에는 테이블 간 인원 차이가 1명 이하입니다.
+    # 등록(add)은 빈자리가 있는 가장 적은 테이블에 앉히기만 하므로 인원 차이는 보지 않습니다.
+    assert len(registry.tables) == -(-registry.active // registry.seats_per_table)
+    if balanced and registry.tables:
+        assert max(registry.counts.values()) - min(registry.counts.values()) <= 1
+
+
+def register(count, seed=1):
+    registry = Registry(seed)
+    for _ in range(count):
+        registry.add()
+        check_invariants(registry, balanced=False)
+    return registry
+
+
+@pytest.mark.parametrize('count', [1, 9, 10, 17, 18, 19, 100])
+def test_registration_opens_tables_as_needed(count):
+    registry = register(count)
+    assert len(registry.tables) == -(-count // SEATS_PER_TABLE)
+
+
+def test_busts_down_to_one_player():
+    registry = register(100)
+    rng = random.Random(3)
+    time = 0
+    while registry.active > 1:
+        active = [i for i in range(len(registry)) if registry.status[i] == ACTIVE]
+        time += 1
+        moved = registry.bust(rng.choice(active), time)
+        assert len(moved) == len(set(moved))
+        check_invariants(registry)
+    assert len(registry.tables) == 1
+
+
+def test_bust_moves_at_most_one_player_unless_table_breaks():
+    registry = register(27)
+    rng = random.Random(5)
+    for _ in range(20):
+        active = [i for i in range(len(registry)) if registry.status[i] == ACTIVE]
+        tables_before = len(registry.tables)
+        moved = registry.bust(rng.choice(active), 0)
+        if len(registry.tables) == tables_before:
+            assert len(moved) <= 1
+        check_invariants(registry)
+
+
+def test_remove_last_player_at_table_closes_it():
+    registry = register(10)
+    alone = next(i for i in range(len(registry)) if registry.counts[registry.table[i]] == 1)
+    assert registry.remove(alone) == []
+    assert len(registry.tables) == 1
+    check_invariants(registry)
+
+
+def test_bust_twice_and_reenter():
+    registry = register(20)
+    registry.bust(4, 10)
+    assert registry.bust(4, 11) == []
+    assert registry.bust_time[4] == 10
+    moved = registry.reenter(4)
+    assert moved[0] == 4
+    assert registry.reentries[4] == 1
+    assert registry.bust_time[4] is None
+    assert registry.reenter(4) == []
+    check_invariants(registry)
+
+
+def test_random_operations_keep_invariants():
+    registry = register(40)
+    rng = random.Random(11)
+    for step in range(500):
+        active = [i for i in range(len(registry)) if registry.status[i] == ACTIVE]
+        busted = [i for i in range(len(registry)) if registry.status[i] != ACTIVE]
+        choice = rng.randrange(4)
+        balanced = choice != 0
+        if choice == 0:
+            registry.add()
+        elif choice == 1 and len(active) > 1:
+            registry.bust(rng.choice(active), step)
+        elif choice == 2 and busted:
+            registry.reenter(rng.choice(busted))
+        elif choice == 3 and len(registry) > 2:
+            moved = registry.remove(rng.randrange(len(registry)))
+            assert all(0 <= pid < len(registry) for pid in moved)
+        else:
+            balanced = False
+        check_invariants(registry, balanced)
+
+
+def test_batch_insert_and_delete_match_single_records():
+    registry = register(30)
+    for index in (2, 7, 19):
+        registry.bust(index, index)
+    records = [registry.record(i) for i in range(10, 20)]
+    single = Registry.from_state(registry.to_state())
+    registry.delete_records(10, 10)
+    for _ in range(10):
+        single.delete(10)
+    assert registry.to_state() == single.to_state()
+    registry.insert_records(10, records)
+    for offset, record in enumerate(records):
+        single.insert_record(10 + offset, record)
+    assert registry.to_state() == single.to_state()
+
+
+def test_state_round_trip_draws_same_seats():
+    registry = register(30)
+    for index in (2, 7, 19):
+        registry.bust(index, index)
+    restored = Registry.from_state(registry.to_state())
+    check_invariants(restored, balanced=False)
+    assert restored.to_state() == registry.to_state()
+    # 같은 seed와 추첨 횟수에서 이어 가므로 이후 좌석도 같습니다.
+    for r in (registry, restored):
+        r.bust(0, 100)
+        r.add()
+        r.reenter(7)
+    assert restored.to_state() == registry.to_state()
@@ -0,0 +1,93 @@
+import pytest
+
+from runtime import Runtime
+from tournament import Tournament, VirtualClock, build_schedule, simulate
+
+
+def levels(seconds):
+    return [{'level': i, 'small': 100 * i, 'big': 200 * i, 'ante': 0, 'duration': seconds} for i in range(1, 30)]
+
+
+def make_runtime(durations=(600, 900, 1200)):
+    clock = VirtualClock()
+    wakeups = []
+    runtime = Runtime(clock, wakeups.append)
+    for number, seconds in enumerate(durations):
+        t = Tournament(VirtualClock())
+        t.setup(build_schedule(levels(seconds), {3}, 300))
+        runtime.add(f"Event {number}", t)
+    return runtime, clock, wakeups
+
+
+def run_until(runtime, clock, end):
+    # 앱의 타이머처럼 가장 이른 종료 시각에만 깨어납니다. 깨어난 횟수를 돌려줍니다.
+    wakeups = 0
+    deadline = runtime.next_wakeup()
+    while deadline is not None and deadline <= end:
+        clock.now = deadline
+        deadline = runtime.run_due()
+        wakeups += 1
+    clock.now = end
+    return wakeups
+
+
+def test_each_event_advances_like_a_lone_tournament():
+    runtime, clock, wakeups = make_runtime()
+    for name, t in runtime.events:
+        t.start()
+    alone = []
+    for seconds in (600, 900, 1200):
+        lone_clock = VirtualClock()
+        t = Tournament(lone_clock)
+        t.setup(build_schedule(levels(seconds), {3}, 300))
+        t.start()
+        simulate(t, lone_clock, 5000)
+        alone.append(t)
+    woken = run_until(runtime, clock, 5000)
+    for (name, t), expected in zip(runtime.events, alone):
+        assert t.current_index == expected.current_index
+        assert t.level_remaining() == pytest.approx(expected.level_remaining())
+    # 같은 시각에 끝나는 레벨은 한 번에 처리하므로 레벨 종료 횟수보다 적게 깨어납니다.
+    assert woken < sum(t.current_index for t in alone)
+
+
+def test_paused_event_leaves_the_heap():
+    runtime, clock, wakeups = make_runtime()
+    first, second = runtime.events[0][1], runtime.events[1][1]
+    assert runtime.next_wakeup() is None
+    first.start()
+    second.start()
+    assert runtime.next_wakeup() == pytest.approx(600)
+    first.pause()
+    assert runtime.next_wakeup() == pytest.approx(900)
+    run_until(runtime, clock, 1000)
+    assert (first.current_index, second.current_index) == (0, 1)
+
+
+def test_earlier_deadline_wakes_the_app():
+    runtime, clock, wakeups = make_runtime()
+    first, second = runtime.events[0][1], runtime.events[1][1]
+    second.start()
+    assert wakeups == [pytest.approx(900)]
+    first.start()
+    assert wakeups[-1] == pytest.approx(600)
+    # 더 늦어지는 변경은 앱을 깨우지 않고, 앞당기는 변경만 깨웁니다.
+    first.adjust_time(400)
+    assert len(wakeups) == 2
+    assert runtime.next_wakeup() == pytest.approx(900)
+    second.adjust_time(-500)
+    assert wakeups[-1] == pytest.approx(400)
+    assert runtime.next_wakeup() == pytest.approx(400)
+
+
+def test_removed_event_stops_ticking():
+    runtime, clock, wakeups = make_runtime()
+    removed = runtime.events[0][1]
+    for name, t in runtime.events:
+        t.start()
+    runtime.remove(removed)
+    assert runtime.name_of(removed) is None
+    assert runtime.name_of(runtime.events[0][1]) == 'Event 1'
+    assert runtime.next_wakeup() == pytest.approx(900)
+    run_until(runtime, clock, 1000)
+    assert removed.current_index == 0
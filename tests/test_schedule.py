@@ -0,0 +1,86 @@
+import random
+
+import pytest
+
+from blind_schedule import BREAK_LEVEL, Schedule
+
+
+def random_items(count, seed):
+    rng = random.Random(seed)
+    items = []
+    for i in range(count):
+        if rng.random() < 0.3:
+            items.append({'is_break': True, 'level': BREAK_LEVEL, 'duration': rng.randrange(60, 900)})
+        else:
+            items.append({'level': i + 1, 'small': 100 * (i + 1), 'big': 200 * (i + 1), 'ante': 0,
+                          'duration': rng.randrange(60, 1800)})
+    return items
+
+
+# 인덱스 없이 목록을 훑어 계산한 기대값
+def next_playable(items, index):
+    return next((i for i in range(index + 1, len(items)) if not items[i].get('is_break')), None)
+
+
+def next_break(items, index):
+    return next((i for i in range(index + 1, len(items)) if items[i].get('is_break')), None)
+
+
+def time_to_next_break(items, index, level_time):
+    end = next_break(items, index)
+    if items[index].get('is_break') or end is None:
+        return 0
+    return level_time + sum(item['duration'] for item in items[index + 1:end])
+
+
+def assert_matches(schedule, items):
+    assert schedule.to_list() == items
+    assert schedule.total_duration() == sum(item['duration'] for item in items)
+    for i in range(len(items)):
+        assert schedule.start_offset(i) == sum(item['duration'] for item in items[:i])
+        assert schedule.next_playable(i) == next_playable(items, i)
+        assert schedule.has_break_after(i) == (next_break(items, i) is not None)
+        end = next_break(items, i)
+        playable = [item for item in items[i:len(items) if end is None else end] if not item.get('is_break')]
+        assert schedule.levels_until_break(i) == len(playable)
+        assert schedule.time_to_next_break(i, 30) == time_to_next_break(items, i, 30)
+        assert schedule.time_remaining(i, 30) == 30 + sum(item['duration'] for item in items[i + 1:])
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_index_matches_linear_scan(seed):
+    items = random_items(40, seed)
+    assert_matches(Schedule(items), items)
+
+
+def test_out_of_range_queries():
+    schedule = Schedule(random_items(5, 0))
+    for index in (-1, 5):
+        assert schedule.next_playable(index) is None
+        assert not schedule.has_break_after(index)
+        assert not schedule.is_break(index)
+        assert schedule.levels_until_break(index) == 0
+        assert schedule.time_remaining(index, 30) == 0
+    empty = Schedule()
+    assert len(empty) == 0 and empty.total_duration() == 0
+
+
+def test_duration_changes_keep_offsets():
+    items = random_items(40, 7)
+    schedule = Schedule(items)
+    rng = random.Random(7)
+    for _ in range(30):
+        index = rng.randrange(len(items))
+        items[index]['duration'] = rng.randrange(60, 1800)
+        schedule.set_duration(index, items[index]['duration'])
+    assert_matches(schedule, items)
+    # 이후 일반 레벨만 바뀌고 브레이크 시간은 그대로입니다.
+    schedule.set_durations_from(10, 300)
+    for item in items[10:]:
+        if not item.get('is_break'):
+            item['duration'] = 300
+    assert_matches(schedule, items)
+    schedule.scale_durations(0.5, 20)
+    for item in items[20:]:
+        item['duration'] = round(item['duration'] * 0.5)
+    assert_matches(schedule, items)
@@ -0,0 +1,48 @@
+import numpy as np
+import pytest
+
+from structure_gen import (DEFAULT_DENOMINATIONS, END_DEPTH_BB, EXTRA_LEVELS, LEVEL_MINUTES, generate_structure,
+                           round_to_chips)
+from tournament import STARTING_STACK
+
+
+def end_level(levels, field_size):
+    end_big = field_size * STARTING_STACK / END_DEPTH_BB
+    return next(i + 1 for i, level in enumerate(levels) if level['big'] >= end_big)
+
+
+def test_round_to_chips_uses_quarter_big_blind_unit():
+    values, units = round_to_chips(np.array([150.0, 1234.0, 99999.0, 10.0]), DEFAULT_DENOMINATIONS)
+    assert list(units) == [100, 100, 5000, 100]
+    assert list(values) == [200, 1200, 100000, 100]
+
+
+@pytest.mark.parametrize('field_size, hours, breaks', [
+    (9, 2, ()), (50, 4, ()), (200, 6, (4, 8, 12)), (1000, 10, (4, 8, 12, 16)),
+])
+def test_structure_ends_near_target(field_size, hours, breaks):
+    levels = generate_structure(field_size, hours * 3600, break_after_levels=breaks, break_minutes=10)
+    end = end_level(levels, field_size)
+    assert len(levels) == end + EXTRA_LEVELS
+    duration = levels[0]['duration']
+    assert duration in LEVEL_MINUTES
+    length = end * duration + 10 * sum(1 for level in breaks if level < end)
+    assert length == pytest.approx(hours * 60, rel=0.1)
+    bigs = [level['big'] for level in levels]
+    assert all(a < b for a, b in zip(bigs, bigs[1:]))
+    for level in levels:
+        assert level['duration'] == duration and level['ante'] == level['big']
+        # 블라인드는 그 레벨 칩 단위의 배수이고 작은 블라인드는 빅 블라인드의 약 절반입니다.
+        _, unit = round_to_chips(np.array([float(level['big'])]), DEFAULT_DENOMINATIONS)
+        assert level['big'] % unit[0] == 0 and level['small'] % unit[0] == 0
+        assert level['small'] <= level['big'] <= 2 * level['small'] + unit[0]
+
+
+def test_longer_target_gives_longer_structure():
+    short = generate_structure(100, 3 * 3600)
+    long = generate_structure(100, 8 * 3600)
+    assert end_level(short, 100) * short[0]['duration'] < end_level(long, 100) * long[0]['duration']
+
+
+def test_unreachable_field_gives_nothing():
+    assert generate_structure(10 ** 18, 3600) == []
@@ -0,0 +1,138 @@
+import pytest
+
+from tournament import STARTING_STACK, Tournament, VirtualClock, build_schedule, simulate
+
+LEVELS = [
+    {'level': 1, 'small': 100, 'big': 200, 'ante': 0, 'duration': 60},
+    {'level': 2, 'small': 200, 'big': 400, 'ante': 0, 'duration': 60},
+    {'level': 3, 'small': 300, 'big': 600, 'ante': 600, 'duration': 60},
+]
+
+
+def make_tournament():
+    # 레벨 1, 2, 브레이크(30초), 레벨 3. 끝나는 시각은 60, 120, 150, 210초입니다.
+    clock = VirtualClock()
+    t = Tournament(clock)
+    t.setup(build_schedule(LEVELS, {2}, 30))
+    events = []
+    t.bind(lambda event, *args: events.append((event,) + args))
+    return t, clock, events
+
+
+def level_changes(events):
+    return [(new['level'], started_at) for event, prev, new, advanced, started_at in
+            (e for e in events if e[0] == 'level')]
+
+
+def test_build_schedule_skips_break_after_last_level():
+    schedule = build_schedule(LEVELS, {2, 3}, 30)
+    assert [item['level'] for item in schedule] == [1, 2, 'Break', 3]
+
+
+def test_simulate_enters_break_and_keeps_level_boundaries():
+    t, clock, events = make_tournament()
+    t.start()
+    simulate(t, clock, 130)
+    assert t.current_index == 2
+    assert t.current_item()['is_break']
+    assert t.level_remaining() == pytest.approx(20)
+    assert t.total_elapsed() == pytest.approx(130)
+    # 틱 사이에 레벨 여러 개가 지나도 다음 레벨은 이전 종료 시각부터 셉니다.
+    assert level_changes(events) == [(2, 60), ('Break', 120)]
+
+
+def test_big_blind_during_break_is_previous_level():
+    t, clock, events = make_tournament()
+    t.start()
+    simulate(t, clock, 125)
+    assert t.current_big_blind() == 400
+    assert t.next_blinds()['level'] == 3
+
+
+def test_simulate_stops_at_final_level():
+    t, clock, events = make_tournament()
+    t.start()
+    simulate(t, clock, 1000)
+    assert clock.now == 1000
+    assert t.is_paused
+    assert t.current_index == 3
+    assert t.level_remaining() == 0
+    # 마지막 레벨이 끝난 시각에서 멈추고 그 뒤로 흐른 시간은 세지 않습니다.
+    assert t.total_elapsed() == pytest.approx(210)
+    assert [e for e in events if e[0] == 'finished'] == [('finished',)]
+    assert level_changes(events) == [(2, 60), ('Break', 120), (3, 150)]
+
+
+def test_simulate_in_steps_matches_single_jump():
+    t, clock, events = make_tournament()
+    t.start()
+    for _ in range(35):
+        simulate(t, clock, 7)
+    single, single_clock, single_events = make_tournament()
+    single.start()
+    simulate(single, single_clock, 245)
+    assert t.current_index == single.current_index
+    assert t.total_elapsed() == pytest.approx(single.total_elapsed())
+    assert level_changes(events) == level_changes(single_events)
+
+
+def test_pause_freezes_clock():
+    t, clock, events = make_tournament()
+    t.start()
+    simulate(t, clock, 30)
+    t.pause()
+    simulate(t, clock, 500)
+    assert t.current_index == 0
+    assert t.level_remaining() == pytest.approx(30)
+    t.start()
+    simulate(t, clock, 40)
+    assert t.current_index == 1
+    assert t.level_remaining() == pytest.approx(50)
+
+
+def registered(count):
+    t = Tournament(VirtualClock())
+    t.setup(build_schedule(LEVELS, set(), 0))
+    for _ in range(count):
+        t.add_player()
+    return t
+
+
+def assert_players_match_registry(t):
+    assert t.players == t.registry.active
+    assert len(t.entrants) == len(t.registry)
+
+
+def test_heads_up_needs_two_remaining_players():
+    t = registered(20)
+    durations = list(t.schedule.durations)
+    t.set_heads_up()
+    assert list(t.schedule.durations) == durations
+    for index in range(18):
+        t.bust_player(index)
+    t.set_heads_up()
+    assert list(t.schedule.durations) != durations
+    assert_players_match_registry(t)
+
+
+def test_remove_entrant_takes_back_registration():
+    t = registered(5)
+    t.bust_player(1)
+    t.reenter_player(1)
+    t.remove_entrant(1)
+    assert_players_match_registry(t)
+    assert (t.players, t.total_players, t.total_chips) == (4, 4, 4 * STARTING_STACK)
+    t.bust_player(2)
+    t.remove_entrant(2)
+    assert_players_match_registry(t)
+    assert (t.players, t.total_players, t.total_chips) == (3, 3, 3 * STARTING_STACK)
+
+
+def test_remove_player_undoes_last_registration():
+    t = registered(5)
+    t.remove_player()
+    assert t.entrants == [f"Guest_{i}" for i in range(1, 5)]
+    # 아무도 탈락 처리되지 않습니다.
+    assert all(t.registry.bust_time[i] is None for i in range(4))
+    assert_players_match_registry(t)
+    assert t.total_players == 4
@@ -0,0 +1,112 @@
+# 인원, 칩, 평균 스택(과 BB 환산)이 시간에 따라 어떻게 바뀌었는지 고정된 메모리 안에 기록합니다.
+#
+# 해상도가 다른 링 버퍼(Tier)를 여러 개 두고 모든 샘플을 각 단계에 넣습니다. 가장 촘촘한 단계는
+# 바뀔 때마다 한 칸씩 쓰고, 거친 단계는 구간(초)마다 마지막 값 하나만 남깁니다. 인원/칩은 바뀐 뒤
+# 다음 변화까지 유지되는 값이라 구간의 마지막 값이면 충분합니다. 기본 설정은 최근 변화 1024개,
+# 1분 단위 1024칸(약 17시간), 10분 단위 1024칸(약 7일)이고 토너먼트 하나에 약 120KB입니다.
+# 시간 축은 토너먼트 경과 시간(total_elapsed)이라 일시정지 중에는 흐르지 않습니다.
+from array import array
+
+FIELDS = ('elapsed', 'players', 'total_chips', 'avr_stack', 'big_blind')
+# (구간 길이(초), 칸 수). 구간 길이 0은 모든 샘플을 남깁니다.
+TIERS = ((0, 1024), (60, 1024), (600, 1024))
+
+
+class Tier:
+
+    def __init__(self, bucket_seconds, capacity):
+        self.bucket_seconds = bucket_seconds
+        self.capacity = capacity
+        self.columns = [array('d', bytes(8 * capacity)) for _ in FIELDS]
+        # 지금까지 쓴 칸 수 (덮어쓴 칸 포함하지 않음)
+        self.count = 0
+
+    def __len__(self):
+        return min(self.count, self.capacity)
+
+    def covers_all(self):
+        return self.count <= self.capacity
+
+    def add(self, sample):
+        # 마지막 칸과 같은 구간이면 그 칸을 덮어쓰고 False를 돌려줍니다.
+        slot = self.count % self.capacity
+        appended = True
+        if self.count and self.bucket_seconds:
+            last = (self.count - 1) % self.capacity
+            if sample[0] // self.bucket_seconds == self.columns[0][last] // self.bucket_seconds:
+                slot = last
+                appended = False
+        for column, value in zip(self.columns, sample):
+            column[slot] = value
+        if appended:
+            self.count += 1
+        return appended
+
+    def get(self, position, field):
+        # position은 남아 있는 것 중 가장 오래된 칸을 0으로 센 순서입니다.
+        start = self.count - len(self)
+        return self.columns[FIELDS.index(field)][(start + position) % self.capacity]
+
+    def points(self, field, start=0):
+        # [(경과 시간, 값)]. field는 FIELDS이거나 'avr_stack_bb', 'total_chips_bb'입니다.
+        first = self.count - len(self)
+        elapsed = self.columns[0]
+        if field.endswith('_bb'):
+            values = self.columns[FIELDS.index(field[:-3])]
+            bigs = self.columns[FIELDS.index('big_blind')]
+        else:
+            values = self.columns[FIELDS.index(field)]
+            bigs = None
+        result = []
+        for position in range(start, len(self)):
+            slot = (first + position) % self.capacity
+            value = values[slot]
+            if bigs is not None:
+                value = value / bigs[slot] if bigs[slot] else 0.0
+            result.append((elapsed[slot], value))
+        return result
+
+
+class TimeSeries:
+
+    def __init__(self, tiers=TIERS):
+        self.tiers = [Tier(bucket_seconds, capacity) for bucket_seconds, capacity in tiers]
+        self.tournament = None
+        self._last = None
+
+    def attach(self, tournament):
+        self.tournament = tournament
+        tournament.bind(self.on_tournament_event)
+        self.sample()
+
+    def on_tournament_event(self, event, *args):
+        if event in ('stats', 'level', 'schedule'):
+            self.sample()
+        elif event == 'entrants_reset':
+            # 초기화되거나 스냅샷에서 되살아난 경우
+            self.clear()
+            self.sample()
+
+    def sample(self):
+        t = self.tournament
+        self.record(t.total_elapsed(), t.players, t.total_chips, t.avr_stack, t.current_big_blind())
+
+    def record(self, elapsed, players, total_chips, avr_stack, big_blind):
+        values = (players, total_chips, avr_stack, big_blind)
+        if values == self._last:
+            return
+        self._last = values
+        sample = (elapsed,) + values
+        for tier in self.tiers:
+            tier.add(sample)
+
+    def clear(self):
+        self.tiers = [Tier(tier.bucket_seconds, tier.capacity) for tier in self.tiers]
+        self._last = None
+
+    def chart_tier(self):
+        # 처음부터 지금까지를 모두 담고 있는 가장 촘촘한 단계. 없으면 가장 거친 단계입니다.
+        for tier in self.tiers:
+            if tier.covers_all():
+                return tier
+        return self.tiers[-1]
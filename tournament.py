@@ -0,0 +1,514 @@
+# 토너먼트의 시계, 블라인드 스케줄, 인원/칩 상태를 Kivy 없이 관리하는 엔진입니다.
+# 시간은 주입받은 clock 함수(기본 time.monotonic)로만 읽기 때문에 VirtualClock을 넣으면
+# 창 없이도 긴 토너먼트를 순식간에 돌려 볼 수 있습니다.
+import math
+import time
+from functools import wraps
+
+from blind_schedule import Schedule
+from registry import ACTIVE, Registry
+
+STARTING_STACK = 40000
+DEFAULT_LEVEL_DURATION = 600
+HEADS_UP_LEVEL_DURATION = 300
+
+
+def parse_blind_structure(text):
+    # 'small/big/ante/duration(분)' 형식의 줄들을 레벨 목록으로 바꿉니다.
+    levels = []
+    for i, line in enumerate(text.strip().split('\n')):
+        try:
+            small, big, ante, duration = (int(x.replace(',', '')) for x in line.split('/'))
+        except ValueError:
+            print(f"Skipping invalid blind format in row {i+1}")
+            continue
+        levels.append({'small': small, 'big': big, 'ante': ante, 'duration': duration})
+    return levels
+
+
+def build_schedule(levels, break_after_levels, break_duration):
+    # Tournament.setup에 넘기는 dict 목록을 만듭니다. 저널에도 이 형식 그대로 기록됩니다.
+    schedule = []
+    for i, level_info in enumerate(levels):
+        schedule.append(level_info)
+        if level_info['level'] in break_after_levels and i < len(levels) - 1:
+            schedule.append({'is_break': True, 'level': 'Break', 'duration': break_duration})
+    return schedule
+
+
+class VirtualClock:
+
+    def __init__(self, now=0.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, seconds):
+        self.now += seconds
+
+
+def simulate(tournament, clock, seconds):
+    # 가상 시계를 레벨 종료 시각 단위로 건너뛰므로 반복 횟수는 경과한 레벨 수에 비례합니다.
+    end = clock.now + seconds
+    while not tournament.is_paused and clock.now < end:
+        clock.now = min(end, tournament.next_deadline())
+        tournament.tick()
+    clock.now = end
+
+
+def command(func):
+    # 상태를 바꾸는 공개 메서드입니다. 가장 바깥쪽 호출만 'command' 이벤트로 알려
+    # 저널이 그대로 다시 실행(재생)할 수 있게 합니다.
+    name = func.__name__
+
+    @wraps(func)
+    def wrapper(self, *args):
+        self._command_depth += 1
+        try:
+            result = func(self, *args)
+        finally:
+            self._command_depth -= 1
+        if not self._command_depth:
+            self.notify('command', name, args)
+        return result
+    return wrapper
+
+
+class Tournament:
+    # 상태가 바뀔 때마다 listener(event, *args)를 호출합니다.
+    #   'clock'                         남은/경과 시간이나 일시정지 상태가 바뀜
+    #   'level', prev, new, advanced, started_at
+    #                                   현재 레벨이 바뀜 (advanced: 다음 레벨로 넘어간 경우,
+    #                                   started_at: 새 레벨이 시작된 clock 시각. 시간이 다 돼 넘어갔다면
+    #                                   직전 next_deadline()과 같은 값)
+    #   'schedule'                      스케줄 전체가 새로 설정되거나 초기화됨 (헤즈업으로 레벨 시간이 바뀐 경우 포함)
+    #   'stats'                         인원/칩이 바뀜
+    #   'finished'                      마지막 레벨이 끝남
+    #   'entrant_added', index, name / 'entrants_added', index, names (index부터 여러 명) /
+    #   'entrant_removed', index /
+    #   'entrant_renamed', index, name / 'entrants_reset' (목록 전체를 다시 읽어야 함)
+    #   'players_changed', indices     참가자의 상태나 테이블/좌석이 바뀜 (탈락, 재참가, 밸런싱 이동)
+    #   'command', name, args           @command 메서드가 실행됨
+
+    def __init__(self, clock=time.monotonic):
+        self.clock = clock
+        self.listeners = []
+        self._command_depth = 0
+        self.reset()
+
+    def bind(self, listener):
+        self.listeners.append(listener)
+
+    def unbind(self, listener):
+        self.listeners.remove(listener)
+
+    def notify(self, event, *args):
+        for listener in self.listeners:
+            listener(event, *args)
+
+    @property
+    def in_command(self):
+        return self._command_depth > 0
+
+    @command
+    def reset(self):
+        self.schedule = Schedule()
+        self.current_index = 0
+        self.level_time = 0
+        self.total_time = 0
+        self.is_paused = True
+        # 진행 중일 때의 기준 시각(clock 기준). 일시정지 중에는 None입니다.
+        self._level_ends_at = None
+        self._started_at = None
+        self.players = 0
+        self.total_players = 0
+        self.total_chips = 0
+        self.buy_in = 0
+        self.entrants = []
+        self.registry = Registry()
+        self.notify('entrants_reset')
+        self.notify('schedule')
+        self.notify('stats')
+        self.notify('clock')
+
+    def snapshot(self):
+        return {
+            'schedule': self.schedule.to_list(),
+            'current_index': self.current_index,
+            'level_time': self.level_remaining(),
+            'total_time': self.total_elapsed(),
+            'is_paused': self.is_paused,
+            'players': self.players,
+            'total_players': self.total_players,
+            'total_chips': self.total_chips,
+            'buy_in': self.buy_in,
+            'entrants': list(self.entrants),
+            'registry': self.registry.to_state(),
+        }
+
+    def restore(self, state):
+        self.schedule = Schedule(state['schedule'])
+        self.current_index = state['current_index']
+        self.level_time = state['level_time']
+        self.total_time = state['total_time']
+        self.is_paused = state['is_paused']
+        self._level_ends_at = None
+        self._started_at = None
+        if not self.is_paused:
+            now = self.clock()
+            self._level_ends_at = now + self.level_time
+            self._started_at = now - self.total_time
+        self.players = state['players']
+        self.total_players = state['total_players']
+        self.total_chips = state['total_chips']
+        self.buy_in = state.get('buy_in', 0)
+        self.entrants = list(state['entrants'])
+        if 'registry' in state:
+            self.registry = Registry.from_state(state['registry'])
+        else:
+            self.registry = Registry()
+            for _ in self.entrants:
+                self.registry.add()
+        self.notify('entrants_reset')
+        self.notify('schedule')
+        self.notify('stats')
+        self.notify('clock')
+
+    def set_clock(self, clock):
+        # 진행 중인 기준 시각을 새 시계 기준으로 옮깁니다.
+        offset = clock() - self.clock()
+        if self._level_ends_at is not None:
+            self._level_ends_at += offset
+            self._started_at += offset
+        self.clock = clock
+
+    @command
+    def setup(self, schedule):
+        self.schedule = Schedule(schedule)
+        self.current_index = 0
+        self.level_time = self.current_duration()
+        self._anchor_level()
+        self.notify('schedule')
+        self.notify('clock')
+
+    # 시계
+
+    @command
+    def start(self):
+        now = self.clock()
+        self.is_paused = False
+        self._level_ends_at = now + self.level_time
+        self._started_at = now - self.total_time
+        self.notify('clock')
+
+    @command
+    def pause(self):
+        self.sync()
+        self.is_paused = True
+        self._level_ends_at = None
+        self._started_at = None
+        self.notify('clock')
+
+    @command
+    def toggle_pause(self):
+        if self.is_paused:
+            self.start()
+        else:
+            self.pause()
+
+    def set_anchor(self, index, level_remaining, total_elapsed, is_paused):
+        # 방송 표시 기기에서 서버가 보낸 기준값으로 시계를 맞춥니다. 명령이 아니므로 저널에 남지 않습니다.
+        now = self.clock()
+        if index != self.current_index and index < len(self.schedule):
+            self._enter_level(index, now, index > self.current_index)
+        self.level_time = level_remaining
+        self.total_time = total_elapsed
+        self.is_paused = is_paused
+        if is_paused:
+            self._level_ends_at = None
+            self._started_at = None
+        else:
+            self._level_ends_at = now + level_remaining
+            self._started_at = now - total_elapsed
+        self.notify('clock')
+
+    def sync(self):
+        # 틱 사이에도 기준 시각으로부터 현재 남은 시간/경과 시간을 다시 계산합니다.
+        if self._level_ends_at is None:
+            return
+        now = self.clock()
+        self.level_time = self._level_ends_at - now
+        self.total_time = now - self._started_at
+
+    def _anchor_level(self):
+        if self._level_ends_at is not None:
+            self._level_ends_at = self.clock() + self.level_time
+
+    def tick(self):
+        if self.is_paused:
+            return
+        now = self.clock()
+        # 레벨 종료 시각을 지났다면 다음 레벨의 종료 시각은 이전 종료 시각을 기준으로 잡습니다.
+        while now >= self._level_ends_at:
+            if self.current_index >= len(self.schedule) - 1:
+                self.total_time = self._level_ends_at - self._started_at
+                self.level_time = 0
+                self.is_paused = True
+                self._level_ends_at = None
+                self._started_at = None
+                self.notify('clock')
+                self.notify('finished')
+                return
+            self._enter_level(self.current_index + 1, self._level_ends_at, True)
+        self.level_time = self._level_ends_at - now
+        self.total_time = now - self._started_at
+        self.notify('clock')
+
+    def next_deadline(self):
+        return self._level_ends_at
+
+    def next_tick_delay(self):
+        # 화면의 초 표시가 바뀌는 시점까지 남은 시간
+        remaining = self.level_remaining()
+        if remaining <= 0:
+            return 0
+        return (remaining - math.floor(remaining)) or 1
+
+    def level_remaining(self):
+        if self._level_ends_at is None:
+            return self.level_time
+        return self._level_ends_at - self.clock()
+
+    def total_elapsed(self):
+        if self._started_at is None:
+            return self.total_time
+        return self.clock() - self._started_at
+
+    def time_to_next_break(self):
+        return self.schedule.time_to_next_break(self.current_index, self.level_remaining())
+
+    def time_remaining(self):
+        return self.schedule.time_remaining(self.current_index, self.level_remaining())
+
+    # 레벨 이동
+
+    def _enter_level(self, index, started_at, advanced):
+        prev_item = self.current_item()
+        self.current_index = index
+        new_item = self.current_item()
+        self.level_time = self.schedule.durations[index]
+        if self._level_ends_at is not None:
+            self._level_ends_at = started_at + self.level_time
+        self.notify('level', prev_item, new_item, advanced, started_at)
+
+    @command
+    def next_level(self):
+        self.sync()
+        if self.current_index < len(self.schedule) - 1:
+            self._enter_level(self.current_index + 1, self.clock(), True)
+            self.notify('clock')
+        else:
+            self.pause()
+
+    @command
+    def prev_level(self):
+        self.sync()
+        if self.current_index > 0:
+            self._enter_level(self.current_index - 1, self.clock(), False)
+            self.notify('clock')
+
+    @command
+    def adjust_time(self, seconds):
+        self.sync()
+        self.level_time = max(0, self.level_time + seconds)
+        self._anchor_level()
+        self.notify('clock')
+
+    @command
+    def seek(self, value):
+        self.sync()
+        duration = self.current_duration()
+        self.level_time = duration * (1 - value)
+        self._anchor_level()
+        self.notify('clock')
+
+    def current_item(self):
+        if not self.schedule or self.current_index >= len(self.schedule):
+            return {'level': 1, 'small': 0, 'big': 0, 'ante': 0, 'duration': DEFAULT_LEVEL_DURATION}
+        return self.schedule.item(self.current_index)
+
+    def current_duration(self):
+        if self.current_index >= len(self.schedule):
+            return DEFAULT_LEVEL_DURATION
+        return self.schedule.durations[self.current_index]
+
+    def next_blinds(self):
+        next_index = self.schedule.next_playable(self.current_index)
+        if next_index is None:
+            return None
+        return self.schedule.item(next_index)
+
+    def current_big_blind(self):
+        # 브레이크 중에는 직전 레벨의 빅 블라인드를 기준으로 합니다.
+        index = self.current_index
+        if index >= len(self.schedule):
+            return 0
+        if self.schedule.breaks[index]:
+            return self.schedule.bigs[index - 1] if index > 0 else 0
+        return self.schedule.bigs[index]
+
+    # 인원 / 칩
+
+    @property
+    def avr_stack(self):
+        if self.players > 0:
+            return math.ceil(self.total_chips / self.players)
+        return 0
+
+    @property
+    def prize_pool(self):
+        return self.total_players * self.buy_in
+
+    @command
+    def set_buy_in(self, amount):
+        self.buy_in = amount
+        self.notify('stats')
+
+    @command
+    def add_player(self, name=None):
+        self.players += 1
+        self.total_players += 1
+        self.total_chips += STARTING_STACK
+        self.add_entrant(name or f"Guest_{self.total_players}")
+        self.notify('stats')
+
+    @command
+    def remove_player(self):
+        # add_player('+')를 되돌려 가장 나중에 등록한 참가자를 지웁니다. 누가 탈락했는지는 알 수 없으므로
+        # 아무나 탈락 처리하지 않고, 탈락은 bust_player(Entry 목록에서 이름 누르기)로만 합니다.
+        if self.entrants:
+            self.remove_entrant(len(self.entrants) - 1)
+
+    @command
+    def bust_player(self, index):
+        if self.players <= 1 or self.registry.status[index] != ACTIVE:
+            return
+        self.players -= 1
+        moved = self.registry.bust(index, self.total_elapsed())
+        self.notify('players_changed', [index] + moved)
+        self.notify('stats')
+
+    @command
+    def reenter_player(self, index):
+        if self.registry.status[index] == ACTIVE:
+            return
+        self.players += 1
+        self.total_players += 1
+        self.total_chips += STARTING_STACK
+        self.notify('players_changed', self.registry.reenter(index))
+        self.notify('stats')
+
+    @command
+    def add_chips(self, amount):
+        self.total_chips += amount
+        self.notify('stats')
+
+    @command
+    def set_heads_up(self):
+        # 인원은 등록 기록(registry)을 따르므로 여기서 바꾸지 않고, 실제로 두 명만 남았을 때만 씁니다.
+        if self.registry.active != 2:
+            return
+        self.schedule.set_durations_from(self.current_index + 1, HEADS_UP_LEVEL_DURATION)
+        self.notify('schedule')
+        self.notify('stats')
+        self.notify('clock')
+
+    @command
+    def register_batch(self, registrations):
+        # [이름, 참가 횟수, 칩] 목록을 한 번에 등록하고 알림도 묶어서 한 번씩만 보냅니다.
+        start = len(self.entrants)
+        names = []
+        for name, entries, chips in registrations:
+            self.players += 1
+            self.total_players += entries
+            self.total_chips += chips
+            names.append(name)
+            self.registry.add(entries - 1)
+        self.entrants.extend(names)
+        self.notify('entrants_added', start, names)
+        self.notify('stats')
+
+    @command
+    def add_entrant(self, name):
+        self.entrants.append(name)
+        self.registry.add()
+        self.notify('entrant_added', len(self.entrants) - 1, name)
+
+    @command
+    def remove_entrant(self, index):
+        # 잘못 등록한 참가자를 지웁니다. 그 등록으로 늘어난 인원, 참가 수, 칩도 함께 뺍니다.
+        # 칩은 참가마다 STARTING_STACK으로 셉니다 (가져오기로 받은 애드온 칩은 참가자별로 남아 있지 않습니다).
+        entries = 1 + self.registry.reentries[index]
+        if self.registry.status[index] == ACTIVE:
+            self.players -= 1
+        self.total_players = max(0, self.total_players - entries)
+        self.total_chips = max(0, self.total_chips - entries * STARTING_STACK)
+        del self.entrants[index]
+        moved = self.registry.remove(index)
+        self.notify('entrant_removed', index)
+        if moved:
+            self.notify('players_changed', moved)
+        self.notify('stats')
+
+    @command
+    def rename_entrant(self, index, name):
+        self.entrants[index] = name
+        self.notify('entrant_renamed', index, name)
+
+    # 되돌리기
+
+    @command
+    def apply_changes(self, changes):
+        # history.History가 만든 변경 목록을 순서대로 적용합니다. 인자가 값 그대로라 저널 재생도 같습니다.
+        #   ['insert', index, names, records] / ['delete', index, count] /
+        #   ['set', [[index, name, record], ...]] / ['durations', [[index, seconds], ...]] /
+        #   ['stats', players, total_players, total_chips, buy_in] / ['level', index, level_remaining]
+        for change in changes:
+            kind = change[0]
+            if kind == 'insert':
+                _, index, names, records = change
+                self.entrants[index:index] = names
+                self.registry.insert_records(index, records)
+                if len(names) == 1:
+                    self.notify('entrant_added', index, names[0])
+                else:
+                    self.notify('entrants_added', index, names)
+            elif kind == 'delete':
+                _, index, count = change
+                del self.entrants[index:index + count]
+                self.registry.delete_records(index, count)
+                for _ in range(count):
+                    self.notify('entrant_removed', index)
+            elif kind == 'set':
+                for index, name, record in change[1]:
+                    if self.entrants[index] != name:
+                        self.entrants[index] = name
+                        self.notify('entrant_renamed', index, name)
+                self.registry.set_records([(index, record) for index, name, record in change[1]])
+                self.notify('players_changed', [index for index, name, record in change[1]])
+            elif kind == 'durations':
+                for index, seconds in change[1]:
+                    self.schedule.set_duration(index, seconds)
+                self.notify('schedule')
+            elif kind == 'stats':
+                _, self.players, self.total_players, self.total_chips, self.buy_in = change
+                self.notify('stats')
+            elif kind == 'level':
+                _, index, level_remaining = change
+                self.sync()
+                if index != self.current_index:
+                    self._enter_level(index, self.clock(), False)
+                self.level_time = level_remaining
+                self._anchor_level()
+                self.notify('clock')